@@ -13,6 +13,19 @@ class AbstractPanel(QDockWidget):
     panel_activated = Signal(str)  # Emitted when panel becomes active
     panel_deactivated = Signal(str)  # Emitted when panel becomes inactive
     
+    # Dock areas and features shared by every panel, combined once at class load
+    _ALLOWED_AREAS = (
+        Qt.DockWidgetArea.LeftDockWidgetArea | 
+        Qt.DockWidgetArea.RightDockWidgetArea | 
+        Qt.DockWidgetArea.TopDockWidgetArea | 
+        Qt.DockWidgetArea.BottomDockWidgetArea
+    )
+    _FEATURES = (
+        QDockWidget.DockWidgetFeature.DockWidgetMovable |
+        QDockWidget.DockWidgetFeature.DockWidgetFloatable |
+        QDockWidget.DockWidgetFeature.DockWidgetClosable
+    )
+    
     def __init__(self, title: str, parent=None):
         """Initialize the abstract panel.
         
@@ -28,19 +41,10 @@ class AbstractPanel(QDockWidget):
     def _setup_panel(self):
         """Set up the panel properties."""
         # Allow the panel to be docked on any side
-        self.setAllowedAreas(
-            Qt.DockWidgetArea.LeftDockWidgetArea | 
-            Qt.DockWidgetArea.RightDockWidgetArea | 
-            Qt.DockWidgetArea.TopDockWidgetArea | 
-            Qt.DockWidgetArea.BottomDockWidgetArea
-        )
+        self.setAllowedAreas(self._ALLOWED_AREAS)
         
         # Enable floating
-        self.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable |
-            QDockWidget.DockWidgetFeature.DockWidgetFloatable |
-            QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
+        self.setFeatures(self._FEATURES)
         
     def set_panel_id(self, panel_id: str):
         """Set the unique panel ID.
@@ -65,6 +69,18 @@ class AbstractPanel(QDockWidget):
         self.activateWindow()
         self.panel_activated.emit(self.panel_id or "unknown")
         
+    def toggle_view(self, visible: bool):
+        """Show or hide the panel.
+        
+        Does nothing if the panel is already in the requested state, so no
+        dock layout pass is triggered for a redundant change.
+        
+        Args:
+            visible: Whether the panel should be visible
+        """
+        if visible == self.isHidden():
+            self.setVisible(visible)
+            
     def deactivate_panel(self):
         """Deactivate the panel."""
         self.panel_deactivated.emit(self.panel_id or "unknown")
@@ -3,11 +3,270 @@ Database Manager - Handles database operations and schema management.
 """
 
 import os
+import json
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Any, Dict, List, Union
+from contextlib import contextmanager
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Tuple, Union
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from .lg import lg
+
+
+_log = lg.get_logger("db")
+
+
+# Connection-time PRAGMA profiles, applied once in initialize()
+PRAGMA_PROFILES: Dict[str, str] = {
+    # WAL lets readers run alongside the writer; NORMAL sync is safe in WAL mode
+    "high_performance": """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-20000;
+        PRAGMA foreign_keys=ON;
+        PRAGMA busy_timeout=5000;
+    """,
+    # Keep WAL but avoid large page cache and memory mapping
+    "low_resource": """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=FILE;
+        PRAGMA mmap_size=0;
+        PRAGMA cache_size=-2000;
+        PRAGMA foreign_keys=ON;
+        PRAGMA busy_timeout=5000;
+    """,
+    # Nothing is persisted, so skip journaling and syncing entirely
+    "in_memory": """
+        PRAGMA journal_mode=MEMORY;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA foreign_keys=ON;
+    """,
+}
+
+DEFAULT_PROFILE = "high_performance"
+
+# Size of sqlite3's per-connection prepared statement cache (module default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Rows written since the last ANALYZE before close() refreshes statistics
+ANALYZE_THRESHOLD = 1000
+
+# Default number of pooled read-only connections
+READER_POOL_SIZE = 4
+
+# (source_text, target_text, source_lang, target_lang, context)
+TranslationRow = Tuple[str, str, str, str, Optional[str]]
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+# firing delete triggers, which would leave stale entries in tm_fts
+_INSERT_TRANSLATION_SQL = """INSERT INTO translation_memory 
+                   (source_text, target_text, source_lang, target_lang, context, updated_at)
+                   VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(source_text, target_text, source_lang, target_lang)
+                   DO UPDATE SET context = excluded.context, updated_at = CURRENT_TIMESTAMP"""
+
+# (file_path, file_size, entry_count)
+RecentFileRow = Tuple[str, Optional[int], Optional[int]]
+
+_INSERT_RECENT_FILE_SQL = """INSERT OR REPLACE INTO recent_files 
+                   (file_path, last_opened, file_size, entry_count)
+                   VALUES (?, CURRENT_TIMESTAMP, ?, ?)"""
+
+# Tables, full-text index and lookup indexes, created by _create_tables()
+_SCHEMA_SQL = """
+-- Settings table
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Translation memory table
+CREATE TABLE IF NOT EXISTS translation_memory (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_text TEXT NOT NULL,
+    target_text TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    context TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(source_text, target_text, source_lang, target_lang)
+);
+
+-- Recent files table
+CREATE TABLE IF NOT EXISTS recent_files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT UNIQUE NOT NULL,
+    last_opened TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    file_size INTEGER,
+    entry_count INTEGER
+);
+
+-- Plugin data table (for plugins to store their data)
+CREATE TABLE IF NOT EXISTS plugin_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    plugin_name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(plugin_name, key)
+);
+
+-- User preferences table
+CREATE TABLE IF NOT EXISTS user_preferences (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(category, key)
+);
+
+-- Full-text index over the translation memory, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS tm_fts USING fts5(
+    source_text,
+    target_text,
+    content='translation_memory',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS tm_fts_insert AFTER INSERT ON translation_memory
+BEGIN
+    INSERT INTO tm_fts(rowid, source_text, target_text)
+    VALUES (new.id, new.source_text, new.target_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tm_fts_delete AFTER DELETE ON translation_memory
+BEGIN
+    INSERT INTO tm_fts(tm_fts, rowid, source_text, target_text)
+    VALUES ('delete', old.id, old.source_text, old.target_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tm_fts_update AFTER UPDATE ON translation_memory
+BEGIN
+    INSERT INTO tm_fts(tm_fts, rowid, source_text, target_text)
+    VALUES ('delete', old.id, old.source_text, old.target_text);
+    INSERT INTO tm_fts(rowid, source_text, target_text)
+    VALUES (new.id, new.source_text, new.target_text);
+END;
+
+-- Indexes for the ORDER BY / filter paths of the lookup helpers.
+-- plugin_data(plugin_name, key) is already covered by its UNIQUE index.
+CREATE INDEX IF NOT EXISTS idx_tm_updated
+ON translation_memory(updated_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_tm_langs
+ON translation_memory(source_lang, target_lang, updated_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_recent_opened
+ON recent_files(last_opened DESC);
+"""
+
+_SEARCH_SELECT = """SELECT tm.source_text, tm.target_text, tm.source_lang,
+                            tm.target_lang, tm.context
+                     FROM tm_fts
+                     JOIN translation_memory tm ON tm.id = tm_fts.rowid
+                     WHERE tm_fts MATCH ?"""
+_SEARCH_ORDER = " ORDER BY tm.updated_at DESC LIMIT ?"
+
+# search_translations() SQL keyed by (has source_lang, has target_lang), so
+# each filter combination is a fixed string with its own cached statement
+_SEARCH_SQL: Dict[Tuple[bool, bool], str] = {
+    (False, False): _SEARCH_SELECT + _SEARCH_ORDER,
+    (True, False): _SEARCH_SELECT + " AND tm.source_lang = ?" + _SEARCH_ORDER,
+    (False, True): _SEARCH_SELECT + " AND tm.target_lang = ?" + _SEARCH_ORDER,
+    (True, True): (_SEARCH_SELECT + " AND tm.source_lang = ? AND tm.target_lang = ?"
+                   + _SEARCH_ORDER),
+}
+
+
+def _fts_query(text: str) -> str:
+    """Convert free text into an FTS5 MATCH expression.
+    
+    Each whitespace-separated term is quoted (so FTS5 operators in user input
+    are taken literally) and prefix-matched.
+    
+    Args:
+        text: Raw search text
+        
+    Returns:
+        FTS5 query expression, empty if text has no terms
+    """
+    terms = text.split()
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a setting or plugin value as compact JSON text.
+    
+    Args:
+        value: Any JSON-serializable value; other objects are stored as str()
+        
+    Returns:
+        JSON text
+    """
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _decode_value(raw: bytes) -> Any:
+    """Decode a value column written by _encode_value.
+    
+    Rows written before values were JSON-encoded hold plain str() text, which
+    is returned unchanged when it does not parse.
+    
+    Args:
+        raw: Column bytes as handed to sqlite3 converters
+        
+    Returns:
+        The decoded value
+    """
+    text = raw.decode('utf-8')
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+# Applied to columns selected as "value [JSON]" (detect_types=PARSE_COLNAMES)
+sqlite3.register_converter("JSON", _decode_value)
+
+
+class DatabaseInitTask(QRunnable):
+    """Runs DatabaseManager.initialize on a worker thread.
+    
+    The outcome is reported through the manager's database_connected or
+    database_error signal, followed by initialization_finished; Qt queues
+    these to receivers living on the GUI thread.
+    """
+    
+    def __init__(self, manager: "DatabaseManager"):
+        """Initialize the task.
+        
+        Args:
+            manager: Database manager to initialize
+        """
+        super().__init__()
+        self.manager = manager
+        
+    def run(self):
+        """Open the database and signal completion."""
+        try:
+            self.manager.initialize()
+        finally:
+            self.manager.initialization_finished.emit()
 
 
 class DatabaseManager(QObject):
@@ -17,15 +276,24 @@ class DatabaseManager(QObject):
     database_connected = Signal()
     database_disconnected = Signal()
     database_error = Signal(str)  # Error message
+    initialization_finished = Signal()  # Emitted by initialize_async either way
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, profile: str = DEFAULT_PROFILE,
+                 pool_size: int = READER_POOL_SIZE):
         """Initialize the database manager.
         
         Args:
             db_path: Path to the database file. If None, uses default location.
+            profile: Name of the PRAGMA profile to apply (see PRAGMA_PROFILES)
+            pool_size: Number of read-only connections for execute_query.
+                       0 sends reads through the writer connection.
         """
         super().__init__()
         
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown database profile: {profile}")
+        self.profile = profile
+        
         if db_path is None:
             # Default database location
             project_root = Path(__file__).parent.parent
@@ -37,6 +305,22 @@ class DatabaseManager(QObject):
             
         self.connection: Optional[sqlite3.Connection] = None
         
+        # Serializes writers sharing the connection (UI thread and batch writer)
+        self._write_lock = threading.Lock()
+        self._writes_since_analyze = 0
+        
+        # Read-only connections, opened lazily up to pool_size.
+        # A private in-memory database cannot be shared between connections.
+        self.pool_size = 0 if self.db_path == ":memory:" else pool_size
+        self._reader_pool: queue.Queue = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        
+        # Background translation-memory batch writer (see start_batch_writer)
+        self._batch_queue: Optional[queue.Queue] = None
+        self._batch_thread: Optional[threading.Thread] = None
+        self._batch_wait = 0.05
+        
     def initialize(self) -> bool:
         """Initialize the database connection and create tables.
         
@@ -44,99 +328,132 @@ class DatabaseManager(QObject):
             True if successful, False otherwise
         """
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row  # Enable column access by name
-            
+            self.connection = self._open_connection()
             self._create_tables()
             self.database_connected.emit()
-            print(f"Database initialized at: {self.db_path}")
+            _log.debug("Database initialized at: %s", self.db_path)
             return True
             
         except Exception as e:
             error_msg = f"Failed to initialize database: {str(e)}"
-            print(error_msg)
+            _log.error(error_msg, exc_info=True)
             self.database_error.emit(error_msg)
             return False
             
+    def initialize_async(self):
+        """Initialize the database on the global thread pool.
+        
+        Returns immediately; connect to database_connected, database_error
+        or initialization_finished to learn the outcome.
+        """
+        QThreadPool.globalInstance().start(DatabaseInitTask(self))
+        
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection configured with the active PRAGMA profile.
+        
+        Args:
+            read_only: Whether to reject writes on this connection
+            
+        Returns:
+            The new connection
+        """
+        # Autocommit mode: transactions are opened explicitly where needed
+        connection = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_COLNAMES,
+        )
+        connection.row_factory = sqlite3.Row  # Enable column access by name
+        connection.executescript(PRAGMA_PROFILES[self.profile])
+        if read_only:
+            connection.execute("PRAGMA query_only=1")
+        return connection
+        
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool.
+        
+        Yields:
+            A pooled reader, or the writer connection when pooling is disabled
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+            
+        if self.pool_size <= 0:
+            yield self.connection
+            return
+            
+        try:
+            reader = self._reader_pool.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                can_open = self._reader_count < self.pool_size
+                if can_open:
+                    self._reader_count += 1
+            if can_open:
+                try:
+                    reader = self._open_connection(read_only=True)
+                except Exception:
+                    with self._reader_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                reader = self._reader_pool.get()
+                
+        try:
+            yield reader
+        finally:
+            self._reader_pool.put(reader)
+            
+    def _close_readers(self):
+        """Close every pooled reader connection."""
+        while True:
+            try:
+                reader = self._reader_pool.get_nowait()
+            except queue.Empty:
+                break
+            reader.close()
+        with self._reader_lock:
+            self._reader_count = 0
+            
     def _create_tables(self):
         """Create the database tables."""
         if not self.connection:
             raise RuntimeError("Database connection not established")
-        cursor = self.connection.cursor()
-        
-        # Settings table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Translation memory table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS translation_memory (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_text TEXT NOT NULL,
-                target_text TEXT NOT NULL,
-                source_lang TEXT NOT NULL,
-                target_lang TEXT NOT NULL,
-                context TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(source_text, target_text, source_lang, target_lang)
-            )
-        """)
-        
-        # Recent files table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recent_files (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                file_path TEXT UNIQUE NOT NULL,
-                last_opened TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                file_size INTEGER,
-                entry_count INTEGER
-            )
-        """)
-        
-        # Plugin data table (for plugins to store their data)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS plugin_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                plugin_name TEXT NOT NULL,
-                key TEXT NOT NULL,
-                value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(plugin_name, key)
-            )
-        """)
-        
-        # User preferences table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_preferences (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT NOT NULL,
-                key TEXT NOT NULL,
-                value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(category, key)
-            )
-        """)
+            
+        fts_exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tm_fts'"
+        ).fetchone()
         
-        if not self.connection:
-            raise RuntimeError("Database connection not established")
-        self.connection.commit()
+        # One C call for the whole schema
+        self.connection.executescript(_SCHEMA_SQL)
+        
+        if not fts_exists:
+            # Index rows written before the full-text table existed
+            self.connection.execute("INSERT INTO tm_fts(tm_fts) VALUES ('rebuild')")
         
     def close(self):
         """Close the database connection."""
+        self.stop_batch_writer()
+        self._close_readers()
         if self.connection:
+            # Refresh planner statistics after large imports, then let SQLite
+            # analyze whatever else this session's queries would benefit from
+            if self._writes_since_analyze >= ANALYZE_THRESHOLD:
+                self.connection.execute("ANALYZE translation_memory")
+                self.connection.execute("ANALYZE plugin_data")
+                self._writes_since_analyze = 0
+            self.connection.execute("PRAGMA optimize")
+            
+            # Fold the WAL back into the main database file before closing
+            if self.profile != "in_memory":
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             self.connection.close()
             self.connection = None
             self.database_disconnected.emit()
-            print("Database connection closed")
+            _log.debug("Database connection closed")
             
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results.
@@ -148,13 +465,38 @@ class DatabaseManager(QObject):
         Returns:
             List of result rows
         """
-        if not self.connection:
-            raise RuntimeError("Database not connected")
-            
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        # Connection.execute reuses the prepared statement cached for this SQL text
+        with self._reader() as reader:
+            return reader.execute(query, params).fetchall()
+        
+    def iter_query(self, query: str, params: tuple = (),
+                   arraysize: int = 200) -> Iterator[sqlite3.Row]:
+        """Execute a SELECT query and yield rows as they are fetched.
         
+        Rows are pulled in chunks of arraysize, so the first rows are
+        available before the whole result set is read. The pooled reader is
+        held until the iterator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            arraysize: Number of rows fetched per chunk
+            
+        Yields:
+            Result rows
+        """
+        with self._reader() as reader:
+            cursor = reader.execute(query, params)
+            cursor.arraysize = arraysize
+            try:
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+                
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT, UPDATE, or DELETE query.
         
@@ -168,9 +510,34 @@ class DatabaseManager(QObject):
         if not self.connection:
             raise RuntimeError("Database not connected")
             
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        self.connection.commit()
+        with self._write_lock:
+            cursor = self.connection.execute(query, params)
+            self.connection.commit()
+            self._writes_since_analyze += max(cursor.rowcount, 0)
+        return cursor.rowcount
+        
+    def execute_many(self, query: str, rows: Iterable[tuple]) -> int:
+        """Execute a write query for every parameter row in one transaction.
+        
+        Args:
+            query: SQL query string
+            rows: Iterable of parameter tuples, consumed lazily
+            
+        Returns:
+            Number of affected rows
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+            
+        with self._write_lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self.connection.executemany(query, rows)
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+            self._writes_since_analyze += max(cursor.rowcount, 0)
         return cursor.rowcount
         
     # Settings methods
@@ -186,11 +553,11 @@ class DatabaseManager(QObject):
         """
         try:
             rows = self.execute_query(
-                "SELECT value FROM settings WHERE key = ?", (key,)
+                'SELECT value AS "value [JSON]" FROM settings WHERE key = ?', (key,)
             )
             return rows[0]["value"] if rows else default
-        except Exception as e:
-            print(f"Error getting setting '{key}': {e}")
+        except sqlite3.Error:
+            _log.exception("get_setting(%s) failed", key)
             return default
             
     def set_setting(self, key: str, value: Any) -> bool:
@@ -207,11 +574,11 @@ class DatabaseManager(QObject):
             self.execute_update(
                 """INSERT OR REPLACE INTO settings (key, value, updated_at) 
                    VALUES (?, ?, CURRENT_TIMESTAMP)""",
-                (key, str(value))
+                (key, _encode_value(value))
             )
             return True
-        except Exception as e:
-            print(f"Error setting '{key}': {e}")
+        except sqlite3.Error:
+            _log.exception("set_setting(%s) failed", key)
             return False
             
     # Translation memory methods
@@ -229,22 +596,111 @@ class DatabaseManager(QObject):
         Returns:
             True if successful, False otherwise
         """
+        return self.add_translations([(source, target, source_lang, target_lang, context)]) > 0
+            
+    def add_translations(self, rows: Iterable[TranslationRow]) -> int:
+        """Add many translations to the translation memory in one transaction.
+        
+        Args:
+            rows: Iterable of (source, target, source_lang, target_lang, context) tuples
+            
+        Returns:
+            Number of rows written, 0 on failure
+        """
         try:
-            self.execute_update(
-                """INSERT OR REPLACE INTO translation_memory 
-                   (source_text, target_text, source_lang, target_lang, context, updated_at)
-                   VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                (source, target, source_lang, target_lang, context)
-            )
-            return True
-        except Exception as e:
-            print(f"Error adding translation: {e}")
-            return False
+            return self.execute_many(_INSERT_TRANSLATION_SQL, rows)
+        except sqlite3.Error:
+            _log.exception("add_translations() failed")
+            return 0
+            
+    def start_batch_writer(self, batch_wait_ms: int = 50, max_queued: int = 10000):
+        """Start the background writer that drains queue_translation() calls.
+        
+        Queued rows are committed together once the queue has been quiet for
+        batch_wait_ms, so callers never wait on a commit.
+        
+        Args:
+            batch_wait_ms: How long to keep collecting rows before committing
+            max_queued: Maximum number of pending rows before callers block
+        """
+        if self._batch_thread and self._batch_thread.is_alive():
+            return
+            
+        self._batch_wait = batch_wait_ms / 1000.0
+        self._batch_queue = queue.Queue(maxsize=max_queued)
+        self._batch_thread = threading.Thread(
+            target=self._run_batch_writer, name="tm-batch-writer", daemon=True
+        )
+        self._batch_thread.start()
+        
+    def stop_batch_writer(self):
+        """Flush pending rows and stop the background writer."""
+        if not self._batch_thread or not self._batch_queue:
+            return
+            
+        self._batch_queue.put(None)  # Sentinel: flush and exit
+        self._batch_thread.join()
+        self._batch_thread = None
+        self._batch_queue = None
+        
+    def queue_translation(self, source: str, target: str, source_lang: str,
+                          target_lang: str, context: Optional[str] = None) -> bool:
+        """Queue a translation for the background writer.
+        
+        Falls back to a direct write if the batch writer is not running.
+        
+        Args:
+            source: Source text
+            target: Target text
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Optional context
+            
+        Returns:
+            True if the row was queued or written, False otherwise
+        """
+        if not self._batch_queue:
+            return self.add_translation(source, target, source_lang, target_lang, context)
+            
+        self._batch_queue.put((source, target, source_lang, target_lang, context))
+        return True
+        
+    def _run_batch_writer(self):
+        """Collect queued rows and commit them in batches until stopped."""
+        batch_queue = self._batch_queue
+        if batch_queue is None:
+            return
+            
+        running = True
+        while running:
+            row = batch_queue.get()
+            if row is None:
+                break
+                
+            batch = [row]
+            deadline = time.monotonic() + self._batch_wait
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = batch_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is None:
+                    running = False
+                    break
+                batch.append(row)
+                
+            self.add_translations(batch)
             
     def search_translations(self, query: str, source_lang: Optional[str] = None, 
-                          target_lang: Optional[str] = None, limit: int = 10) -> List[Dict]:
+                          target_lang: Optional[str] = None, limit: int = 10) -> List[sqlite3.Row]:
         """Search for translations in the translation memory.
         
+        Matches words in the source or target text that start with the
+        query terms, using the tm_fts full-text index.
+        
         Args:
             query: Search query
             source_lang: Optional source language filter
@@ -252,32 +708,43 @@ class DatabaseManager(QObject):
             limit: Maximum number of results
             
         Returns:
-            List of translation dictionaries
+            List of translation rows (accessible by column name or index)
         """
         try:
-            sql = """SELECT source_text, target_text, source_lang, target_lang, context
-                     FROM translation_memory 
-                     WHERE source_text LIKE ? OR target_text LIKE ?"""
-            params = [f"%{query}%", f"%{query}%"]
-            
-            if source_lang:
-                sql += " AND source_lang = ?"
-                params.append(source_lang)
-                
-            if target_lang:
-                sql += " AND target_lang = ?"
-                params.append(target_lang)
-                
-            sql += " ORDER BY updated_at DESC LIMIT ?"
-            params.append(str(limit))
+            return list(self.iter_translations(query, source_lang, target_lang, limit))
+        except sqlite3.Error:
+            _log.exception("search_translations(%r) failed", query)
+            return []
             
-            rows = self.execute_query(sql, tuple(params))
-            return [dict(row) for row in rows]
+    def iter_translations(self, query: str, source_lang: Optional[str] = None,
+                          target_lang: Optional[str] = None,
+                          limit: Optional[int] = None) -> Iterator[sqlite3.Row]:
+        """Stream translation memory matches, most recently updated first.
+        
+        Same matching as search_translations(), but rows are yielded as they
+        are fetched so a UI can show the first hits immediately. Database
+        errors are raised to the consumer.
+        
+        Args:
+            query: Search query
+            source_lang: Optional source language filter
+            target_lang: Optional target language filter
+            limit: Maximum number of results, None for no limit
             
-        except Exception as e:
-            print(f"Error searching translations: {e}")
-            return []
+        Yields:
+            Translation rows
+        """
+        match = _fts_query(query)
+        if not match:
+            return
             
+        sql = _SEARCH_SQL[(bool(source_lang), bool(target_lang))]
+        params = (match,) + tuple(
+            lang for lang in (source_lang, target_lang) if lang
+        ) + (-1 if limit is None else limit,)  # LIMIT -1 means no limit
+        
+        yield from self.iter_query(sql, params)
+        
     # Recent files methods
     def add_recent_file(self, file_path: str, file_size: Optional[int] = None, 
                        entry_count: Optional[int] = None) -> bool:
@@ -292,36 +759,45 @@ class DatabaseManager(QObject):
             True if successful, False otherwise
         """
         try:
-            self.execute_update(
-                """INSERT OR REPLACE INTO recent_files 
-                   (file_path, last_opened, file_size, entry_count)
-                   VALUES (?, CURRENT_TIMESTAMP, ?, ?)""",
-                (file_path, file_size, entry_count)
-            )
+            self.execute_update(_INSERT_RECENT_FILE_SQL, (file_path, file_size, entry_count))
             return True
-        except Exception as e:
-            print(f"Error adding recent file: {e}")
+        except sqlite3.Error:
+            _log.exception("add_recent_file(%s) failed", file_path)
             return False
             
-    def get_recent_files(self, limit: int = 10) -> List[Dict]:
+    def add_recent_files(self, items: Iterable[RecentFileRow]) -> int:
+        """Add many files to the recent files list in one transaction.
+        
+        Args:
+            items: Iterable of (file_path, file_size, entry_count) tuples
+            
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        try:
+            return self.execute_many(_INSERT_RECENT_FILE_SQL, items)
+        except sqlite3.Error:
+            _log.exception("add_recent_files() failed")
+            return 0
+            
+    def get_recent_files(self, limit: int = 10) -> List[sqlite3.Row]:
         """Get recent files list.
         
         Args:
             limit: Maximum number of files to return
             
         Returns:
-            List of recent file dictionaries
+            List of recent file rows (accessible by column name or index)
         """
         try:
-            rows = self.execute_query(
+            return self.execute_query(
                 """SELECT file_path, last_opened, file_size, entry_count
                    FROM recent_files 
                    ORDER BY last_opened DESC LIMIT ?""",
                 (limit,)
             )
-            return [dict(row) for row in rows]
-        except Exception as e:
-            print(f"Error getting recent files: {e}")
+        except sqlite3.Error:
+            _log.exception("get_recent_files() failed")
             return []
             
     # Plugin data methods
@@ -341,11 +817,11 @@ class DatabaseManager(QObject):
                 """INSERT OR REPLACE INTO plugin_data 
                    (plugin_name, key, value, updated_at)
                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)""",
-                (plugin_name, key, str(value))
+                (plugin_name, key, _encode_value(value))
             )
             return True
-        except Exception as e:
-            print(f"Error setting plugin data: {e}")
+        except sqlite3.Error:
+            _log.exception("set_plugin_data(%s, %s) failed", plugin_name, key)
             return False
             
     def get_plugin_data(self, plugin_name: str, key: str, default: Any = None) -> Any:
@@ -361,10 +837,10 @@ class DatabaseManager(QObject):
         """
         try:
             rows = self.execute_query(
-                "SELECT value FROM plugin_data WHERE plugin_name = ? AND key = ?",
+                'SELECT value AS "value [JSON]" FROM plugin_data WHERE plugin_name = ? AND key = ?',
                 (plugin_name, key)
             )
             return rows[0]["value"] if rows else default
-        except Exception as e:
-            print(f"Error getting plugin data: {e}")
+        except sqlite3.Error:
+            _log.exception("get_plugin_data(%s, %s) failed", plugin_name, key)
             return default
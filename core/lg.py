@@ -2,10 +2,11 @@
 Logging utilities for the PO Editor application
 """
 import os
+import json
+import queue
 import logging
 import logging.handlers
 from typing import Dict, Any, Optional
-from PySide6.QtCore import QSettings
 
 
 class Logger:
@@ -16,11 +17,20 @@ class Logger:
         self.logger = logging.getLogger('poeditor')
         self.logger.setLevel(logging.DEBUG)
         self.initialized = False
-        self.settings = QSettings("POEditor", "Settings")
+        
+        # Plain JSON config keeps this module free of Qt imports
+        self.config_path = os.path.join(os.path.expanduser('~'), '.poeditor', 'logging.json')
         
         # Initialize log handlers collection
         self.handlers = {}
         
+        # Handlers run on a background listener; the logger only enqueues records
+        self.queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        
+        # Sub-loggers resolved by get_logger(), keyed by name
+        self._loggers: Dict[str, logging.Logger] = {}
+        
         # Default configuration
         self.log_dir = os.path.join(os.path.expanduser('~'), '.poeditor', 'logs')
         self.max_file_size = 1024 * 1024  # 1MB default
@@ -32,29 +42,34 @@ class Logger:
         # Load settings if available
         self.load_settings()
         
-        # Create log directory if it doesn't exist
-        if self.file_logging and not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir, exist_ok=True)
-        
     def load_settings(self):
-        """Load logging settings from QSettings."""
-        if self.settings.contains("logging/log_dir"):
-            self.log_dir = self.settings.value("logging/log_dir")
+        """Load logging settings from the JSON config file."""
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as config_file:
+                config = json.load(config_file)
+        except (OSError, ValueError):
+            return
             
-        if self.settings.contains("logging/max_file_size"):
+        if not isinstance(config, dict):
+            return
+            
+        if isinstance(config.get("log_dir"), str):
+            self.log_dir = config["log_dir"]
+            
+        if "max_file_size" in config:
             try:
-                self.max_file_size = int(self.settings.value("logging/max_file_size"))
+                self.max_file_size = int(config["max_file_size"])
             except (ValueError, TypeError):
                 pass
                 
-        if self.settings.contains("logging/backup_count"):
+        if "backup_count" in config:
             try:
-                self.backup_count = int(self.settings.value("logging/backup_count"))
+                self.backup_count = int(config["backup_count"])
             except (ValueError, TypeError):
                 pass
                 
-        if self.settings.contains("logging/log_level"):
-            level_name = self.settings.value("logging/log_level")
+        if "log_level" in config:
+            level_name = config["log_level"]
             level_map = {
                 "DEBUG": logging.DEBUG,
                 "INFO": logging.INFO,
@@ -64,18 +79,14 @@ class Logger:
             }
             self.log_level = level_map.get(level_name, logging.INFO)
             
-        if self.settings.contains("logging/console_logging"):
-            self.console_logging = self.settings.value("logging/console_logging", type=bool)
+        if isinstance(config.get("console_logging"), bool):
+            self.console_logging = config["console_logging"]
             
-        if self.settings.contains("logging/file_logging"):
-            self.file_logging = self.settings.value("logging/file_logging", type=bool)
+        if isinstance(config.get("file_logging"), bool):
+            self.file_logging = config["file_logging"]
     
     def save_settings(self):
-        """Save logging settings to QSettings."""
-        self.settings.setValue("logging/log_dir", self.log_dir)
-        self.settings.setValue("logging/max_file_size", self.max_file_size)
-        self.settings.setValue("logging/backup_count", self.backup_count)
-        
+        """Save logging settings to the JSON config file."""
         # Map log level to string
         level_map = {
             logging.DEBUG: "DEBUG",
@@ -84,10 +95,18 @@ class Logger:
             logging.ERROR: "ERROR",
             logging.CRITICAL: "CRITICAL"
         }
-        self.settings.setValue("logging/log_level", level_map.get(self.log_level, "INFO"))
+        config = {
+            "log_dir": self.log_dir,
+            "max_file_size": self.max_file_size,
+            "backup_count": self.backup_count,
+            "log_level": level_map.get(self.log_level, "INFO"),
+            "console_logging": self.console_logging,
+            "file_logging": self.file_logging,
+        }
         
-        self.settings.setValue("logging/console_logging", self.console_logging)
-        self.settings.setValue("logging/file_logging", self.file_logging)
+        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+        with open(self.config_path, 'w', encoding='utf-8') as config_file:
+            json.dump(config, config_file, indent=2)
         
     def setup(self):
         """Set up the logger with handlers based on settings."""
@@ -103,11 +122,11 @@ class Logger:
             console_handler.setLevel(self.log_level)
             formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
             self.handlers['console'] = console_handler
         
         # Create file handler if enabled
         if self.file_logging:
+            os.makedirs(self.log_dir, exist_ok=True)
             log_file = os.path.join(self.log_dir, 'poeditor.log')
             file_handler = logging.handlers.RotatingFileHandler(
                 log_file,
@@ -117,11 +136,37 @@ class Logger:
             file_handler.setLevel(self.log_level)
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
             self.handlers['file'] = file_handler
             
+        # Handler I/O happens on the listener thread, so logging from
+        # the GUI thread only costs a queue put
+        if self.handlers:
+            log_queue = queue.SimpleQueue()
+            self.queue_handler = logging.handlers.QueueHandler(log_queue)
+            self.listener = logging.handlers.QueueListener(
+                log_queue, *self.handlers.values(), respect_handler_level=True
+            )
+            self.logger.addHandler(self.queue_handler)
+            self.listener.start()
+            
         self.initialized = True
         
+    def shutdown(self):
+        """Flush pending records and stop the background listener."""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+            
+        if self.queue_handler:
+            self.logger.removeHandler(self.queue_handler)
+            self.queue_handler = None
+            
+        for handler in self.handlers.values():
+            handler.close()
+            
+        self.handlers = {}
+        self.initialized = False
+        
     def update_configuration(self, config: Dict[str, Any]):
         """Update logger configuration.
         
@@ -134,11 +179,9 @@ class Logger:
                 setattr(self, key, value)
                 
         # Remove existing handlers
+        self.shutdown()
         for handler in list(self.logger.handlers):
             self.logger.removeHandler(handler)
-            
-        self.handlers = {}
-        self.initialized = False
         
         # Save settings
         self.save_settings()
@@ -158,13 +201,22 @@ class Logger:
         if not self.initialized:
             self.setup()
             
-        if name:
-            return logging.getLogger(f'poeditor.{name}')
-        return self.logger
+        if not name:
+            return self.logger
+            
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = logging.getLogger(f'poeditor.{name}')
+        return logger
 
 
 # Create the global logger instance
 lg = Logger()
+lg.setup()
+
+# Bound once so the convenience functions skip the get_logger() indirection.
+# update_configuration() swaps handlers on this same logger object.
+_LOGGER = lg.logger
 
 
 # Convenience functions for accessing the logger
@@ -176,7 +228,7 @@ def debug(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().debug(msg, *args, **kwargs)
+    _LOGGER.debug(msg, *args, **kwargs)
     
 def info(msg: str, *args, **kwargs):
     """Log an info message.
@@ -186,7 +238,7 @@ def info(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().info(msg, *args, **kwargs)
+    _LOGGER.info(msg, *args, **kwargs)
     
 def warning(msg: str, *args, **kwargs):
     """Log a warning message.
@@ -196,7 +248,7 @@ def warning(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().warning(msg, *args, **kwargs)
+    _LOGGER.warning(msg, *args, **kwargs)
     
 def error(msg: str, *args, **kwargs):
     """Log an error message.
@@ -206,7 +258,7 @@ def error(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().error(msg, *args, **kwargs)
+    _LOGGER.error(msg, *args, **kwargs)
     
 def critical(msg: str, *args, **kwargs):
     """Log a critical message.
@@ -216,7 +268,7 @@ def critical(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().critical(msg, *args, **kwargs)
+    _LOGGER.critical(msg, *args, **kwargs)
     
 def exception(msg: str, *args, **kwargs):
     """Log an exception message.
@@ -226,4 +278,4 @@ def exception(msg: str, *args, **kwargs):
         args: Additional positional arguments
         kwargs: Additional keyword arguments
     """
-    lg.get_logger().exception(msg, *args, **kwargs)
+    _LOGGER.exception(msg, *args, **kwargs)
@@ -2,15 +2,16 @@
 Main Frame - The main window for PO Editor application.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QMenuBar, QStatusBar, QDockWidget, QTextEdit
+    QMainWindow, QWidget, QVBoxLayout, QStatusBar, QTextEdit, QDockWidget
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction
 
 from .abstract_panel import AbstractPanel
+from .lg import lg
+
+_log = lg.get_logger("ui")
 
 
 class MainFrame(QMainWindow):
@@ -33,11 +34,22 @@ class MainFrame(QMainWindow):
         self.database_manager = database_manager
         self.panels = {}  # Dictionary to store registered panels
         self.sidebar_panel = None  # Reference to sidebar panel
+        # Panels not yet added to a dock area, with the area they will use
+        self._undocked_panels: Dict[str, Qt.DockWidgetArea] = {}
+        # Docks added while a batch registration is open, added in end_batch
+        self._batch_depth = 0
+        self._pending_docks: List[Tuple[Qt.DockWidgetArea, QDockWidget]] = []
+        # Targets for show_preferences, cached as plugins are loaded
+        self._settings_panel = None
+        self._settings_sidebar = None
         
         self._setup_ui()
         self._setup_menus()
         self._setup_status_bar()
         
+        if self.plugin_manager is not None:
+            self.plugin_manager.plugin_loaded.connect(self._on_plugin_loaded)
+        
     def _setup_ui(self):
         """Set up the main UI."""
         self.setWindowTitle("PO Editor")
@@ -56,35 +68,32 @@ class MainFrame(QMainWindow):
         
     def _setup_menus(self):
         """Set up the menu bar."""
+        # QtGui is only needed once the menus are built
+        from PySide6.QtGui import QAction
+        
         menubar = self.menuBar()
         
         # File menu
         file_menu = menubar.addMenu("&File")
         
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_file)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_file)
-        file_menu.addAction(save_action)
-        
-        file_menu.addSeparator()
-        
-        # Add preferences action to File menu
-        preferences_action = QAction("&Preferences...", self)
-        preferences_action.setShortcut("Ctrl+,")
-        preferences_action.triggered.connect(self.show_preferences)
-        file_menu.addAction(preferences_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        # (text, shortcut, slot); None inserts a separator
+        file_actions = (
+            ("&Open...", "Ctrl+O", self.open_file),
+            ("&Save", "Ctrl+S", self.save_file),
+            None,
+            ("&Preferences...", "Ctrl+,", self.show_preferences),
+            None,
+            ("E&xit", "Ctrl+Q", self.close),
+        )
+        for entry in file_actions:
+            if entry is None:
+                file_menu.addSeparator()
+                continue
+            text, shortcut, slot = entry
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            file_menu.addAction(action)
         
         # View menu
         view_menu = menubar.addMenu("&View")
@@ -98,6 +107,10 @@ class MainFrame(QMainWindow):
         """Set up the status bar."""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.show_ready()
+        
+    def show_ready(self):
+        """Show the idle "Ready" message in the status bar."""
         self.status_bar.showMessage("Ready")
         
     def register_panel(self, panel_id: str, panel: AbstractPanel):
@@ -108,7 +121,7 @@ class MainFrame(QMainWindow):
             panel: The panel instance
         """
         if panel_id in self.panels:
-            print(f"Warning: Panel '{panel_id}' is already registered")
+            _log.warning("Panel %r is already registered", panel_id)
             return
             
         self.panels[panel_id] = panel
@@ -116,16 +129,102 @@ class MainFrame(QMainWindow):
         # Special handling for sidebar
         if panel_id.startswith("sidebar_"):
             self.sidebar_panel = panel
-            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, panel)
+            self._add_dock(Qt.DockWidgetArea.LeftDockWidgetArea, panel)
+            
+            # Add toggle action to View menu
+            toggle_action = panel.toggleViewAction()
+            toggle_action.setText(f"Show {panel.windowTitle()}")
+            self.view_menu.addAction(toggle_action)
+            return
+            
+        # Other panels are hidden by default since they should be accessed
+        # through the sidebar, so they are only docked when first shown
+        panel.toggle_view(False)
+        self._undocked_panels[panel_id] = Qt.DockWidgetArea.RightDockWidgetArea
+        
+        # The dock's own toggle action would show an undocked panel as a
+        # floating window, so the View menu goes through show_panel instead
+        from PySide6.QtGui import QAction
+        toggle_action = QAction(f"Show {panel.windowTitle()}", self)
+        toggle_action.setCheckable(True)
+        toggle_action.triggered.connect(
+            lambda checked, pid=panel_id: self.show_panel(pid, checked)
+        )
+        panel.visibilityChanged.connect(toggle_action.setChecked)
+        self.view_menu.addAction(toggle_action)
+        
+    def begin_batch(self):
+        """Start a batch of panel registrations.
+        
+        Until the matching end_batch, window updates are disabled and docks
+        from register_panel are queued instead of added one at a time.
+        Batches may be nested.
+        """
+        if self._batch_depth == 0:
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        
+    def end_batch(self):
+        """Finish a batch of panel registrations and add the queued docks.
+        
+        Docks queued for the same area are tabified together.
+        """
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+            
+        first_in_area: Dict[Qt.DockWidgetArea, QDockWidget] = {}
+        pending, self._pending_docks = self._pending_docks, []
+        for area, dock in pending:
+            self.addDockWidget(area, dock)
+            first = first_in_area.setdefault(area, dock)
+            if first is not dock:
+                self.tabifyDockWidget(first, dock)
+                
+        self.setUpdatesEnabled(True)
+        self.update()
+        
+    def _add_dock(self, area: Qt.DockWidgetArea, dock: QDockWidget):
+        """Add a dock widget now, or queue it while a batch is open.
+        
+        Args:
+            area: Dock area to add the widget to
+            dock: The dock widget
+        """
+        if self._batch_depth:
+            self._pending_docks.append((area, dock))
         else:
-            # Other panels - hide them by default since they should be accessed through sidebar
-            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, panel)
-            panel.hide()  # Hide by default
+            self.addDockWidget(area, dock)
+            
+    def _ensure_docked(self, panel_id: str):
+        """Add a registered panel to its dock area if that has not happened yet.
         
-        # Add toggle action to View menu
-        toggle_action = panel.toggleViewAction()
-        toggle_action.setText(f"Show {panel.windowTitle()}")
-        self.view_menu.addAction(toggle_action)
+        Args:
+            panel_id: Unique identifier for the panel
+        """
+        area = self._undocked_panels.pop(panel_id, None)
+        if area is not None:
+            self.addDockWidget(area, self.panels[panel_id])
+            
+    def show_panel(self, panel_id: str, visible: bool = True):
+        """Show or hide a registered panel, docking it on first show.
+        
+        Args:
+            panel_id: Unique identifier for the panel
+            visible: Whether the panel should be visible
+        """
+        panel = self.panels.get(panel_id)
+        if panel is None:
+            return
+            
+        if visible:
+            self._ensure_docked(panel_id)
+            panel.toggle_view(True)
+            panel.raise_()
+        else:
+            panel.toggle_view(False)
         
     def unregister_panel(self, panel_id: str):
         """Unregister a panel from the main frame.
@@ -137,9 +236,17 @@ class MainFrame(QMainWindow):
             return
             
         panel = self.panels[panel_id]
-        self.removeDockWidget(panel)
+        pending = [entry for entry in self._pending_docks if entry[1] is not panel]
+        if self._undocked_panels.pop(panel_id, None) is None and len(pending) == len(self._pending_docks):
+            self.removeDockWidget(panel)
+        self._pending_docks = pending
         del self.panels[panel_id]
         
+        if panel is self._settings_panel:
+            self._settings_panel = None
+        if panel is self._settings_sidebar:
+            self._settings_sidebar = None
+        
     def get_panel(self, panel_id: str) -> Optional[AbstractPanel]:
         """Get a panel by its ID.
         
@@ -161,45 +268,36 @@ class MainFrame(QMainWindow):
         # TODO: Implement file saving
         self.status_bar.showMessage("File -> Save clicked")
         
+    def _on_plugin_loaded(self, plugin_name: str):
+        """Cache the panels show_preferences dispatches to.
+        
+        Args:
+            plugin_name: Name of the plugin that was loaded
+        """
+        # Panels are checked by capability rather than class: plugin modules
+        # are loaded under their own names, so their classes are not the
+        # ones importable from plugins.core
+        settings_panel = self.get_panel("settings")
+        if settings_panel is not None and hasattr(settings_panel, "_show_preferences"):
+            self._settings_panel = settings_panel
+            
+        sidebar_panel = self.sidebar_panel
+        if sidebar_panel is not None and "settings" in getattr(sidebar_panel, "buttons", {}):
+            self._settings_sidebar = sidebar_panel
+            
     def show_preferences(self):
         """Show the preferences dialog."""
-        # Find the settings panel and open the preferences dialog
-        settings_panel = self.get_panel("settings")
-        if settings_panel:
-            from plugins.core.settings.plugin import SettingsPanel
-            if isinstance(settings_panel, SettingsPanel):
-                settings_panel._show_preferences()
-                return
+        # Open the preferences dialog from the settings panel
+        if self._settings_panel is not None:
+            self._settings_panel._show_preferences()
+            return
             
-        # If direct panel not found, try to find it in the sidebar
-        sidebar_panel = self.get_panel("sidebar_SidebarPanel")
-        from plugins.core.sidebar.plugin import SidebarPanel
-        if sidebar_panel and isinstance(sidebar_panel, SidebarPanel):
-            try:
-                sidebar_panel.set_active_panel("settings")
-                self.status_bar.showMessage("Settings panel activated in sidebar")
-                return
-            except Exception as e:
-                print(f"Failed to activate settings panel in sidebar: {str(e)}")
-                
-        # If no plugin manager, we're done
-        if not self.plugin_manager or not hasattr(self.plugin_manager, 'get_plugins'):
-            self.status_bar.showMessage("Settings panel not found")
+        # Otherwise activate the settings page in the sidebar
+        if self._settings_sidebar is not None:
+            self._settings_sidebar.set_active_panel("settings")
+            self.status_bar.showMessage("Settings panel activated in sidebar")
             return
             
-        # Try plugins as a last resort
-        try:
-            for plugin_id, plugin in self.plugin_manager.get_plugins().items():
-                if hasattr(plugin, 'get_sidebar_panel') and callable(plugin.get_sidebar_panel):
-                    sidebar_panel = plugin.get_sidebar_panel()
-                    if sidebar_panel and isinstance(sidebar_panel, SidebarPanel):
-                        sidebar_panel.set_active_panel("settings")
-                        self.status_bar.showMessage("Settings panel activated in sidebar")
-                        return
-        except Exception as e:
-            print(f"Error searching for settings panel: {str(e)}")
-        
-        # If we get here, no settings panel found
         self.status_bar.showMessage("Settings panel not found")
         
     def show_message(self, message: str, timeout: int = 5000):
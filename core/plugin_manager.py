@@ -4,18 +4,30 @@ Plugin Manager - Handles plugin discovery, loading, and lifecycle management.
 
 import os
 import sys
+import json
 import importlib
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
 
 from .abstract_panel import AbstractPanel
+from .lg import lg
+
+_log = lg.get_logger("plugins")
 
 
 class Plugin:
-    """Base class for all plugins."""
+    """Base class for all plugins.
+    
+    Attributes live in __slots__; subclasses should declare __slots__ for
+    their own attributes too, or they get a per-instance __dict__ again.
+    __weakref__ is kept so bound methods of plugins can be connected to Qt
+    signals.
+    """
+    
+    __slots__ = ("name", "version", "enabled", "main_window", "database_manager", "__weakref__")
     
     def __init__(self, name: str, version: str = "1.0.0"):
         """Initialize the plugin.
@@ -75,6 +87,39 @@ class Plugin:
         return []
 
 
+class PluginLoadTask(QRunnable):
+    """Imports and executes a plugin module on a worker thread.
+    
+    Only the module body runs here; the resulting module is passed back to
+    the GUI thread, where PluginManager._finalize_plugin creates the plugin
+    and its widgets.
+    """
+    
+    def __init__(self, manager: "PluginManager", plugin_path: str):
+        """Initialize the task.
+        
+        Args:
+            manager: Plugin manager that receives the imported module
+            plugin_path: Path to the plugin directory
+        """
+        super().__init__()
+        self.manager = manager
+        self.plugin_path = plugin_path
+        self.plugin_name = os.path.basename(plugin_path)
+        
+    def run(self):
+        """Import the plugin module and emit it to the GUI thread."""
+        try:
+            plugin_module = self.manager._import_plugin_module(self.plugin_name, self.plugin_path)
+            # Reading any attribute makes the lazy loader execute the module now
+            getattr(plugin_module, "__name__")
+        except Exception as e:
+            self.manager._plugin_import_failed.emit(self.plugin_path, str(e))
+            return
+            
+        self.manager._plugin_imported.emit(self.plugin_name, self.plugin_path, plugin_module)
+
+
 class PluginManager(QObject):
     """Manages plugin discovery, loading, and lifecycle."""
     
@@ -83,6 +128,10 @@ class PluginManager(QObject):
     plugin_unloaded = Signal(str)  # Plugin name
     plugin_error = Signal(str, str)  # Plugin name, error message
     
+    # Internal signals used by PluginLoadTask to hand results to the GUI thread
+    _plugin_imported = Signal(str, str, object)  # Plugin name, path, module
+    _plugin_import_failed = Signal(str, str)  # Plugin path, error message
+    
     def __init__(self):
         """Initialize the plugin manager."""
         super().__init__()
@@ -91,6 +140,18 @@ class PluginManager(QObject):
         self.database_manager = None
         self.plugins: Dict[str, Plugin] = {}
         self.plugin_directories = []
+        # Plugin directory -> "core" or "user"; unlisted directories count as user
+        self.plugin_directory_kinds: Dict[str, str] = {}
+        self._discovered_paths: Optional[List[Tuple[str, str]]] = None
+        # Discovery results persisted between runs; None disables the cache
+        self.discovery_cache_path: Optional[str] = os.path.join(
+            os.path.expanduser('~'), '.poeditor', 'plugin_cache.json'
+        )
+        
+        # Background imports for user plugins
+        self.thread_pool = QThreadPool(self)
+        self._plugin_imported.connect(self._finalize_plugin, Qt.QueuedConnection)
+        self._plugin_import_failed.connect(self._on_plugin_import_failed, Qt.QueuedConnection)
         
         # Set up plugin directories
         self._setup_plugin_directories()
@@ -103,11 +164,13 @@ class PluginManager(QObject):
         core_plugins_dir = project_root / "plugins" / "core"
         if core_plugins_dir.exists():
             self.plugin_directories.append(str(core_plugins_dir))
+            self.plugin_directory_kinds[str(core_plugins_dir)] = "core"
             
         # User plugins directory
         user_plugins_dir = project_root / "plugins" / "user"
         if user_plugins_dir.exists():
             self.plugin_directories.append(str(user_plugins_dir))
+            self.plugin_directory_kinds[str(user_plugins_dir)] = "user"
             
     def set_main_window(self, main_window):
         """Set the main window reference.
@@ -125,31 +188,149 @@ class PluginManager(QObject):
         """
         self.database_manager = database_manager
         
-    def discover_plugins(self) -> List[str]:
+    def discover_plugins(self, refresh: bool = False) -> List[Tuple[str, str]]:
         """Discover available plugins.
         
+        The result is cached in memory and in discovery_cache_path; later
+        calls and later runs reuse it unless refresh is True, a plugin
+        directory's mtime changed, or a cached plugin file changed.
+        
+        Args:
+            refresh: Rescan the plugin directories even if a result is cached
+        
         Returns:
-            List of plugin directory paths
+            List of (plugin directory path, "core" or "user") tuples
         """
+        if self._discovered_paths is not None and not refresh:
+            return list(self._discovered_paths)
+            
+        directory_state = self._directory_state()
+        if not refresh:
+            cached = self._load_discovery_cache(directory_state)
+            if cached is not None:
+                self._discovered_paths = cached
+                return list(cached)
+                
         plugin_paths = []
         
         for plugin_dir in self.plugin_directories:
-            if not os.path.exists(plugin_dir):
+            kind = self.plugin_directory_kinds.get(plugin_dir, "user")
+            try:
+                entries = os.scandir(plugin_dir)
+            except OSError:
                 continue
                 
-            for item in os.listdir(plugin_dir):
-                item_path = os.path.join(plugin_dir, item)
-                
-                if os.path.isdir(item_path):
-                    # Check if it's a valid plugin directory
-                    plugin_file = os.path.join(item_path, "plugin.py")
-                    init_file = os.path.join(item_path, "__init__.py")
-                    
-                    if os.path.exists(plugin_file) or os.path.exists(init_file):
-                        plugin_paths.append(item_path)
+            # DirEntry carries the type from the directory listing, so only
+            # the plugin.py / __init__.py checks cost a stat call
+            with entries:
+                for entry in entries:
+                    # Private and hidden entries (__pycache__, .git) are never plugins
+                    if entry.name.startswith(("_", ".")):
+                        continue
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                        
+                    # Check if it's a valid plugin directory; most plugins
+                    # have plugin.py, so __init__.py is only checked without it
+                    item_path = entry.path
+                    if os.path.exists(os.path.join(item_path, "plugin.py")):
+                        plugin_paths.append((item_path, kind))
+                    elif os.path.exists(os.path.join(item_path, "__init__.py")):
+                        plugin_paths.append((item_path, kind))
                         
+        self._discovered_paths = plugin_paths
+        self._save_discovery_cache(directory_state, plugin_paths)
+        return list(plugin_paths)
+        
+    def _directory_state(self) -> Dict[str, Dict[str, Any]]:
+        """Get the modification time and kind of each plugin directory.
+        
+        Returns:
+            Dictionary of directory path to {"mtime": nanoseconds or None, "kind": str}
+        """
+        state = {}
+        for plugin_dir in self.plugin_directories:
+            try:
+                mtime = os.stat(plugin_dir).st_mtime_ns
+            except OSError:
+                mtime = None
+            state[plugin_dir] = {"mtime": mtime, "kind": self.plugin_directory_kinds.get(plugin_dir, "user")}
+        return state
+        
+    @staticmethod
+    def _plugin_file(plugin_path: str) -> str:
+        """Get the file that defines a discovered plugin.
+        
+        Args:
+            plugin_path: Path to the plugin directory
+            
+        Returns:
+            Path to plugin.py, or to __init__.py if there is no plugin.py
+        """
+        plugin_file = os.path.join(plugin_path, "plugin.py")
+        if os.path.exists(plugin_file):
+            return plugin_file
+        return os.path.join(plugin_path, "__init__.py")
+        
+    def _load_discovery_cache(self, directory_state: Dict[str, Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+        """Read discovery results saved by a previous run.
+        
+        Args:
+            directory_state: Current state of the plugin directories
+            
+        Returns:
+            List of (path, kind) tuples, or None if there is no valid cache
+        """
+        if not self.discovery_cache_path:
+            return None
+            
+        try:
+            with open(self.discovery_cache_path, 'r', encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+            
+        if not isinstance(cache, dict) or cache.get("directories") != directory_state:
+            return None
+            
+        plugin_paths = []
+        try:
+            for entry in cache["plugins"]:
+                if os.stat(entry["plugin_file"]).st_mtime_ns != entry["mtime"]:
+                    return None
+                plugin_paths.append((entry["path"], entry["kind"]))
+        except (OSError, KeyError, TypeError):
+            return None
+            
         return plugin_paths
         
+    def _save_discovery_cache(self, directory_state: Dict[str, Dict[str, Any]], plugin_paths: List[Tuple[str, str]]):
+        """Save discovery results for the next run.
+        
+        Args:
+            directory_state: State of the plugin directories when scanned
+            plugin_paths: The discovered (path, kind) tuples
+        """
+        if not self.discovery_cache_path:
+            return
+            
+        try:
+            plugins = []
+            for plugin_path, kind in plugin_paths:
+                plugin_file = self._plugin_file(plugin_path)
+                plugins.append({
+                    "path": plugin_path,
+                    "kind": kind,
+                    "plugin_file": plugin_file,
+                    "mtime": os.stat(plugin_file).st_mtime_ns,
+                })
+            cache = {"directories": directory_state, "plugins": plugins}
+            os.makedirs(os.path.dirname(self.discovery_cache_path), exist_ok=True)
+            with open(self.discovery_cache_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(cache, cache_file)
+        except OSError as e:
+            _log.debug("Could not save plugin discovery cache: %s", e)
+        
     def load_plugin(self, plugin_path: str) -> bool:
         """Load a plugin from the given path.
         
@@ -159,40 +340,58 @@ class PluginManager(QObject):
         Returns:
             True if loaded successfully, False otherwise
         """
+        plugin_name = os.path.basename(plugin_path)
         try:
-            plugin_name = os.path.basename(plugin_path)
+            # Import the plugin module; its body runs on first attribute access
+            plugin_module = self._import_plugin_module(plugin_name, plugin_path)
+        except Exception as e:
+            self._report_load_failure(plugin_path, e)
+            return False
             
-            # Add plugin path to sys.path temporarily
-            if plugin_path not in sys.path:
-                sys.path.insert(0, plugin_path)
-                
-            # Try to import the plugin
-            plugin_module = None
+        return self._finalize_plugin(plugin_name, plugin_path, plugin_module)
+        
+    def load_plugin_async(self, plugin_path: str):
+        """Import a plugin on the thread pool and finish loading it later.
+        
+        The module is imported and executed by a PluginLoadTask; the plugin
+        instance and its panels are created in _finalize_plugin once the
+        module has been handed back to the GUI thread.
+        
+        Args:
+            plugin_path: Path to the plugin directory
+        """
+        self.thread_pool.start(PluginLoadTask(self, plugin_path))
+        
+    def wait_for_plugins(self, msecs: int = -1) -> bool:
+        """Block until all queued plugin imports have finished.
+        
+        Finalization still requires the event loop to deliver the queued
+        _plugin_imported / _plugin_import_failed signals.
+        
+        Args:
+            msecs: Maximum time to wait in milliseconds, -1 for no limit
             
-            # First try plugin.py
-            plugin_file = os.path.join(plugin_path, "plugin.py")
-            if os.path.exists(plugin_file):
-                spec = importlib.util.spec_from_file_location(
-                    f"{plugin_name}_plugin", plugin_file
-                )
-                if spec is None or spec.loader is None:
-                    raise ImportError(f"Failed to create module spec for {plugin_name}")
-                plugin_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(plugin_module)
-            else:
-                # Try importing as a package
-                plugin_module = importlib.import_module(plugin_name)
-                
-            # Look for plugin class
-            plugin_class = None
-            for attr_name in dir(plugin_module):
-                attr = getattr(plugin_module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, Plugin) and 
-                    attr != Plugin):
-                    plugin_class = attr
-                    break
-                    
+        Returns:
+            True if all imports finished, False on timeout
+        """
+        return self.thread_pool.waitForDone(msecs)
+        
+    @Slot(str, str, object)
+    def _finalize_plugin(self, plugin_name: str, plugin_path: str, plugin_module) -> bool:
+        """Instantiate, load and register a plugin from its imported module.
+        
+        Runs on the GUI thread, since the plugin creates its panel widgets here.
+        
+        Args:
+            plugin_name: Name of the plugin (directory name)
+            plugin_path: Path to the plugin directory
+            plugin_module: The imported plugin module
+            
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        try:
+            plugin_class = self._find_plugin_class(plugin_name, plugin_module)
             if not plugin_class:
                 raise ImportError(f"No plugin class found in {plugin_name}")
                 
@@ -208,7 +407,8 @@ class PluginManager(QObject):
                 if self.main_window:
                     panels = plugin_instance.get_panels()
                     for panel in panels:
-                        panel_id = f"{plugin_name}_{panel.__class__.__name__}"
+                        # Interned: panel ids are dictionary keys looked up on every panel switch
+                        panel_id = sys.intern(f"{plugin_name}_{panel.__class__.__name__}")
                         panel.set_panel_id(panel_id)
                         # Special handling for sidebar - don't register individual panels
                         if plugin_name == "sidebar":
@@ -218,18 +418,115 @@ class PluginManager(QObject):
                             self.main_window.register_panel(panel_id, panel)
                     
                 self.plugin_loaded.emit(plugin_name)
-                print(f"Plugin '{plugin_name}' loaded successfully")
+                _log.info("Plugin %r loaded successfully", plugin_name)
                 return True
             else:
                 self.plugin_error.emit(plugin_name, "Plugin load() method returned False")
                 return False
                 
         except Exception as e:
-            error_msg = f"Failed to load plugin from {plugin_path}: {str(e)}"
-            print(error_msg)
-            self.plugin_error.emit(os.path.basename(plugin_path), error_msg)
+            self._report_load_failure(plugin_path, e)
             return False
             
+    def _find_plugin_class(self, plugin_name: str, plugin_module) -> Optional[type]:
+        """Find the Plugin subclass exported by a plugin module.
+        
+        By convention the class name ends with "Plugin". Names listed in the
+        module's __all__ are checked first, then the name derived from the
+        plugin directory (file_explorer -> FileExplorerPlugin). Only if both
+        fail is the whole module namespace scanned.
+        
+        Args:
+            plugin_name: Name of the plugin (directory name)
+            plugin_module: The imported plugin module
+            
+        Returns:
+            The plugin class, or None if the module does not define one
+        """
+        def is_plugin_class(attr) -> bool:
+            return isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin
+            
+        exported = getattr(plugin_module, "__all__", None) or []
+        candidates = [name for name in exported if name.endswith("Plugin")]
+        candidates.append("".join(part.capitalize() for part in plugin_name.split("_")) + "Plugin")
+        
+        for name in candidates:
+            attr = getattr(plugin_module, name, None)
+            if is_plugin_class(attr):
+                return attr
+                
+        # Fall back to scanning every attribute
+        for attr_name in dir(plugin_module):
+            attr = getattr(plugin_module, attr_name)
+            if is_plugin_class(attr):
+                return attr
+                
+        return None
+        
+    @Slot(str, str)
+    def _on_plugin_import_failed(self, plugin_path: str, error: str):
+        """Report a plugin whose background import raised.
+        
+        Args:
+            plugin_path: Path to the plugin directory
+            error: Description of the import error
+        """
+        self._report_load_failure(plugin_path, error)
+        
+    def _report_load_failure(self, plugin_path: str, error):
+        """Log and emit an error for a plugin that failed to load.
+        
+        Args:
+            plugin_path: Path to the plugin directory
+            error: The exception (or its message) that caused the failure
+        """
+        # Drop a half-executed lazy module so a retry imports it afresh
+        sys.modules.pop(f"{os.path.basename(plugin_path)}_plugin", None)
+        error_msg = f"Failed to load plugin from {plugin_path}: {str(error)}"
+        _log.error(error_msg)
+        self.plugin_error.emit(os.path.basename(plugin_path), error_msg)
+        
+    def _import_plugin_module(self, plugin_name: str, plugin_path: str):
+        """Create a lazily executed module for a plugin directory.
+        
+        The spec's loader is wrapped in importlib.util.LazyLoader, so the
+        module body is only executed when one of its attributes is first read.
+        
+        Args:
+            plugin_name: Name of the plugin (directory name)
+            plugin_path: Path to the plugin directory
+            
+        Returns:
+            The (not yet executed) plugin module
+        """
+        # First try plugin.py, then the directory as a package. The plugin
+        # directory is the module's search location, so imports relative to
+        # the plugin resolve without adding it to sys.path
+        plugin_file = os.path.join(plugin_path, "plugin.py")
+        if os.path.exists(plugin_file):
+            spec = importlib.util.spec_from_file_location(
+                f"{plugin_name}_plugin", plugin_file,
+                submodule_search_locations=[plugin_path]
+            )
+        else:
+            spec = importlib.util.spec_from_file_location(
+                plugin_name, os.path.join(plugin_path, "__init__.py"),
+                submodule_search_locations=[plugin_path]
+            )
+            
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Failed to create module spec for {plugin_name}")
+            
+        existing = sys.modules.get(spec.name)
+        if existing is not None:
+            return existing
+            
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        plugin_module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = plugin_module
+        spec.loader.exec_module(plugin_module)
+        return plugin_module
+        
     def unload_plugin(self, plugin_name: str) -> bool:
         """Unload a plugin.
         
@@ -249,14 +546,14 @@ class PluginManager(QObject):
             if self.main_window:
                 panels = plugin.get_panels()
                 for panel in panels:
-                    panel_id = f"{plugin_name}_{panel.__class__.__name__}"
+                    panel_id = sys.intern(f"{plugin_name}_{panel.__class__.__name__}")
                     self.main_window.unregister_panel(panel_id)
                 
             # Unload the plugin
             if plugin.unload():
                 del self.plugins[plugin_name]
                 self.plugin_unloaded.emit(plugin_name)
-                print(f"Plugin '{plugin_name}' unloaded successfully")
+                _log.info("Plugin %r unloaded successfully", plugin_name)
                 return True
             else:
                 self.plugin_error.emit(plugin_name, "Plugin unload() method returned False")
@@ -264,7 +561,7 @@ class PluginManager(QObject):
                 
         except Exception as e:
             error_msg = f"Failed to unload plugin '{plugin_name}': {str(e)}"
-            print(error_msg)
+            _log.error(error_msg)
             self.plugin_error.emit(plugin_name, error_msg)
             return False
             
@@ -273,11 +570,27 @@ class PluginManager(QObject):
         plugin_paths = self.discover_plugins()
         
         # Load core plugins first
-        core_plugins = [p for p in plugin_paths if "plugins/core" in p]
-        user_plugins = [p for p in plugin_paths if "plugins/user" in p]
-        
-        for plugin_path in core_plugins + user_plugins:
-            self.load_plugin(plugin_path)
+        core_plugins = []
+        user_plugins = []
+        for plugin_path, kind in plugin_paths:
+            (core_plugins if kind == "core" else user_plugins).append(plugin_path)
+        
+        # Core plugins build the main UI, so they are loaded synchronously,
+        # with their panels docked in one layout pass
+        batch = hasattr(self.main_window, 'begin_batch')
+        if batch:
+            self.main_window.begin_batch()
+        try:
+            for plugin_path in core_plugins:
+                self.load_plugin(plugin_path)
+        finally:
+            if batch:
+                self.main_window.end_batch()
+            
+        # User plugins are imported in the background and finalized on the
+        # GUI thread as each import completes
+        for plugin_path in user_plugins:
+            self.load_plugin_async(plugin_path)
             
     def get_plugin(self, plugin_name: str) -> Optional[Plugin]:
         """Get a plugin by name.
@@ -2,20 +2,47 @@
 Sidebar Widget - Modern IDE-style sidebar with toggle buttons and panels
 """
 
+import sys
 from typing import Dict, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget,
     QSplitter, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
 from PySide6.QtGui import QIcon, QPalette
 
 from .abstract_panel import AbstractPanel
 
 
+# Stylesheet for the sidebar's button column, inherited by every SidebarButton
+BUTTON_CONTAINER_STYLE = """
+    QFrame {
+        background-color: #2d2d2d;
+        border-right: 1px solid #404040;
+    }
+    QPushButton {
+        border: none;
+        background-color: transparent;
+        color: #cccccc;
+        font-size: 12px;
+        padding: 8px;
+    }
+    QPushButton:hover {
+        background-color: #404040;
+    }
+    QPushButton:checked {
+        background-color: #0078d4;
+        color: white;
+    }
+"""
+
+
 class SidebarButton(QPushButton):
     """Custom button for sidebar navigation."""
     
+    # Shared by every button instead of building a QSize per instance
+    _FIXED_SIZE = QSize(40, 40)
+    
     def __init__(self, text: str, icon_path: Optional[str] = None, parent=None):
         """Initialize sidebar button.
         
@@ -38,26 +65,9 @@ class SidebarButton(QPushButton):
         """Set up button appearance and properties."""
         self.setText(self.button_text)
         self.setCheckable(True)
-        self.setFixedSize(QSize(40, 40))
+        self.setFixedSize(self._FIXED_SIZE)
         self.setToolTip(self.button_text)
-        
-        # Set style
-        self.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                color: #cccccc;
-                font-size: 12px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #404040;
-            }
-            QPushButton:checked {
-                background-color: #0078d4;
-                color: white;
-            }
-        """)
+        # Styled by BUTTON_CONTAINER_STYLE on the sidebar's button container
         
     def set_active(self, active: bool):
         """Set button active state.
@@ -74,7 +84,7 @@ class SidebarButton(QPushButton):
         Args:
             panel_id: ID of the panel this button controls
         """
-        self.panel_id = panel_id
+        self.panel_id = sys.intern(panel_id)
 
 
 class SidebarWidget(QWidget):
@@ -92,6 +102,8 @@ class SidebarWidget(QWidget):
         self.buttons: Dict[str, SidebarButton] = {}
         self.panels: Dict[str, AbstractPanel] = {}
         self.current_panel_id = ""
+        self._active_button: Optional[SidebarButton] = None
+        self._container_show_pending = False
         self.is_sidebar_visible = True
         self.sidebar_width = 250
         
@@ -114,12 +126,9 @@ class SidebarWidget(QWidget):
         # Configure button container
         self.button_container.setFixedWidth(50)
         self.button_container.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.button_container.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border-right: 1px solid #404040;
-            }
-        """)
+        # One stylesheet for the container and all of its buttons, so it is
+        # parsed once rather than per button
+        self.button_container.setStyleSheet(BUTTON_CONTAINER_STYLE)
         
         # Set button layout on container
         self.button_container.setLayout(self.button_layout)
@@ -158,12 +167,14 @@ class SidebarWidget(QWidget):
         Returns:
             The created button
         """
+        # Interned so the per-click lookups compare keys by identity
+        panel_id = sys.intern(panel_id)
         if panel_id in self.buttons:
             return self.buttons[panel_id]
             
         button = SidebarButton(text, icon_path)
         button.set_panel_id(panel_id)
-        button.clicked.connect(lambda: self._on_button_clicked(panel_id))
+        button.clicked.connect(self._on_button_clicked)
         
         self.buttons[panel_id] = button
         
@@ -180,6 +191,7 @@ class SidebarWidget(QWidget):
             panel_id: Unique ID for the panel
             panel: Panel widget to add
         """
+        panel_id = sys.intern(panel_id)
         if panel_id in self.panels:
             return
             
@@ -201,6 +213,8 @@ class SidebarWidget(QWidget):
         
         if panel_id in self.buttons:
             button = self.buttons[panel_id]
+            if button is self._active_button:
+                self._active_button = None
             self.button_layout.removeWidget(button)
             button.deleteLater()
             del self.buttons[panel_id]
@@ -218,35 +232,65 @@ class SidebarWidget(QWidget):
         if panel_id not in self.panels:
             return
             
-        # Deactivate all buttons
-        for button in self.buttons.values():
-            button.set_active(False)
+        # Batch the button and page changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Only the previously active and the newly selected buttons change
+            self._set_active_button(self.buttons.get(panel_id))
             
-        # Activate the selected button
-        if panel_id in self.buttons:
-            self.buttons[panel_id].set_active(True)
+            # Switch pages silently; panel_requested below reports the change
+            panel = self.panels[panel_id]
+            self.stacked_widget.blockSignals(True)
+            self.stacked_widget.setCurrentWidget(panel)
+            self.stacked_widget.blockSignals(False)
+            self.current_panel_id = panel_id
             
-        # Show the panel
-        panel = self.panels[panel_id]
-        self.stacked_widget.setCurrentWidget(panel)
-        self.panel_container.show()
-        self.current_panel_id = panel_id
+            # Show the container on the next event-loop pass so it is laid
+            # out once, together with the new page
+            if self.panel_container.isHidden() and not self._container_show_pending:
+                self._container_show_pending = True
+                QTimer.singleShot(0, self._show_panel_container)
+        finally:
+            self.setUpdatesEnabled(True)
         
         self.panel_requested.emit(panel_id)
         
     def hide_panel(self):
         """Hide the current panel."""
-        # Deactivate all buttons
-        for button in self.buttons.values():
-            button.set_active(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_active_button(None)
+            self.panel_container.hide()
+        finally:
+            self.setUpdatesEnabled(True)
             
-        self.panel_container.hide()
         current_id = self.current_panel_id
         self.current_panel_id = ""
         
         if current_id:
             self.panel_hidden.emit(current_id)
             
+    def _show_panel_container(self):
+        """Show the panel container unless the panel was hidden meanwhile."""
+        self._container_show_pending = False
+        if self.current_panel_id:
+            self.panel_container.show()
+            
+    def _set_active_button(self, button: Optional[SidebarButton]):
+        """Make a button the only active one.
+        
+        Args:
+            button: Button to activate, or None to deactivate the current one
+        """
+        if button is self._active_button:
+            return
+            
+        if self._active_button is not None:
+            self._active_button.set_active(False)
+        if button is not None:
+            button.set_active(True)
+        self._active_button = button
+        
     def toggle_panel(self, panel_id: str):
         """Toggle a panel's visibility.
         
@@ -258,13 +302,16 @@ class SidebarWidget(QWidget):
         else:
             self.show_panel(panel_id)
             
-    def _on_button_clicked(self, panel_id: str):
-        """Handle button click.
+    @Slot()
+    def _on_button_clicked(self):
+        """Handle a click on any sidebar button.
         
-        Args:
-            panel_id: ID of the clicked panel
+        The panel is identified from the sending button's panel_id, so all
+        buttons share this one slot instead of a closure each.
         """
-        self.toggle_panel(panel_id)
+        button = self.sender()
+        if isinstance(button, SidebarButton):
+            self.toggle_panel(button.panel_id)
         
     def get_current_panel_id(self) -> str:
         """Get the currently visible panel ID.
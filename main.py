@@ -13,11 +13,6 @@ from PySide6.QtCore import QDir
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from core.main_frame import MainFrame
-from core.plugin_manager import PluginManager
-from core.database_manager import DatabaseManager
-from styles.vscode_theme import GLOBAL_STYLESHEET
-
 
 def main():
     """Main entry point for the PO Editor application."""
@@ -26,12 +21,19 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("PO Editor Team")
     
-    # Apply global stylesheet
-    app.setStyleSheet(GLOBAL_STYLESHEET)
+    # Application modules are imported once QApplication exists, so the
+    # interpreter and Qt start up before the heavier imports run
+    from core.main_frame import MainFrame
+    from core.plugin_manager import PluginManager
+    from core.database_manager import DatabaseManager
+    from core.lg import lg
+    from styles.vscode_theme import GLOBAL_STYLESHEET
     
-    # Initialize database
+    # Drain and stop the background log listener on exit
+    app.aboutToQuit.connect(lg.shutdown)
+    
+    # Create the database manager; it is opened off the GUI thread below
     db_manager = DatabaseManager()
-    db_manager.initialize()
     
     # Initialize plugin manager
     plugin_manager = PluginManager()
@@ -39,12 +41,22 @@ def main():
     # Create main window
     main_window = MainFrame(plugin_manager, db_manager)
     
-    # Load plugins
-    plugin_manager.set_main_window(main_window)
-    plugin_manager.discover_and_load_plugins()
+    # Apply global stylesheet once the window exists, so the whole tree is
+    # polished in a single pass instead of widget by widget during construction
+    app.setStyleSheet(GLOBAL_STYLESHEET)
     
-    # Show main window
+    # Show main window and let it paint before plugins are loaded
     main_window.show()
+    app.processEvents()
+    
+    # Open the database on a worker thread and load plugins once it is done,
+    # so first paint does not wait on schema setup
+    plugin_manager.set_main_window(main_window)
+    main_window.show_message("Loading database…", 0)
+    db_manager.database_connected.connect(main_window.show_ready)
+    db_manager.database_error.connect(main_window.show_message)
+    db_manager.initialization_finished.connect(plugin_manager.discover_and_load_plugins)
+    db_manager.initialize_async()
     
     # Run application
     return app.exec()
@@ -5,18 +5,132 @@ Enhanced File Explorer Plugin - Integrates with sidebar system.
 from PySide6.QtWidgets import (
     QTreeView, QVBoxLayout, QWidget, QFileSystemModel, QHeaderView,
     QHBoxLayout, QPushButton, QLineEdit, QLabel, QMenu,
-    QToolButton, QToolTip, QApplication, QAbstractItemView
+    QToolButton, QToolTip, QApplication, QAbstractItemView, QFileIconProvider
+)
+from PySide6.QtCore import (
+    QDir, QFileInfo, QObject, QRunnable, QThreadPool, Signal, Slot, Qt, QPoint, QSize,
+    QTimer, QUrl, QSettings
 )
-from PySide6.QtCore import QDir, Signal, Qt, QPoint, QSize, QTimer, QUrl, QSettings
 from PySide6.QtGui import QIcon, QCursor, QDesktopServices, QAction, QActionGroup
 import os
+import re
+import json
 import glob
+import functools
+from contextlib import contextmanager
 import pathlib
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict, deque
+from typing import List, Optional, Dict, Any, Tuple, Deque, Iterator
 
 
 from core.plugin_manager import Plugin
 from core.abstract_panel import AbstractPanel
+from plugins.core.file_explorer.scandir_model import ScandirTreeModel
+
+
+# QSettings group and keys of the explorer's saved state
+_SETTINGS_GROUP = "explorer"
+_KEY_CURRENT_PATH = "current_path"
+_KEY_SHOW_HIDDEN = "show_hidden"
+_KEY_VIEW_MODE = "view_mode"
+_KEY_ACTIVE_COLUMNS = "active_columns"
+_KEY_SORT_COLUMN = "sort_column"
+_KEY_SORT_ORDER = "sort_order"
+_KEY_HISTORY = "history"
+_KEY_HISTORY_INDEX = "history_index"
+_KEY_SCANDIR_MODEL = "scandir_model"
+
+# Matches any glob metacharacter; bound search avoids attribute lookups per keystroke
+_find_glob_char = re.compile(r"[*?\[\]]").search
+
+
+@functools.lru_cache(maxsize=1)
+def _home_directory() -> str:
+    """Return the user's home directory, resolved once per process.
+    
+    Call ``_home_directory.cache_clear()`` after changing HOME (e.g. in tests).
+    
+    Returns:
+        Home directory path
+    """
+    return os.path.expanduser("~")
+
+
+def _expand_home(path: str) -> str:
+    """Expand a leading ~ using the cached home directory.
+    
+    Args:
+        path: Path that may start with ~ or ~user
+    
+    Returns:
+        Path with the home directory substituted
+    """
+    if path == "~" or path.startswith(("~/", "~" + os.sep)):
+        return _home_directory() + path[1:]
+    return os.path.expanduser(path)  # ~user forms need the password database
+
+
+@functools.lru_cache(maxsize=128)
+def _display_name(path: str) -> str:
+    """Return the name shown for a directory in the path editor.
+    
+    Cached, as back/forward navigation keeps revisiting the same paths.
+    
+    Args:
+        path: Directory path
+    
+    Returns:
+        The directory's basename, or the path itself for a root such as "/"
+    """
+    return os.path.basename(path) or path
+
+
+def _split_glob_pattern(pattern: str):
+    """Split a glob into its literal directory prefix and its name pattern.
+    
+    ``~/src/**/*.py`` gives ``("~/src", "*.py")``: the prefix is everything
+    before the first directory level containing a glob character, so
+    matching can be anchored there instead of walking sibling trees.
+    
+    Args:
+        pattern: Glob pattern, optionally with directory parts
+    
+    Returns:
+        Tuple of (directory prefix or "", last path component)
+    """
+    match = _find_glob_char(pattern)
+    literal = pattern[:match.start()] if match else pattern
+    return os.path.dirname(literal), os.path.basename(pattern)
+
+
+class GenericFileIconProvider(QFileIconProvider):
+    """Icon provider that returns one shared folder or file icon.
+    
+    The default provider resolves a MIME type per entry to pick its icon;
+    the explorer only needs to tell folders from files, so the two generic
+    icons are looked up once and reused for every entry.
+    """
+    
+    def __init__(self):
+        """Initialize the icon provider."""
+        super().__init__()
+        
+        # Initialize all attributes in __init__
+        self._folder_icon = super().icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = super().icon(QFileIconProvider.IconType.File)
+        
+    def icon(self, info):
+        """Return the icon for a file info or icon type.
+        
+        Args:
+            info: QFileInfo of the entry, or a QFileIconProvider.IconType
+            
+        Returns:
+            QIcon for the entry
+        """
+        if isinstance(info, QFileInfo):
+            return self._folder_icon if info.isDir() else self._file_icon
+        return super().icon(info)
 
 
 class NavigationHistory:
@@ -28,9 +142,11 @@ class NavigationHistory:
         Args:
             max_history: Maximum number of history entries
         """
-        self.history: List[str] = []
+        # The deque drops the oldest entry itself once max_history is reached
+        self.history: Deque[str] = deque(maxlen=max_history)
         self.current_index: int = -1
         self.max_history: int = max_history
+        self.dirty: bool = False  # Changed since it was last saved
         
     def add_path(self, path: str) -> None:
         """Add a new path to the history.
@@ -44,17 +160,13 @@ class NavigationHistory:
             
         # If we navigated back and then to a new location,
         # remove the forward history
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
             
-        # Add the new path
+        # Add the new path (evicting the oldest one when full)
         self.history.append(path)
         self.current_index = len(self.history) - 1
-        
-        # Trim if history exceeds max size
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
-            self.current_index = len(self.history) - 1
+        self.dirty = True
     
     def go_back(self) -> Optional[str]:
         """Go back in history.
@@ -64,6 +176,7 @@ class NavigationHistory:
         """
         if self.can_go_back():
             self.current_index -= 1
+            self.dirty = True
             return self.history[self.current_index]
         return None
     
@@ -75,6 +188,7 @@ class NavigationHistory:
         """
         if self.can_go_forward():
             self.current_index += 1
+            self.dirty = True
             return self.history[self.current_index]
         return None
     
@@ -110,7 +224,104 @@ class NavigationHistory:
         Returns:
             List of history entries
         """
-        return self.history.copy()
+        return list(self.history)
+        
+    def remove_paths(self, paths) -> bool:
+        """Drop entries for the given paths, keeping the current position.
+        
+        The current index stays on the same entry if it is kept, otherwise
+        it moves to the nearest earlier remaining entry.
+        
+        Args:
+            paths: Collection of paths to remove
+            
+        Returns:
+            True if any entry was removed
+        """
+        kept = deque(maxlen=self.max_history)
+        current_index = -1
+        for index, path in enumerate(self.history):
+            if path not in paths:
+                kept.append(path)
+            if index == self.current_index:
+                current_index = len(kept) - 1
+        if len(kept) == len(self.history):
+            return False
+        self.history = kept
+        self.current_index = max(current_index, 0) if kept else -1
+        self.dirty = True
+        return True
+
+
+class DirectoryCountSignals(QObject):
+    """Carries DirectoryCountTask results back to the GUI thread."""
+    
+    counted = Signal(str, object)  # Path, (mtime_ns, visible, hidden) or None
+
+
+class DirectoryCountTask(QRunnable):
+    """Counts a directory's entries on a worker thread.
+    
+    stat() and scandir() can block for a long time on slow or network
+    mounts, so they run here instead of in the event loop.
+    """
+    
+    def __init__(self, path: str, cached: Optional[Tuple[int, int, int]],
+                 signals: DirectoryCountSignals):
+        """Initialize the task.
+        
+        Args:
+            path: Directory to count
+            cached: Last known (mtime_ns, visible, hidden) for the path, if any
+            signals: Signals object that receives the result
+        """
+        super().__init__()
+        self.path = path
+        self.cached = cached
+        self.signals = signals
+        
+    def run(self):
+        """Count the directory and emit the result."""
+        entry = FileExplorerWidget._scan_counts(self.path, self.cached)
+        try:
+            self.signals.counted.emit(self.path, entry)
+        except RuntimeError:
+            # The explorer was destroyed while the scan was running
+            pass
+
+
+class HistoryCheckSignals(QObject):
+    """Carries HistoryCheckTask results back to the GUI thread."""
+    
+    checked = Signal(object)  # Set of history paths that are no longer directories
+
+
+class HistoryCheckTask(QRunnable):
+    """Finds saved history paths that no longer exist, on a worker thread.
+    
+    Checking every entry costs a stat() each, which can stall startup on
+    a cold cache or a network share.
+    """
+    
+    def __init__(self, paths: List[str], signals: HistoryCheckSignals):
+        """Initialize the task.
+        
+        Args:
+            paths: History paths to check
+            signals: Signals object that receives the result
+        """
+        super().__init__()
+        self.paths = paths
+        self.signals = signals
+        
+    def run(self):
+        """Check the paths and emit the missing ones."""
+        missing = FileExplorerWidget._missing_directories(self.paths)
+        try:
+            self.signals.checked.emit(missing)
+        except RuntimeError:
+            # The explorer was destroyed while the check was running
+            pass
 
 
 class FileExplorerWidget(QWidget):
@@ -120,88 +331,182 @@ class FileExplorerWidget(QWidget):
     file_selected = Signal(str)  # File path selected
     directory_changed = Signal(str)  # Directory changed
     
+    # Number of directories whose tooltip entry counts are remembered
+    COUNT_CACHE_SIZE = 64
+    
+    # View menu entries: (view mode, label)
+    VIEW_MODE_LABELS = (
+        ("list", "As List"),
+        ("icons", "As Icon and Text"),
+        ("columns", "As Columns"),
+        ("gallery", "As Gallery"),
+    )
+    
+    # Add Columns entries: (column id, label, model column index)
+    OPTIONAL_COLUMNS = (
+        ("date_modified", "Date Modified", 3),
+        ("date_created", "Date Created", 4),
+        ("kind", "Kind", 2),
+        ("size", "Size", 1),
+    )
+    
+    # Section width applied when a column is shown (others get 100)
+    COLUMN_WIDTHS = {
+        "name": 200,
+        "size": 80,
+        "kind": 100,
+        "date_modified": 120,
+        "date_created": 120,
+    }
+    
     def __init__(self, parent=None):
         """Initialize the file explorer widget."""
         super().__init__(parent)
         
         # Initialize all attributes in __init__
         self.tree_view = QTreeView()
-        self.file_model = QFileSystemModel()
+        self._header = self.tree_view.header()  # The view keeps this header for its lifetime
+        self.settings = QSettings("POEditor", "Settings")
+        self.file_model = self._create_file_model()
+        self._column_count = self.file_model.columnCount()  # Fixed for both models
+        self.icon_provider = GenericFileIconProvider()
         self.path_edit = QLineEdit()
         self.refresh_button = QToolButton()
         self.nav_button = QToolButton()
-        self.settings = QSettings("POEditor", "Settings")
         self.navigation_history = NavigationHistory()
         
         # Store the current working directory at app launch
         self.app_launch_directory = os.getcwd()
         
-        # Get home folder as default path
-        default_path = os.path.expanduser("~")
-        self.current_path = default_path
+        # Resolve the home folder once; it is the default path
+        self.home_directory = _home_directory()
+        self.current_path = self.home_directory
+        
+        # Read the saved state in one pass over the explorer settings group
+        # (value() returns None for missing keys)
+        settings = self.settings
+        settings.beginGroup(_SETTINGS_GROUP)
+        saved_path = settings.value(_KEY_CURRENT_PATH)
+        self.show_hidden_files = settings.value(_KEY_SHOW_HIDDEN, False, type=bool)
+        saved_view_mode = settings.value(_KEY_VIEW_MODE)
+        saved_columns = settings.value(_KEY_ACTIVE_COLUMNS)
+        saved_sort_column = settings.value(_KEY_SORT_COLUMN)
+        settings.endGroup()
         
-        # Try to get saved path from settings
-        if self.settings.contains("explorer/current_path"):
-            saved_path = self.settings.value("explorer/current_path")
-            if saved_path and os.path.exists(str(saved_path)):
-                self.current_path = str(saved_path)
+        # Saved path, if it still exists
+        if saved_path and os.path.exists(str(saved_path)):
+            self.current_path = str(saved_path)
         
-        # Initialize settings with proper types
-        self.show_hidden_files = False
-        if self.settings.contains("explorer/show_hidden"):
-            self.show_hidden_files = self.settings.value("explorer/show_hidden", type=bool)
+        # Model filter flags, kept in sync with show_hidden_files
+        self._recompute_dir_filter()
         
         self.path_filter = ""
         
         # View mode (with safe fallback)
         self.view_mode = "list"
-        if self.settings.contains("explorer/view_mode"):
-            view_mode = self.settings.value("explorer/view_mode")
-            if view_mode in ["list", "icons", "columns", "gallery"]:
-                self.view_mode = str(view_mode)
+        if saved_view_mode in ["list", "icons", "columns", "gallery"]:
+            self.view_mode = str(saved_view_mode)
         
         # Active columns
         self.active_columns = ["name", "size"]
-        if self.settings.contains("explorer/active_columns"):
-            columns = self.settings.value("explorer/active_columns")
-            if isinstance(columns, list):
-                self.active_columns = [str(col) for col in columns]
+        if isinstance(saved_columns, list):
+            self.active_columns = [str(col) for col in saved_columns]
         
         # Sort settings
         self.current_sort_column = 0
-        if self.settings.contains("explorer/sort_column"):
+        if saved_sort_column is not None:
             try:
-                self.current_sort_column = int(self.settings.value("explorer/sort_column"))
+                self.current_sort_column = int(saved_sort_column)
             except (ValueError, TypeError):
                 pass
                 
         self.current_sort_order = Qt.SortOrder.AscendingOrder
         self.sort_actions = []  # Will store sort actions for menu
+        self._checked_sort_index: Optional[int] = None  # Sort action currently checked
         self.filter_timer = QTimer(self)
         self.filter_timer.setSingleShot(True)
         self.filter_timer.setInterval(300)  # 300ms debounce for filtering
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)  # Coalesce back-to-back refreshes
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(30)  # Coalesce rapid selections
+        self._pending_selection = None
+        self._count_cache = OrderedDict()  # path -> (mtime_ns, visible, hidden)
+        self._count_signals = DirectoryCountSignals(self)
+        self._history_check_signals = HistoryCheckSignals(self)
+        self._view_menu = None  # Built in _setup_navigation_menu
+        self._root_loaded = False  # Set by _ensure_root_loaded on first show
+        self._header_menu = None  # Built on first header right-click
+        self._tooltip_timer = QTimer(self)
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.setInterval(250)  # Coalesce tooltip recounts
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(1000)  # One settings write per burst of changes
         
         self._setup_ui()
         self._connect_signals()
-        self._setup_sorting()
         self._load_history()
         
         # Apply the saved view mode after UI setup
         self._set_view_mode(self.view_mode)
         
-        # Initialize with the current path 
-        # Use direct model access first to ensure model is ready
-        self.file_model.setRootPath(self.current_path)
-        self.tree_view.setRootIndex(self.file_model.index(self.current_path))
-        
-        # Display basename in path editor
-        basename = os.path.basename(self.current_path) or self.current_path
-        self.path_edit.setText(basename)
+        # Display basename in path editor; the directory itself is only
+        # loaded into the model when the widget is first shown
+        self.path_edit.setText(_display_name(self.current_path))
         self.path_edit.setToolTip(self.current_path)
         
-        # Apply sort settings
-        if hasattr(self, 'current_sort_column'):
-            self.tree_view.sortByColumn(self.current_sort_column, self.current_sort_order)
+    def _create_file_model(self):
+        """Create the file system model for the tree view.
+        
+        The "explorer/scandir_model" setting switches to ScandirTreeModel,
+        which lists directories lazily with os.scandir and does not watch
+        them; by default the standard QFileSystemModel is used.
+        
+        Returns:
+            The file system model
+        """
+        if self.settings.value(f"{_SETTINGS_GROUP}/{_KEY_SCANDIR_MODEL}", False, type=bool):
+            return ScandirTreeModel()
+        return QFileSystemModel()
+        
+    def showEvent(self, event):
+        """Load the current directory the first time the widget is shown.
+        
+        Args:
+            event: Show event
+        """
+        self._ensure_root_loaded()
+        super().showEvent(event)
+        
+    def closeEvent(self, event):
+        """Write any pending settings before the widget closes.
+        
+        Args:
+            event: Close event
+        """
+        self._flush_settings()
+        super().closeEvent(event)
+        
+    def _ensure_root_loaded(self):
+        """Point the model at the current directory, once.
+        
+        Setting the model's root path starts its directory scan and file
+        watcher, so explorers that are never shown never pay for them.
+        """
+        if self._root_loaded:
+            return
+        self._root_loaded = True
+        
+        # setRootPath returns the root's index, so no second model lookup is needed
+        self.tree_view.setRootIndex(self.file_model.setRootPath(self.current_path))
+        
+        # Enable sorting only once the root is set, so the initial population
+        # is not re-sorted on every row insertion
+        self._setup_sorting()
+        self.tree_view.sortByColumn(self.current_sort_column, self.current_sort_order)
         
     def _setup_ui(self):
         """Set up the UI components."""
@@ -219,7 +524,7 @@ class FileExplorerWidget(QWidget):
         self.nav_button.setText("📁")
         self.nav_button.setToolTip("Navigation Options")
         self.nav_button.setFixedSize(32, 32)
-        self.nav_button.setStyleSheet("font-size: 18px;")
+        self.nav_button.setObjectName("ExplorerToolButton")
         self.nav_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
         toolbar_layout.addWidget(self.nav_button)
         
@@ -231,12 +536,16 @@ class FileExplorerWidget(QWidget):
         self.refresh_button.setText("🔄")
         self.refresh_button.setToolTip("Refresh")
         self.refresh_button.setFixedSize(32, 32)
-        self.refresh_button.setStyleSheet("font-size: 18px;")
+        self.refresh_button.setObjectName("ExplorerToolButton")
         toolbar_layout.addWidget(self.refresh_button)
         
         # Add toolbar to main layout
         layout.addLayout(toolbar_layout)
         
+        # Use generic icons and skip per-directory custom icon lookups
+        self.file_model.setIconProvider(self.icon_provider)
+        self.file_model.setOption(QFileSystemModel.Option.DontUseCustomDirectoryIcons, True)
+        
         # Set up the tree view
         self.tree_view.setModel(self.file_model)
         self.tree_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -244,9 +553,11 @@ class FileExplorerWidget(QWidget):
         self.tree_view.setDropIndicatorShown(True)
         self.tree_view.setAcceptDrops(True)
         self.tree_view.setAnimated(True)
+        # All rows share one icon size, so let Qt cache a single row height
+        self.tree_view.setUniformRowHeights(True)
         
         # Connect sorting signals and set up header context menu
-        header = self.tree_view.header()
+        header = self._header
         header.setSortIndicatorShown(True)
         header.setSectionsClickable(True)
         header.sortIndicatorChanged.connect(self._on_sort_changed)
@@ -271,6 +582,7 @@ class FileExplorerWidget(QWidget):
     def _setup_navigation_menu(self):
         """Set up the navigation button dropdown menu."""
         nav_menu = QMenu(self)
+        nav_menu.aboutToShow.connect(self._sync_navigation_actions)
         
         # Root action
         root_action = QAction("Root (/)", self)
@@ -279,7 +591,7 @@ class FileExplorerWidget(QWidget):
         
         # Home action
         home_action = QAction(f"Home (~)", self)
-        home_action.triggered.connect(lambda: self.navigate_to(os.path.expanduser("~")))
+        home_action.triggered.connect(lambda: self.navigate_to(self.home_directory))
         nav_menu.addAction(home_action)
         
         # Up action (parent directory)
@@ -287,6 +599,11 @@ class FileExplorerWidget(QWidget):
         up_action.triggered.connect(self._go_up)
         nav_menu.addAction(up_action)
         
+        # Hard refresh action (rebuilds the model's cache)
+        hard_refresh_action = QAction("Hard Refresh", self)
+        hard_refresh_action.triggered.connect(self._hard_refresh)
+        nav_menu.addAction(hard_refresh_action)
+        
         nav_menu.addSeparator()
         
         # Previous (back) action
@@ -303,83 +620,91 @@ class FileExplorerWidget(QWidget):
         
         nav_menu.addSeparator()
         
-        # View submenu
-        view_menu = nav_menu.addMenu("View")
+        # View submenu (shared with the header context menu)
+        self._view_menu = self._build_view_menu()
+        nav_menu.addMenu(self._view_menu)
+        
+        self.nav_button.setMenu(nav_menu)
+    
+    def _sync_navigation_actions(self):
+        """Enable Previous/Next from the history just before the menu opens."""
+        self.back_action.setEnabled(self.navigation_history.can_go_back())
+        self.forward_action.setEnabled(self.navigation_history.can_go_forward())
+    
+    def _build_view_menu(self) -> QMenu:
+        """Build the View menu shared by the navigation and header menus.
+        
+        The menu is built once; its check states are synced from the current
+        settings each time it is about to be shown.
+        
+        Returns:
+            The View menu
+        """
+        view_menu = QMenu("View", self)
+        view_menu.aboutToShow.connect(self._sync_view_menu)
         
         # Toggle hidden files
-        hidden_action = QAction("Hidden Files", self)
-        hidden_action.setCheckable(True)
-        hidden_action.setChecked(bool(self.show_hidden_files))
-        hidden_action.triggered.connect(self._toggle_hidden_files)
-        view_menu.addAction(hidden_action)
+        self.hidden_action = QAction("Hidden Files", self)
+        self.hidden_action.setCheckable(True)
+        self.hidden_action.triggered.connect(self._toggle_hidden_files)
+        view_menu.addAction(self.hidden_action)
         
         view_menu.addSeparator()
         
-        # View mode options
+        # View mode options; one group-level handler dispatches on action data
         view_mode_group = QActionGroup(self)
-        
-        list_view_action = QAction("As List", self)
-        list_view_action.setCheckable(True)
-        list_view_action.setChecked(self.view_mode == "list")
-        list_view_action.triggered.connect(lambda: self._set_view_mode("list"))
-        view_mode_group.addAction(list_view_action)
-        view_menu.addAction(list_view_action)
-        
-        icons_view_action = QAction("As Icon and Text", self)
-        icons_view_action.setCheckable(True)
-        icons_view_action.setChecked(self.view_mode == "icons")
-        icons_view_action.triggered.connect(lambda: self._set_view_mode("icons"))
-        view_mode_group.addAction(icons_view_action)
-        view_menu.addAction(icons_view_action)
-        
-        columns_view_action = QAction("As Columns", self)
-        columns_view_action.setCheckable(True)
-        columns_view_action.setChecked(self.view_mode == "columns")
-        columns_view_action.triggered.connect(lambda: self._set_view_mode("columns"))
-        view_mode_group.addAction(columns_view_action)
-        view_menu.addAction(columns_view_action)
-        
-        gallery_view_action = QAction("As Gallery", self)
-        gallery_view_action.setCheckable(True)
-        gallery_view_action.setChecked(self.view_mode == "gallery")
-        gallery_view_action.triggered.connect(lambda: self._set_view_mode("gallery"))
-        view_mode_group.addAction(gallery_view_action)
-        view_menu.addAction(gallery_view_action)
+        view_mode_group.triggered.connect(self._on_view_mode_action)
+        self.view_mode_actions = {}
+        for mode, label in self.VIEW_MODE_LABELS:
+            action = QAction(label, self)
+            action.setCheckable(True)
+            action.setData(mode)
+            view_mode_group.addAction(action)
+            view_menu.addAction(action)
+            self.view_mode_actions[mode] = action
         
         view_menu.addSeparator()
         
-        # Column submenu
+        # Column submenu; columns toggle independently of each other
         columns_menu = view_menu.addMenu("Add Columns")
+        column_group = QActionGroup(self)
+        column_group.setExclusive(False)
+        column_group.triggered.connect(self._on_column_action)
+        self.column_actions = {}
+        for column_id, label, column_index in self.OPTIONAL_COLUMNS:
+            action = QAction(label, self)
+            action.setCheckable(True)
+            action.setData((column_id, column_index))
+            column_group.addAction(action)
+            columns_menu.addAction(action)
+            self.column_actions[column_id] = action
+        
+        return view_menu
+        
+    def _on_view_mode_action(self, action: QAction):
+        """Switch to the view mode carried by a View menu action.
         
-        # Date modified column
-        date_mod_action = QAction("Date Modified", self)
-        date_mod_action.setCheckable(True)
-        date_mod_action.setChecked("date_modified" in self.active_columns)
-        date_mod_action.triggered.connect(lambda: self._toggle_column("date_modified", 3))
-        columns_menu.addAction(date_mod_action)
-        
-        # Date created column
-        date_created_action = QAction("Date Created", self)
-        date_created_action.setCheckable(True)
-        date_created_action.setChecked("date_created" in self.active_columns)
-        date_created_action.triggered.connect(lambda: self._toggle_column("date_created", 4))
-        columns_menu.addAction(date_created_action)
-        
-        # Type column
-        type_action = QAction("Kind", self)
-        type_action.setCheckable(True)
-        type_action.setChecked("kind" in self.active_columns)
-        type_action.triggered.connect(lambda: self._toggle_column("kind", 2))
-        columns_menu.addAction(type_action)
-        
-        # Size column
-        size_action = QAction("Size", self)
-        size_action.setCheckable(True)
-        size_action.setChecked("size" in self.active_columns)
-        size_action.triggered.connect(lambda: self._toggle_column("size", 1))
-        columns_menu.addAction(size_action)
+        Args:
+            action: Triggered view mode action
+        """
+        self._set_view_mode(action.data())
         
-        self.nav_button.setMenu(nav_menu)
+    def _on_column_action(self, action: QAction):
+        """Toggle the column carried by an Add Columns action.
+        
+        Args:
+            action: Triggered column action
+        """
+        column_id, column_index = action.data()
+        self._toggle_column(column_id, column_index)
+        
+    def _sync_view_menu(self):
+        """Update the View menu's check states from the current settings."""
+        self.hidden_action.setChecked(bool(self.show_hidden_files))
+        for mode, action in self.view_mode_actions.items():
+            action.setChecked(self.view_mode == mode)
+        for column_id, action in self.column_actions.items():
+            action.setChecked(column_id in self.active_columns)
     
     def _setup_path_context_menu(self):
         """Set up the path editor context menu."""
@@ -422,7 +747,7 @@ class FileExplorerWidget(QWidget):
         goto_menu.addAction(root_action)
         
         home_action = QAction("Home", self)
-        home_action.triggered.connect(lambda: self.navigate_to(os.path.expanduser("~")))
+        home_action.triggered.connect(lambda: self.navigate_to(self.home_directory))
         goto_menu.addAction(home_action)
         
         current_dir_action = QAction("Current Directory", self)
@@ -448,85 +773,11 @@ class FileExplorerWidget(QWidget):
         Args:
             pos: Position for the context menu
         """
-        context_menu = QMenu(self)
-        
-        # View submenu
-        view_menu = context_menu.addMenu("View")
-        
-        # Toggle hidden files
-        hidden_action = QAction("Hidden Files", self)
-        hidden_action.setCheckable(True)
-        hidden_action.setChecked(bool(self.show_hidden_files))
-        hidden_action.triggered.connect(self._toggle_hidden_files)
-        view_menu.addAction(hidden_action)
-        
-        view_menu.addSeparator()
-        
-        # View mode options
-        view_mode_group = QActionGroup(self)
-        
-        list_view_action = QAction("As List", self)
-        list_view_action.setCheckable(True)
-        list_view_action.setChecked(self.view_mode == "list")
-        list_view_action.triggered.connect(lambda: self._set_view_mode("list"))
-        view_mode_group.addAction(list_view_action)
-        view_menu.addAction(list_view_action)
-        
-        icons_view_action = QAction("As Icon and Text", self)
-        icons_view_action.setCheckable(True)
-        icons_view_action.setChecked(self.view_mode == "icons")
-        icons_view_action.triggered.connect(lambda: self._set_view_mode("icons"))
-        view_mode_group.addAction(icons_view_action)
-        view_menu.addAction(icons_view_action)
-        
-        columns_view_action = QAction("As Columns", self)
-        columns_view_action.setCheckable(True)
-        columns_view_action.setChecked(self.view_mode == "columns")
-        columns_view_action.triggered.connect(lambda: self._set_view_mode("columns"))
-        view_mode_group.addAction(columns_view_action)
-        view_menu.addAction(columns_view_action)
-        
-        gallery_view_action = QAction("As Gallery", self)
-        gallery_view_action.setCheckable(True)
-        gallery_view_action.setChecked(self.view_mode == "gallery")
-        gallery_view_action.triggered.connect(lambda: self._set_view_mode("gallery"))
-        view_mode_group.addAction(gallery_view_action)
-        view_menu.addAction(gallery_view_action)
-        
-        view_menu.addSeparator()
-        
-        # Column submenu
-        columns_menu = view_menu.addMenu("Add Columns")
-        
-        # Date modified column
-        date_mod_action = QAction("Date Modified", self)
-        date_mod_action.setCheckable(True)
-        date_mod_action.setChecked("date_modified" in self.active_columns)
-        date_mod_action.triggered.connect(lambda: self._toggle_column("date_modified", 3))
-        columns_menu.addAction(date_mod_action)
-        
-        # Date created column
-        date_created_action = QAction("Date Created", self)
-        date_created_action.setCheckable(True)
-        date_created_action.setChecked("date_created" in self.active_columns)
-        date_created_action.triggered.connect(lambda: self._toggle_column("date_created", 4))
-        columns_menu.addAction(date_created_action)
-        
-        # Type column
-        type_action = QAction("Kind", self)
-        type_action.setCheckable(True)
-        type_action.setChecked("kind" in self.active_columns)
-        type_action.triggered.connect(lambda: self._toggle_column("kind", 2))
-        columns_menu.addAction(type_action)
-        
-        # Size column
-        size_action = QAction("Size", self)
-        size_action.setCheckable(True)
-        size_action.setChecked("size" in self.active_columns)
-        size_action.triggered.connect(lambda: self._toggle_column("size", 1))
-        columns_menu.addAction(size_action)
-        
-        context_menu.exec(self.tree_view.header().mapToGlobal(pos))
+        if self._header_menu is None:
+            self._header_menu = QMenu(self)
+            self._header_menu.addMenu(self._view_menu)
+            
+        self._header_menu.exec(self._header.mapToGlobal(pos))
         
     def _connect_signals(self):
         """Connect widget signals."""
@@ -544,6 +795,17 @@ class FileExplorerWidget(QWidget):
         # Set up filter timer
         self.path_edit.textChanged.connect(self._on_path_text_changed)
         self.filter_timer.timeout.connect(self._apply_filter)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._selection_timer.timeout.connect(self._emit_file_selected)
+        self._tooltip_timer.timeout.connect(self._refresh_path_tooltip)
+        self._count_signals.counted.connect(self._on_counts_ready)
+        self._history_check_signals.checked.connect(self._on_history_checked)
+        self._settings_save_timer.timeout.connect(self._save_settings)
+        
+        # Write out any pending settings before the application exits
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_settings)
         
     def eventFilter(self, obj, event):
         """Event filter for hover tooltip.
@@ -556,35 +818,113 @@ class FileExplorerWidget(QWidget):
             True if event was handled, otherwise default handling
         """
         if obj == self.path_edit and event.type() == event.Type.ToolTip:
-            # Show full path as tooltip
-            item_count = self._get_directory_item_count()
-            hidden_count = self._get_hidden_item_count() if self.show_hidden_files else 0
-            tooltip = f"<b>{self.current_path}</b><br>{item_count} items"
-            if hidden_count > 0:
-                tooltip += f" ({hidden_count} hidden)"
-            QToolTip.showText(event.globalPos(), tooltip)
+            # Show the full path at once, with the last known counts if any;
+            # the directory is only recounted once hovering settles
+            cached = self._count_cache.get(self.current_path)
+            counts = cached[1:] if cached is not None else None
+            QToolTip.showText(event.globalPos(), self._path_tooltip(counts))
+            self._tooltip_timer.start()
             return True
         return super().eventFilter(obj, event)
         
-    def _get_directory_item_count(self) -> int:
-        """Get the number of items in the current directory.
+    def _path_tooltip(self, counts: Optional[Tuple[int, int]]) -> str:
+        """Build the path editor tooltip text.
         
+        Args:
+            counts: (visible, hidden) entry counts, or None if not known yet
+            
         Returns:
-            Number of items
+            Rich text tooltip for the current path
+        """
+        tooltip = f"<b>{self.current_path}</b>"
+        if counts is None:
+            return tooltip
+            
+        item_count, hidden_count = counts
+        tooltip += f"<br>{item_count} items"
+        if self.show_hidden_files and hidden_count > 0:
+            tooltip += f" ({hidden_count} hidden)"
+        return tooltip
+        
+    def _refresh_path_tooltip(self):
+        """Recount the current directory in the background if the tooltip is shown."""
+        if not QToolTip.isVisible():
+            return
+        path = self.current_path
+        QThreadPool.globalInstance().start(
+            DirectoryCountTask(path, self._count_cache.get(path), self._count_signals))
+        
+    @Slot(str, object)
+    def _on_counts_ready(self, path: str, entry: Optional[Tuple[int, int, int]]):
+        """Store a background count and update the tooltip if it is still shown.
+        
+        Args:
+            path: Directory that was counted
+            entry: (mtime_ns, visible, hidden), or None if it could not be read
         """
-        dir_path = QDir(self.current_path)
-        dir_path.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot)
-        return len(dir_path.entryList())
+        self._remember_counts(path, entry)
+        if path == self.current_path and QToolTip.isVisible():
+            counts = entry[1:] if entry is not None else (0, 0)
+            QToolTip.showText(QCursor.pos(), self._path_tooltip(counts), self.path_edit)
         
-    def _get_hidden_item_count(self) -> int:
-        """Get the number of hidden items in the current directory.
+    @staticmethod
+    def _count_entries(path: str) -> Tuple[int, int]:
+        """Count the visible and hidden entries of a directory in one pass.
         
+        Args:
+            path: Directory to count
+            
         Returns:
-            Number of hidden items
+            Tuple of (visible count, hidden count); (0, 0) if unreadable
         """
-        dir_path = QDir(self.current_path)
-        dir_path.setFilter(QDir.Filter.Hidden | QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot)
-        return len(dir_path.entryList())
+        total = hidden = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    total += 1
+                    if entry.name.startswith("."):
+                        hidden += 1
+        except OSError:
+            return 0, 0
+        return total - hidden, hidden
+        
+    @staticmethod
+    def _scan_counts(path: str, cached: Optional[Tuple[int, int, int]]
+                     ) -> Optional[Tuple[int, int, int]]:
+        """Return entry counts for a directory, rescanning only when it changed.
+        
+        The cached entry is reused while the directory's mtime is unchanged,
+        so a repeat costs one stat(). Safe to call from a worker thread.
+        
+        Args:
+            path: Directory to count
+            cached: Last known (mtime_ns, visible, hidden) for the path, if any
+            
+        Returns:
+            (mtime_ns, visible, hidden), or None if the directory is unreadable
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if cached is not None and cached[0] == mtime:
+            return cached
+        return (mtime,) + FileExplorerWidget._count_entries(path)
+        
+    def _remember_counts(self, path: str, entry: Optional[Tuple[int, int, int]]):
+        """Store counts in the bounded, least recently used count cache.
+        
+        Args:
+            path: Directory that was counted
+            entry: (mtime_ns, visible, hidden), or None to forget the path
+        """
+        if entry is None:
+            self._count_cache.pop(path, None)
+            return
+        self._count_cache[path] = entry
+        self._count_cache.move_to_end(path)
+        if len(self._count_cache) > self.COUNT_CACHE_SIZE:
+            self._count_cache.popitem(last=False)
         
     def _on_item_clicked(self, index):
         """Handle item click.
@@ -592,8 +932,18 @@ class FileExplorerWidget(QWidget):
         Args:
             index: Model index of clicked item
         """
-        file_path = self.file_model.filePath(index)
-        self.file_selected.emit(file_path)
+        self._pending_selection = self.file_model.filePath(index)
+        self._selection_timer.start()
+        
+    def _emit_file_selected(self):
+        """Emit file_selected for the most recent pending selection.
+        
+        Clicks are coalesced through _selection_timer so a burst of
+        selections only notifies listeners of the last one.
+        """
+        if self._pending_selection is not None:
+            self.file_selected.emit(self._pending_selection)
+            self._pending_selection = None
         
     def _on_item_double_clicked(self, index):
         """Handle item double click.
@@ -613,20 +963,31 @@ class FileExplorerWidget(QWidget):
         """Handle path edit change."""
         new_path = self.path_edit.text()
         
-        # Check if this is a glob pattern
-        if any(c in new_path for c in "*?[]"):
-            self._apply_filter_pattern(new_path)
+        # Check if this is a glob pattern; one with directory parts moves to
+        # its literal prefix directory and filters by the last component
+        if _find_glob_char(new_path):
+            self.filter_timer.stop()  # Applied now; the text may be replaced below
+            directory, name_pattern = _split_glob_pattern(new_path)
+            if directory:
+                directory = _expand_home(directory) if directory.startswith("~") else directory
+                # A relative prefix is relative to the shown folder, not the CWD
+                if not os.path.isabs(directory):
+                    directory = os.path.normpath(os.path.join(self.current_path, directory))
+                if os.path.isdir(directory):
+                    self._apply_root_path(directory)
+            self._apply_filter_pattern(name_pattern)
             return
             
-        # Check if path exists
-        if QDir(new_path).exists():
-            self.navigate_to(new_path)
-        elif os.path.exists(os.path.expanduser(new_path)):
-            # Try expanding ~
-            self.navigate_to(os.path.expanduser(new_path))
-        elif os.path.exists(os.path.expandvars(new_path)):
-            # Try expanding environment variables
-            self.navigate_to(os.path.expandvars(new_path))
+        # Expand ~ and environment variables only when present, then check
+        # the resulting path with a single stat
+        candidate = new_path
+        if "~" in candidate:
+            candidate = _expand_home(candidate)
+        if "$" in candidate or "%" in candidate:
+            candidate = os.path.expandvars(candidate)
+            
+        if os.path.isdir(candidate):
+            self._apply_root_path(candidate)
         else:
             # Reset to current path if invalid
             self.path_edit.setText(self.current_path)
@@ -638,7 +999,7 @@ class FileExplorerWidget(QWidget):
             text: New text in path edit
         """
         # If text contains glob patterns, start filter timer
-        if any(c in text for c in "*?[]"):
+        if _find_glob_char(text):
             self.filter_timer.start()
             
     def _apply_filter(self):
@@ -652,53 +1013,76 @@ class FileExplorerWidget(QWidget):
         Args:
             pattern: Glob pattern to filter by
         """
-        if any(c in pattern for c in "*?[]"):
+        # The model matches names only, so keep the last path component
+        pattern = os.path.basename(pattern)
+        if _find_glob_char(pattern):
             self.path_filter = pattern
-            # Set a name filter on the file model
-            self.file_model.setNameFilters([pattern])
-            self.file_model.setNameFilterDisables(False)  # Hide filtered items
+            # Set a name filter on the file model (skipped when unchanged,
+            # as the model rebuilds its matcher and re-filters on every call)
+            if self.file_model.nameFilters() != [pattern]:
+                self.file_model.setNameFilters([pattern])
+                self.file_model.setNameFilterDisables(False)  # Hide filtered items
         else:
             self.path_filter = ""
-            self.file_model.setNameFilters([])
+            if self.file_model.nameFilters():
+                self.file_model.setNameFilters([])
             # Reset the filter
-            self.file_model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | 
-                                     (QDir.Filter.Hidden if self.show_hidden_files else QDir.Filter.NoDotAndDotDot))
+            self.file_model.setFilter(self._dir_filter)
             
     def _refresh(self):
-        """Refresh the current directory."""
-        self.file_model.setRootPath("")  # Clear cache
-        self.file_model.setRootPath(self.current_path)
-        self.tree_view.setRootIndex(self.file_model.index(self.current_path))
+        """Schedule a refresh of the current directory.
+        
+        Requests arriving within the debounce interval collapse into a
+        single _do_refresh.
+        """
+        self._refresh_timer.start()
+        
+    def _do_refresh(self):
+        """Refresh the current directory.
+        
+        This is a soft refresh: the model's file watcher already tracks
+        changes, so the cached tree is kept and only the root is re-applied.
+        Use _hard_refresh to discard the model's cache.
+        """
+        if not self._root_loaded:
+            return  # Nothing loaded yet; the first show loads the directory
+            
+        # setRootPath is a no-op for the current root; only re-root the view
+        # (which relayouts every row) when the root index actually moved
+        root_index = self.file_model.setRootPath(self.current_path)
+        if root_index != self.tree_view.rootIndex():
+            self.tree_view.setRootIndex(root_index)
         
         # Reapply any filters
         if self.path_filter:
             self._apply_filter_pattern(self.path_filter)
+    
+    def _hard_refresh(self):
+        """Discard the model's cached tree and reload the current directory."""
+        self._refresh_timer.stop()
+        self.file_model.setRootPath("")  # Clear cache
+        self._do_refresh()
             
     def _go_up(self):
         """Go up one directory level."""
-        parent_dir = QDir(self.current_path)
-        if parent_dir.cdUp():
-            self.navigate_to(parent_dir.absolutePath())
+        current = os.path.normpath(self.current_path)
+        parent = os.path.dirname(current)
+        if parent and parent != current:
+            self.navigate_to(parent)
             
     def _go_back(self):
         """Navigate to the previous directory in history."""
         prev_path = self.navigation_history.go_back()
         if prev_path:
             self.set_root_path(prev_path, add_to_history=False)
-            
-        # Update navigation action states
-        self.back_action.setEnabled(self.navigation_history.can_go_back())
-        self.forward_action.setEnabled(self.navigation_history.can_go_forward())
+            self._schedule_settings_save()
             
     def _go_forward(self):
         """Navigate to the next directory in history."""
         next_path = self.navigation_history.go_forward()
         if next_path:
             self.set_root_path(next_path, add_to_history=False)
-            
-        # Update navigation action states
-        self.back_action.setEnabled(self.navigation_history.can_go_back())
-        self.forward_action.setEnabled(self.navigation_history.can_go_forward())
+            self._schedule_settings_save()
             
     def navigate_to(self, path: str):
         """Navigate to a specified path.
@@ -706,9 +1090,9 @@ class FileExplorerWidget(QWidget):
         Args:
             path: Path to navigate to
         """
-        if QDir(path).exists() or QDir(os.path.expanduser(path)).exists():
-            expanded_path = os.path.expanduser(path)
-            self.set_root_path(expanded_path)
+        expanded_path = _expand_home(path) if path.startswith("~") else path
+        if os.path.isdir(expanded_path):
+            self._apply_root_path(expanded_path)
     
     def set_root_path(self, path: str, add_to_history: bool = True):
         """Set the root path for the file explorer.
@@ -717,32 +1101,41 @@ class FileExplorerWidget(QWidget):
             path: Root directory path
             add_to_history: Whether to add this path to navigation history
         """
-        if QDir(path).exists():
-            self.current_path = path
-            self.file_model.setRootPath(path)
-            self.tree_view.setRootIndex(self.file_model.index(path))
+        if os.path.isdir(path):
+            self._apply_root_path(path, add_to_history)
             
-            # Display basename in path editor for cleaner UI
-            basename = os.path.basename(path) or path
+    def _apply_root_path(self, path: str, add_to_history: bool = True):
+        """Show an already validated directory as the explorer root.
+        
+        Args:
+            path: Existing root directory path
+            add_to_history: Whether to add this path to navigation history
+        """
+        self.current_path = path
+        if self._root_loaded:
+            self.tree_view.setRootIndex(self.file_model.setRootPath(path))
+        
+        # Display basename in path editor for cleaner UI
+        # (skipped when unchanged, so textChanged is not re-emitted)
+        basename = _display_name(path)
+        if self.path_edit.text() != basename:
             self.path_edit.setText(basename)
-            # Set tooltip to show full path
+        # Set tooltip to show full path
+        if self.path_edit.toolTip() != path:
             self.path_edit.setToolTip(path)
+        
+        # Apply hidden files setting
+        self.file_model.setFilter(self._dir_filter)
+        
+        # Add to navigation history
+        if add_to_history:
+            self.navigation_history.add_path(path)
             
-            # Apply hidden files setting
-            self.file_model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | 
-                                     (QDir.Filter.Hidden if self.show_hidden_files else QDir.Filter.NoDotAndDotDot))
-            
-            # Add to navigation history
-            if add_to_history:
-                self.navigation_history.add_path(path)
-                self.back_action.setEnabled(self.navigation_history.can_go_back())
-                self.forward_action.setEnabled(self.navigation_history.can_go_forward())
-                
-                # Save settings
-                self._save_history()
-                
-            self.directory_changed.emit(path)
+            # Save settings once navigation settles
+            self._schedule_settings_save()
             
+        self.directory_changed.emit(path)
+        
     def _copy_full_path(self):
         """Copy the full current path to clipboard."""
         clipboard = QApplication.clipboard()
@@ -775,21 +1168,28 @@ class FileExplorerWidget(QWidget):
             self.path_edit.setText(expanded_text)
             self._on_path_changed()
             
+    def _recompute_dir_filter(self):
+        """Recompute the model filter flags from the hidden files setting."""
+        self._dir_filter = QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot
+        if self.show_hidden_files:
+            self._dir_filter |= QDir.Filter.Hidden
+            
     def _toggle_hidden_files(self, checked):
         """Toggle display of hidden files.
         
         Args:
             checked: Whether to show hidden files
         """
+        if bool(checked) == self.show_hidden_files:
+            return
         self.show_hidden_files = bool(checked)
-        if self.show_hidden_files:
-            self.file_model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | QDir.Filter.Hidden)
-        else:
-            self.file_model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot)
-        self._refresh()
+        self._recompute_dir_filter()
+        # The model re-filters its already listed directories itself, so no
+        # refresh (or re-listing) of the tree is needed
+        self.file_model.setFilter(self._dir_filter)
         
         # Save setting
-        self.settings.setValue("explorer/show_hidden", self.show_hidden_files)
+        self._schedule_settings_save()
         
     def _set_view_mode(self, mode):
         """Set the view mode.
@@ -799,58 +1199,80 @@ class FileExplorerWidget(QWidget):
         """
         self.view_mode = mode
         # Save setting
-        self.settings.setValue("explorer/view_mode", self.view_mode)
-        
-        # Update tree view settings based on mode
-        if mode == "list":
-            # List view - compact with smaller icons
-            self.tree_view.setIconSize(QSize(16, 16))
-            self.tree_view.setRootIsDecorated(True)  # Show expand/collapse arrows
-            self.tree_view.setIndentation(20)
-            # Ensure name column is first and expanded
-            self.tree_view.header().moveSection(0, 0)
-            self.tree_view.header().resizeSection(0, 200)
-            
-        elif mode == "icons":
-            # Icon view - larger icons
-            self.tree_view.setIconSize(QSize(32, 32))
-            self.tree_view.setRootIsDecorated(False)  # Hide expand/collapse arrows
-            self.tree_view.setIndentation(10)
-            # Expand name column
-            self.tree_view.header().resizeSection(0, 250)
-            
-        elif mode == "columns":
-            # Column view - emphasize all columns
-            self.tree_view.setIconSize(QSize(16, 16))
-            self.tree_view.setRootIsDecorated(False)
-            self.tree_view.setIndentation(0)
-            # Show all available columns
-            for i in range(self.file_model.columnCount()):
-                self.tree_view.header().showSection(i)
-            # Make columns more visible
-            self.tree_view.header().resizeSection(0, 180)  # Name
-            self.tree_view.header().resizeSection(1, 80)   # Size
-            self.tree_view.header().resizeSection(2, 80)   # Type
-            self.tree_view.header().resizeSection(3, 120)  # Date Modified
-            
-        elif mode == "gallery":
-            # Gallery view - maximize space for name/icon
-            self.tree_view.setIconSize(QSize(48, 48))
-            self.tree_view.setRootIsDecorated(False)
-            self.tree_view.setIndentation(0)
-            # Hide all columns except name
-            for i in range(1, self.file_model.columnCount()):
-                self.tree_view.header().hideSection(i)
-            # Expand name column to fill view
-            self.tree_view.header().resizeSection(0, self.tree_view.width() - 20)
-            
-        # Refresh model to update view
-        current_index = self.tree_view.currentIndex()
-        self.tree_view.setModel(None)
-        self.tree_view.setModel(self.file_model)
-        self.tree_view.setRootIndex(self.file_model.index(self.current_path))
-        if current_index.isValid():
-            self.tree_view.setCurrentIndex(current_index)
+        self._schedule_settings_save()
+        
+        # Update tree view settings based on mode, repainting once at the end
+        with self._bulk_header_update():
+            if mode == "list":
+                # List view - compact with smaller icons
+                self.tree_view.setIconSize(QSize(16, 16))
+                self.tree_view.setRootIsDecorated(True)  # Show expand/collapse arrows
+                self.tree_view.setIndentation(20)
+                self._apply_active_columns()
+                # Ensure name column is first and expanded
+                self._header.moveSection(0, 0)
+                self._header.resizeSection(0, 200)
+                
+            elif mode == "icons":
+                # Icon view - larger icons
+                self.tree_view.setIconSize(QSize(32, 32))
+                self.tree_view.setRootIsDecorated(False)  # Hide expand/collapse arrows
+                self.tree_view.setIndentation(10)
+                self._apply_active_columns()
+                # Expand name column
+                self._header.resizeSection(0, 250)
+                
+            elif mode == "columns":
+                # Column view - emphasize all columns
+                self.tree_view.setIconSize(QSize(16, 16))
+                self.tree_view.setRootIsDecorated(False)
+                self.tree_view.setIndentation(0)
+                # Show all available columns
+                for i in range(self._column_count):
+                    self._header.showSection(i)
+                # Make columns more visible
+                self._header.resizeSection(0, 180)  # Name
+                self._header.resizeSection(1, 80)   # Size
+                self._header.resizeSection(2, 80)   # Type
+                self._header.resizeSection(3, 120)  # Date Modified
+                
+            elif mode == "gallery":
+                # Gallery view - maximize space for name/icon
+                self.tree_view.setIconSize(QSize(48, 48))
+                self.tree_view.setRootIsDecorated(False)
+                self.tree_view.setIndentation(0)
+                # Hide all columns except name
+                for i in range(1, self._column_count):
+                    self._header.hideSection(i)
+                # Expand name column to fill view
+                self._header.resizeSection(0, self.tree_view.width() - 20)
+                
+        # The model is unchanged, so the view is reconfigured in place; the
+        # setters above already schedule a relayout of the visible rows
+        
+    @contextmanager
+    def _bulk_header_update(self) -> Iterator[None]:
+        """Hold back tree view repaints while several header sections change.
+        
+        Each showSection/hideSection/resizeSection would otherwise repaint
+        the header and viewport on its own.
+        
+        Yields:
+            None; updates are re-enabled (if they were) when the block exits
+        """
+        was_enabled = self.tree_view.updatesEnabled()
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.tree_view.setUpdatesEnabled(was_enabled)
+        
+    def _apply_active_columns(self):
+        """Show the optional columns the user enabled and hide the rest."""
+        header = self._header
+        for column_id, _label, column_index in self.OPTIONAL_COLUMNS:
+            if column_index < self._column_count:
+                header.setSectionHidden(column_index, column_id not in self.active_columns)
         
     def _toggle_column(self, column_id, column_index):
         """Toggle visibility of a column.
@@ -859,37 +1281,28 @@ class FileExplorerWidget(QWidget):
             column_id: Column identifier
             column_index: Column index in the model
         """
-        header = self.tree_view.header()
-        
-        if column_id in self.active_columns:
-            # Remove column
-            self.active_columns.remove(column_id)
-            header.hideSection(column_index)
-        else:
-            # Add column
-            self.active_columns.append(column_id)
-            header.showSection(column_index)
-            
+        header = self._header
+        
+        # Show/hide and resize in one repaint
+        with self._bulk_header_update():
+            if column_id in self.active_columns:
+                # Remove column
+                self.active_columns.remove(column_id)
+                header.hideSection(column_index)
+            else:
+                # Add column
+                self.active_columns.append(column_id)
+                header.showSection(column_index)
+                
+            # Set appropriate width based on column type
+            header.resizeSection(column_index, self.COLUMN_WIDTHS.get(column_id, 100))
+                
         # Save setting
-        self.settings.setValue("explorer/active_columns", self.active_columns)
-            
-        # Set appropriate width based on column type
-        if column_id == "name":
-            header.resizeSection(column_index, 200)
-        elif column_id == "size":
-            header.resizeSection(column_index, 80)
-        elif column_id == "kind":
-            header.resizeSection(column_index, 100)
-        elif column_id == "date_modified":
-            header.resizeSection(column_index, 120)
-        elif column_id == "date_created":
-            header.resizeSection(column_index, 120)
-        else:
-            header.resizeSection(column_index, 100)
+        self._schedule_settings_save()
                 
     def _setup_sorting(self):
         """Set up column sorting functionality."""
-        header = self.tree_view.header()
+        header = self._header
         
         # Enable sorting
         self.tree_view.setSortingEnabled(True)
@@ -912,15 +1325,22 @@ class FileExplorerWidget(QWidget):
         self.current_sort_order = sort_order
         
         # Save setting
-        self.settings.setValue("explorer/sort_column", self.current_sort_column)
-        
-        # Update active sort menu items if needed
-        for i, action in enumerate(self.sort_actions):
-            action.setChecked(i == column_index)
+        self._schedule_settings_save()
+        
+        # Update active sort menu items if needed: only the previously
+        # checked action and the new one change
+        previous = self._checked_sort_index
+        if previous is not None and previous != column_index and previous < len(self.sort_actions):
+            self.sort_actions[previous].setChecked(False)
+        if 0 <= column_index < len(self.sort_actions):
+            self.sort_actions[column_index].setChecked(True)
+            self._checked_sort_index = column_index
+        else:
+            self._checked_sort_index = None
                 
         # Ensure the column is visible when sorting by it
-        if column_index > 0 and self.tree_view.header().isSectionHidden(column_index):
-            self.tree_view.header().showSection(column_index)
+        if column_index > 0 and self._header.isSectionHidden(column_index):
+            self._header.showSection(column_index)
         
     def _set_sort_column(self, column_index):
         """Set the sort column.
@@ -928,8 +1348,11 @@ class FileExplorerWidget(QWidget):
         Args:
             column_index: Column index to sort by
         """
+        if self._is_sorted_by(column_index, self.current_sort_order):
+            return  # Already sorted this way; skip the model resort
+            
         # Ensure the column is visible
-        if self.tree_view.header().isSectionHidden(column_index):
+        if self._header.isSectionHidden(column_index):
             # Find the corresponding column ID
             column_ids = {
                 0: "name",
@@ -950,51 +1373,150 @@ class FileExplorerWidget(QWidget):
         Args:
             order: Sort order (ascending/descending)
         """
+        if self._is_sorted_by(self.current_sort_column, order):
+            return  # Already sorted this way; skip the model resort
         self.current_sort_order = order
         self.tree_view.sortByColumn(self.current_sort_column, order)
         
+    def _is_sorted_by(self, column_index: int, order) -> bool:
+        """Return whether the view is already sorted by a visible column and order.
+        
+        Args:
+            column_index: Column index
+            order: Sort order
+            
+        Returns:
+            True if the header's sort indicator already matches
+        """
+        return (self._root_loaded
+                and self._header.sortIndicatorSection() == column_index
+                and self._header.sortIndicatorOrder() == order
+                and not self._header.isSectionHidden(column_index))
+        
     def _load_history(self):
-        """Load navigation history from settings."""
+        """Load navigation history from settings.
+        
+        Saved paths are restored as-is; the ones that no longer exist are
+        found on a worker thread and dropped in _on_history_checked.
+        """
         # Initialize empty history
         self.navigation_history = NavigationHistory()
         
+        # Read the saved history and position together; the history is left
+        # untyped as it may be a JSON string or a legacy list
+        settings = self.settings
+        settings.beginGroup(_SETTINGS_GROUP)
+        history_list = settings.value(_KEY_HISTORY)
+        saved_index = settings.value(_KEY_HISTORY_INDEX, -1, type=int)
+        settings.endGroup()
+        
         # Try to load history from settings
-        if self.settings.contains("explorer/history"):
-            history_list = self.settings.value("explorer/history")
+        if history_list is not None:
+            if isinstance(history_list, str):
+                # Stored as one JSON string; older versions stored a list
+                try:
+                    history_list = json.loads(history_list)
+                except ValueError:
+                    history_list = []
             if isinstance(history_list, list):
                 for path in history_list:
-                    if path and os.path.exists(str(path)):
+                    if path:
                         self.navigation_history.add_path(str(path))
             
-        # If no valid history is loaded, add current path
+        # If no history is loaded, start it at the current path
         if not self.navigation_history.history:
-            if os.path.exists(self.current_path):
-                self.navigation_history.add_path(self.current_path)
-            else:
-                default_path = os.path.expanduser("~")
-                self.current_path = default_path
-                self.navigation_history.add_path(default_path)
+            if not os.path.exists(self.current_path):
+                self.current_path = self.home_directory
+            self.navigation_history.add_path(self.current_path)
+            return
+        
+        # Restore the saved position; -1 (missing) keeps the default index
+        if 0 <= saved_index < len(self.navigation_history.history):
+            self.navigation_history.current_index = saved_index
+        self.navigation_history.dirty = False  # Matches what is stored
+                
+        QThreadPool.globalInstance().start(
+            HistoryCheckTask(self.navigation_history.get_history(), self._history_check_signals))
+            
+    @Slot(object)
+    def _on_history_checked(self, missing: set):
+        """Drop history entries that no longer exist.
+        
+        Args:
+            missing: Paths found not to be directories
+        """
+        if not missing or not self.navigation_history.remove_paths(missing):
+            return
+        if not self.navigation_history.history:
+            self.navigation_history.add_path(self.current_path)
+        self._schedule_settings_save()
         
-        # Try to set current index from settings
-        if self.settings.contains("explorer/history_index"):
+    @staticmethod
+    def _missing_directories(paths: List[str]) -> set:
+        """Return the paths that are not existing directories.
+        
+        Paths are grouped by parent so each parent is listed with a single
+        os.scandir instead of stat()ing every path. Safe to call from a
+        worker thread.
+        
+        Args:
+            paths: Directory paths to check
+            
+        Returns:
+            Set of the paths that do not exist or are not directories
+        """
+        by_parent: Dict[str, List[Tuple[str, str]]] = {}
+        missing = set()
+        for path in paths:
+            parent, name = os.path.split(os.path.normpath(path))
+            if name:
+                by_parent.setdefault(parent, []).append((path, name))
+            elif not os.path.isdir(path):
+                missing.add(path)  # A root such as "/" has no parent to list
+                
+        for parent, entries in by_parent.items():
+            if len(entries) == 1:
+                # A single stat() is cheaper than listing the parent
+                path = entries[0][0]
+                if not os.path.isdir(path):
+                    missing.add(path)
+                continue
             try:
-                current_index = int(self.settings.value("explorer/history_index"))
-                if 0 <= current_index < len(self.navigation_history.history):
-                    self.navigation_history.current_index = current_index
-            except (ValueError, TypeError):
-                # If conversion fails, keep default index
-                pass
+                with os.scandir(parent) as children:
+                    directories = {child.name for child in children if child.is_dir()}
+            except OSError:
+                # Unreadable or missing parent: check the entries one by one
+                missing.update(path for path, _name in entries if not os.path.isdir(path))
+                continue
+            missing.update(path for path, name in entries if name not in directories)
+        return missing
+            
+    def _schedule_settings_save(self):
+        """Save settings once the current burst of changes settles."""
+        self._settings_save_timer.start()
+        
+    def _flush_settings(self):
+        """Save settings now if a save is still pending."""
+        if self._settings_save_timer.isActive():
+            self._settings_save_timer.stop()
+            self._save_settings()
             
-    def _save_history(self):
-        """Save navigation history to settings."""
-        self.settings.setValue("explorer/history", self.navigation_history.history)
-        self.settings.setValue("explorer/history_index", self.navigation_history.current_index)
-        self.settings.setValue("explorer/current_path", self.current_path)
-        self.settings.setValue("explorer/show_hidden", self.show_hidden_files)
-        self.settings.setValue("explorer/view_mode", self.view_mode)
-        self.settings.setValue("explorer/active_columns", self.active_columns)
-        self.settings.setValue("explorer/sort_column", self.current_sort_column)
-        self.settings.setValue("explorer/sort_order", self.current_sort_order == Qt.SortOrder.AscendingOrder)
+    def _save_settings(self):
+        """Save navigation history and view settings in one grouped write."""
+        settings = self.settings
+        settings.beginGroup(_SETTINGS_GROUP)
+        if self.navigation_history.dirty:
+            # One JSON string instead of a QSettings list with a key per entry
+            settings.setValue(_KEY_HISTORY, json.dumps(self.navigation_history.get_history()))
+            settings.setValue(_KEY_HISTORY_INDEX, self.navigation_history.current_index)
+            self.navigation_history.dirty = False
+        settings.setValue(_KEY_CURRENT_PATH, self.current_path)
+        settings.setValue(_KEY_SHOW_HIDDEN, self.show_hidden_files)
+        settings.setValue(_KEY_VIEW_MODE, self.view_mode)
+        settings.setValue(_KEY_ACTIVE_COLUMNS, self.active_columns)
+        settings.setValue(_KEY_SORT_COLUMN, self.current_sort_column)
+        settings.setValue(_KEY_SORT_ORDER, self.current_sort_order == Qt.SortOrder.AscendingOrder)
+        settings.endGroup()
 
 
 class FileExplorerPanel(AbstractPanel):
@@ -1006,7 +1528,7 @@ class FileExplorerPanel(AbstractPanel):
         
         # Initialize all attributes in __init__
         self.explorer_widget = FileExplorerWidget()
-        self.default_path = QDir.homePath()
+        self.default_path = _home_directory()
         
         self._setup_ui()
         self._connect_signals()
@@ -1027,7 +1549,7 @@ class FileExplorerPanel(AbstractPanel):
             path: New directory path
         """
         # Update window title or status bar with current directory
-        self.setWindowTitle(f"File Explorer - {os.path.basename(path)}")
+        self.setWindowTitle(f"File Explorer - {_display_name(path)}")
         
     def _on_file_selected(self, file_path):
         """Handle file selection.
@@ -1049,7 +1571,7 @@ class FileExplorerPanel(AbstractPanel):
         
     def navigate_to_home(self):
         """Navigate to the user's home directory."""
-        self.explorer_widget.navigate_to(os.path.expanduser("~"))
+        self.explorer_widget.navigate_to(self.explorer_widget.home_directory)
         
     def navigate_to_root(self):
         """Navigate to the root directory."""
@@ -1071,13 +1593,15 @@ class FileExplorerPanel(AbstractPanel):
 class EnhancedFileExplorerPlugin(Plugin):
     """Enhanced File Explorer plugin implementation."""
     
+    __slots__ = ("file_explorer_panel", "default_path")
+    
     def __init__(self, name: str):
         """Initialize the plugin."""
         super().__init__(name, "2.0.0")
         
         # Initialize all attributes in __init__
         self.file_explorer_panel: Optional[FileExplorerPanel] = None
-        self.default_path: str = QDir.homePath()
+        self.default_path: str = _home_directory()
         
     def load(self) -> bool:
         """Load the file explorer plugin."""
@@ -2,11 +2,22 @@
 File Explorer Plugin - Core plugin for file browsing functionality.
 """
 
-from PySide6.QtWidgets import QTreeView, QVBoxLayout, QWidget, QFileSystemModel
+from PySide6.QtWidgets import QTreeView, QVBoxLayout, QWidget
 from PySide6.QtCore import QDir
 
 from core.plugin_manager import Plugin
 from core.abstract_panel import AbstractPanel
+from plugins.core.file_explorer.scandir_model import ScandirTreeModel
+
+
+class NameOnlyFSModel(ScandirTreeModel):
+    """Scandir-backed model that exposes only the name column.
+    
+    Directories are listed with os.scandir when expanded and nothing is
+    stat()ed, since the panel never shows size, type or date.
+    """
+    
+    HEADERS = ("Name",)
 
 
 class FileExplorerPanel(AbstractPanel):
@@ -25,16 +36,11 @@ class FileExplorerPanel(AbstractPanel):
         
         # Create tree view with file system model
         self.tree_view = QTreeView()
-        self.file_model = QFileSystemModel()
-        self.file_model.setRootPath(QDir.currentPath())
+        self.tree_view.setUniformRowHeights(True)
+        self.file_model = NameOnlyFSModel()
         
         self.tree_view.setModel(self.file_model)
-        self.tree_view.setRootIndex(self.file_model.index(QDir.currentPath()))
-        
-        # Hide size, type, and date columns - only show name
-        self.tree_view.hideColumn(1)
-        self.tree_view.hideColumn(2) 
-        self.tree_view.hideColumn(3)
+        self.tree_view.setRootIndex(self.file_model.setRootPath(QDir.currentPath()))
         
         layout.addWidget(self.tree_view)
         self.setWidget(widget)
@@ -52,6 +58,8 @@ class FileExplorerPanel(AbstractPanel):
 class FileExplorerPlugin(Plugin):
     """File Explorer plugin implementation."""
     
+    __slots__ = ("file_explorer_panel",)
+    
     def __init__(self, name: str):
         """Initialize the plugin."""
         super().__init__(name, "1.0.0")
@@ -0,0 +1,631 @@
+"""
+Scandir Tree Model - Lazy file system model backed by os.scandir.
+"""
+
+import fnmatch
+import os
+import re
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractItemModel, QDir, QModelIndex, Qt
+from PySide6.QtWidgets import QFileIconProvider
+
+
+# Sentinels stored in ChildTable.sizes before and after a failed stat()
+_NOT_STATED = -1
+_STAT_FAILED = -2
+
+
+class ChildTable:
+    """Listed entries of one directory, stored column-wise.
+    
+    Each entry is a row across parallel arrays rather than an object, so a
+    directory with many files costs one string per entry plus a few packed
+    bytes. Node objects are only created for sub-directories that are
+    actually used as parents.
+    """
+    
+    __slots__ = ("names", "is_dir", "sizes", "mtimes", "dirs")
+    
+    def __init__(self, names: List[str], is_dir: bytearray):
+        """Initialize the table.
+        
+        Args:
+            names: Entry names
+            is_dir: One byte per entry, non-zero for directories
+        """
+        self.names = names
+        self.is_dir = is_dir
+        self.sizes = array("q", [_NOT_STATED]) * len(names)
+        self.mtimes = array("d", [0.0]) * len(names)
+        self.dirs: Dict[int, "ScandirNode"] = {}  # row -> node, created on demand
+    
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.names)
+    
+    def load_stat(self, row: int, directory: str):
+        """Read size and modification time of an entry on first use.
+        
+        Args:
+            row: Entry row
+            directory: Path of the directory holding the table
+        """
+        if self.sizes[row] != _NOT_STATED:
+            return
+        try:
+            stat = os.stat(os.path.join(directory, self.names[row]), follow_symlinks=False)
+        except OSError:
+            self.sizes[row] = _STAT_FAILED
+            return
+        self.sizes[row] = stat.st_size
+        self.mtimes[row] = stat.st_mtime
+    
+    def reorder(self, perm: List[int]):
+        """Rearrange every column so that new row i is old row perm[i].
+        
+        Args:
+            perm: Permutation of the row numbers
+        """
+        self.names = [self.names[i] for i in perm]
+        self.is_dir = bytearray(self.is_dir[i] for i in perm)
+        self.sizes = array("q", (self.sizes[i] for i in perm))
+        self.mtimes = array("d", (self.mtimes[i] for i in perm))
+        if self.dirs:
+            dirs = {}
+            for row, old_row in enumerate(perm):
+                node = self.dirs.get(old_row)
+                if node is not None:
+                    node.row = row
+                    dirs[row] = node
+            self.dirs = dirs
+
+
+class ScandirNode:
+    """A directory in the ScandirTreeModel tree."""
+    
+    __slots__ = ("path", "parent", "row", "table")
+    
+    def __init__(self, path: str, parent: Optional["ScandirNode"] = None, row: int = 0):
+        """Initialize the node.
+        
+        Args:
+            path: Full directory path
+            parent: Parent directory node (None for the root)
+            row: Row of this directory within its parent
+        """
+        self.path = path
+        self.parent = parent
+        self.row = row
+        self.table: Optional[ChildTable] = None  # None until fetched
+
+
+class ScandirTreeModel(QAbstractItemModel):
+    """File system model that lists directories with os.scandir on demand.
+    
+    Unlike QFileSystemModel it neither stats every entry up front nor
+    watches the file system: children are listed only when a directory is
+    expanded, and size/date are stat()ed only when those columns are shown.
+    It implements the subset of the QFileSystemModel API the file explorer
+    uses, so it can be swapped in for it. Changes on disk are picked up by
+    setting the root path again (the explorer's Hard Refresh).
+    
+    An index's internal pointer is the directory node that lists it, and its
+    row addresses that directory's ChildTable.
+    """
+    
+    # Same role QFileSystemModel uses for the full path
+    FilePathRole = Qt.ItemDataRole.UserRole + 1
+    
+    HEADERS = ("Name", "Size", "Type", "Date Modified")
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        
+        # Initialize all attributes in __init__
+        self._root = ScandirNode("")
+        self._root.table = ChildTable([], bytearray())
+        self._filters = QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot
+        self._name_filters: List[str] = []
+        self._name_match = None  # Compiled name filters, None when unfiltered
+        self._name_filter_disables = True
+        self._options = {}
+        self._icon_provider = QFileIconProvider()
+        self._folder_icon = self._icon_provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = self._icon_provider.icon(QFileIconProvider.IconType.File)
+        self._sort_column = 0
+        self._sort_order = Qt.SortOrder.AscendingOrder
+    
+    # QFileSystemModel-compatible API
+    
+    def setRootPath(self, path: str) -> QModelIndex:
+        """Set the directory whose entries form the top level of the model.
+        
+        Args:
+            path: Directory path
+        
+        Returns:
+            The root index (the invalid index, as the root is not a row)
+        """
+        if path != self._root.path or not path:
+            self._reset_root(path)
+        return QModelIndex()
+    
+    def rootPath(self) -> str:
+        """Return the current root directory path."""
+        return self._root.path
+    
+    def filePath(self, index: QModelIndex) -> str:
+        """Return the full path of the entry at an index.
+        
+        Args:
+            index: Model index
+        
+        Returns:
+            Entry path (the root path for the invalid index)
+        """
+        if not index.isValid():
+            return self._root.path
+        node = index.internalPointer()
+        return os.path.join(node.path, node.table.names[index.row()])
+    
+    def isDir(self, index: QModelIndex) -> bool:
+        """Return whether the entry at an index is a directory.
+        
+        Args:
+            index: Model index
+        
+        Returns:
+            True for directories
+        """
+        if not index.isValid():
+            return bool(self._root.path)
+        return bool(index.internalPointer().table.is_dir[index.row()])
+    
+    def setFilter(self, filters):
+        """Set the QDir filters; only QDir.Filter.Hidden changes the listing.
+        
+        Args:
+            filters: QDir.Filter flags
+        """
+        if filters != self._filters:
+            self._filters = filters
+            self._reset_root(self._root.path)
+    
+    def filter(self):
+        """Return the current QDir filters."""
+        return self._filters
+    
+    def setNameFilters(self, filters: List[str]):
+        """Set glob patterns that file names must match.
+        
+        Args:
+            filters: Glob patterns; an empty list shows every file
+        """
+        filters = list(filters)
+        if filters != self._name_filters:
+            self._name_filters = filters
+            # One regex for all patterns, compiled once rather than per entry;
+            # case-insensitive like QFileSystemModel's default
+            self._name_match = None
+            if filters:
+                self._name_match = re.compile(
+                    "|".join(fnmatch.translate(pattern) for pattern in filters), re.IGNORECASE).match
+            self._reset_root(self._root.path)
+    
+    def nameFilters(self) -> List[str]:
+        """Return the current name filters."""
+        return list(self._name_filters)
+    
+    def setNameFilterDisables(self, enable: bool):
+        """Kept for QFileSystemModel compatibility; filtered files are hidden.
+        
+        Args:
+            enable: Ignored
+        """
+        self._name_filter_disables = bool(enable)
+    
+    def setOption(self, option, on: bool = True):
+        """Record a QFileSystemModel option (none change this model's behaviour).
+        
+        Args:
+            option: QFileSystemModel.Option value
+            on: Whether the option is enabled
+        """
+        self._options[option] = bool(on)
+    
+    def testOption(self, option) -> bool:
+        """Return whether a QFileSystemModel option was enabled.
+        
+        Args:
+            option: QFileSystemModel.Option value
+        
+        Returns:
+            True if the option was set
+        """
+        return self._options.get(option, False)
+    
+    def setIconProvider(self, provider: QFileIconProvider):
+        """Set the icon provider used for the folder and file icons.
+        
+        Args:
+            provider: Icon provider
+        """
+        self._icon_provider = provider
+        self._folder_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+    
+    def iconProvider(self) -> QFileIconProvider:
+        """Return the icon provider."""
+        return self._icon_provider
+    
+    # QAbstractItemModel implementation
+    
+    def index(self, *args) -> QModelIndex:
+        """Return an index by (row, column, parent) or by path.
+        
+        Args:
+            *args: Either (row, column[, parent]) or (path[, column])
+        
+        Returns:
+            Model index, or the invalid index if not found
+        """
+        if args and isinstance(args[0], str):
+            return self._index_for_path(*args)
+        
+        row, column = args[0], args[1]
+        parent = args[2] if len(args) > 2 else QModelIndex()
+        node = self._dir_node(parent)
+        if node is None or node.table is None or not (0 <= row < len(node.table)):
+            return QModelIndex()
+        if not (0 <= column < len(self.HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column, node)
+    
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return the parent index of an index.
+        
+        Args:
+            index: Model index
+        
+        Returns:
+            Parent index (invalid for top-level entries)
+        """
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node.parent)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of listed children of a directory.
+        
+        Args:
+            parent: Directory index
+        
+        Returns:
+            Number of children fetched so far
+        """
+        if parent.column() > 0:
+            return 0
+        node = self._dir_node(parent, create=False)
+        return len(node.table) if node is not None and node.table is not None else 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return len(self.HEADERS)
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Return whether an entry may have children, without listing it.
+        
+        Args:
+            parent: Model index
+        
+        Returns:
+            True for directories
+        """
+        if parent.column() > 0 or not self.isDir(parent):
+            return False
+        node = self._dir_node(parent, create=False)
+        if node is not None and node.table is not None:
+            return bool(len(node.table))
+        return True
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Return whether a directory still has to be listed.
+        
+        Args:
+            parent: Directory index
+        
+        Returns:
+            True if the directory has not been scanned yet
+        """
+        if not self.isDir(parent):
+            return False
+        node = self._dir_node(parent, create=False)
+        return node is None or node.table is None
+    
+    def fetchMore(self, parent: QModelIndex):
+        """List a directory's entries with a single os.scandir pass.
+        
+        Args:
+            parent: Directory index
+        """
+        node = self._dir_node(parent)
+        if node is None or node.table is not None:
+            return
+        table = self._scan(node.path)
+        if not len(table):
+            node.table = table
+            return
+        self.beginInsertRows(parent, 0, len(table) - 1)
+        node.table = table
+        self.endInsertRows()
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return the data for an index and role.
+        
+        Args:
+            index: Model index
+            role: Data role
+        
+        Returns:
+            The requested data, or None
+        """
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        table = node.table
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return table.names[row]
+            if column == 1:
+                if table.is_dir[row]:
+                    return ""
+                table.load_stat(row, node.path)
+                return self._format_size(table.sizes[row])
+            if column == 2:
+                return self._type_name(table.names[row], table.is_dir[row])
+            if column == 3:
+                table.load_stat(row, node.path)
+                if table.sizes[row] == _STAT_FAILED:
+                    return ""
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(table.mtimes[row]))
+        elif role == Qt.ItemDataRole.DecorationRole and column == 0:
+            return self._folder_icon if table.is_dir[row] else self._file_icon
+        elif role == self.FilePathRole:
+            return os.path.join(node.path, table.names[row])
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+    
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return the column titles.
+        
+        Args:
+            section: Column number
+            orientation: Header orientation
+            role: Data role
+        
+        Returns:
+            Column title, or None
+        """
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index: QModelIndex):
+        """Return the item flags for an index."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Sort every listed directory, keeping folders before files.
+        
+        Args:
+            column: Column to sort by
+            order: Sort order
+        """
+        self._sort_column = column
+        self._sort_order = order
+        
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        
+        # Old row -> new row for every table that was reordered
+        new_rows: Dict[int, List[int]] = {}
+        self._sort_tree(self._root, new_rows)
+        
+        new_persistent = []
+        for index in old_persistent:
+            node = index.internalPointer()
+            rows = new_rows.get(id(node))
+            row = rows[index.row()] if rows is not None else index.row()
+            new_persistent.append(self.createIndex(row, index.column(), node))
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+    
+    # Helpers
+    
+    def _dir_node(self, index: QModelIndex, create: bool = True) -> Optional[ScandirNode]:
+        """Return the directory node for an index (the root for the invalid index).
+        
+        Args:
+            index: Model index
+            create: Whether to create the node if the directory has none yet
+        
+        Returns:
+            Directory node, or None for files (and unvisited directories
+            when create is False)
+        """
+        if not index.isValid():
+            return self._root
+        parent = index.internalPointer()
+        table = parent.table
+        row = index.row()
+        node = table.dirs.get(row)
+        if node is None and create and table.is_dir[row]:
+            node = ScandirNode(os.path.join(parent.path, table.names[row]), parent, row)
+            table.dirs[row] = node
+        return node
+    
+    def _reset_root(self, path: str):
+        """Replace the whole tree with a fresh, unlisted root.
+        
+        Args:
+            path: New root directory path
+        """
+        self.beginResetModel()
+        self._root = ScandirNode(path)
+        if not path:
+            self._root.table = ChildTable([], bytearray())
+        self.endResetModel()
+    
+    def _index_for_path(self, path: str, column: int = 0) -> QModelIndex:
+        """Return the index for a path below the root, listing as needed.
+        
+        Args:
+            path: Entry path
+            column: Column of the returned index
+        
+        Returns:
+            Model index, or the invalid index for the root or unknown paths
+        """
+        root_path = self._root.path
+        path = os.path.normpath(path) if path else path
+        if not root_path or path == os.path.normpath(root_path):
+            return QModelIndex()
+        relative = os.path.relpath(path, root_path)
+        if relative.startswith(os.pardir):
+            return QModelIndex()
+        
+        index = QModelIndex()
+        for part in relative.split(os.sep):
+            if self.canFetchMore(index):
+                self.fetchMore(index)
+            node = self._dir_node(index)
+            if node is None or node.table is None:
+                return QModelIndex()
+            try:
+                row = node.table.names.index(part)
+            except ValueError:
+                return QModelIndex()
+            index = self.createIndex(row, 0, node)
+        return index.siblingAtColumn(column) if column else index
+    
+    def _scan(self, directory: str) -> ChildTable:
+        """List a directory's entries, applying the hidden and name filters.
+        
+        Args:
+            directory: Directory path
+        
+        Returns:
+            Sorted table of the entries
+        """
+        show_hidden = bool(self._filters & QDir.Filter.Hidden)
+        name_match = self._name_match
+        names = []
+        is_dir_flags = bytearray()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not show_hidden and name.startswith("."):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if name_match is not None and not is_dir and not name_match(name):
+                        continue
+                    names.append(name)
+                    is_dir_flags.append(is_dir)
+        except OSError:
+            names = []
+            is_dir_flags = bytearray()
+        table = ChildTable(names, is_dir_flags)
+        self._sort_table(table, directory)
+        return table
+    
+    def _sort_tree(self, node: ScandirNode, new_rows: Dict[int, List[int]]):
+        """Sort the listed children of a node and of its listed descendants.
+        
+        Args:
+            node: Directory node
+            new_rows: Filled with old row -> new row lists keyed by id(node)
+        """
+        table = node.table
+        if not table:
+            return
+        perm = self._sort_table(table, node.path)
+        inverse = [0] * len(perm)
+        for row, old_row in enumerate(perm):
+            inverse[old_row] = row
+        new_rows[id(node)] = inverse
+        for child in table.dirs.values():
+            self._sort_tree(child, new_rows)
+    
+    def _sort_table(self, table: ChildTable, directory: str) -> List[int]:
+        """Sort a table in place by the current sort column and order.
+        
+        Args:
+            table: Entries of one directory
+            directory: Path of that directory (for stat() on the Size/Date columns)
+        
+        Returns:
+            The applied permutation (new row -> old row)
+        """
+        column = self._sort_column
+        rows = range(len(table))
+        if column in (1, 3):
+            for row in rows:
+                table.load_stat(row, directory)
+            if column == 1:
+                sizes, is_dir = table.sizes, table.is_dir
+                key = lambda row: 0 if is_dir[row] else max(sizes[row], 0)
+            else:
+                key = table.mtimes.__getitem__
+        elif column == 2:
+            names, is_dir = table.names, table.is_dir
+            key = lambda row: self._type_name(names[row], is_dir[row])
+        else:
+            names = table.names
+            key = lambda row: names[row].casefold()
+        perm = sorted(rows, key=key, reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+        # Folders always come first, as in QFileSystemModel
+        perm.sort(key=lambda row: not table.is_dir[row])
+        table.reorder(perm)
+        return perm
+    
+    @staticmethod
+    def _type_name(name: str, is_dir: bool) -> str:
+        """Return a short type description for an entry."""
+        if is_dir:
+            return "Folder"
+        extension = os.path.splitext(name)[1]
+        return f"{extension[1:].upper()} File" if extension else "File"
+    
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Return a human readable size for a file entry."""
+        if size < 0:
+            return ""
+        size = float(size)
+        for unit in ("bytes", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                return f"{int(size)} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+            size /= 1024
+        return ""
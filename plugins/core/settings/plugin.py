@@ -60,9 +60,15 @@ class SettingsPanel(AbstractPanel):
         info("Opening preferences dialog")
         if not self.preferences_dialog:
             self.preferences_dialog = PreferencesDialog(self)
+            self.preferences_dialog.setModal(True)
+        elif not self.preferences_dialog.isVisible():
+            # Reused dialog: only re-read settings if they may have changed
+            self.preferences_dialog.refresh_settings()
             
-        # Show the dialog
-        self.preferences_dialog.exec()
+        # Show the dialog without a nested event loop
+        self.preferences_dialog.show()
+        self.preferences_dialog.raise_()
+        self.preferences_dialog.activateWindow()
         
     def get_title(self) -> str:
         """Get the panel title.
@@ -76,6 +82,8 @@ class SettingsPanel(AbstractPanel):
 class SettingsPlugin(Plugin):
     """Plugin for settings and preferences."""
     
+    __slots__ = ("settings_panel",)
+    
     def __init__(self, name=None):
         """Initialize the settings plugin."""
         super().__init__("settings" if name is None else name)
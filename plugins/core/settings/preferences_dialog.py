@@ -1,12 +1,13 @@
 """
 Preferences dialog implementation.
 """
+import os
 from typing import Dict, Any, List
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QTabWidget, 
-    QDialogButtonBox
+    QDialogButtonBox, QWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSettings
 
 from core.lg import debug, info
 
@@ -20,7 +21,22 @@ from plugins.core.settings.tabs.logging_settings_tab import LoggingSettingsTab
 
 
 class PreferencesDialog(QDialog):
-    """Preferences dialog with tabs for different setting categories."""
+    """Preferences dialog with tabs for different setting categories.
+    
+    Each tab is created and loaded the first time it is shown, so opening
+    the dialog only builds the tab the user lands on.
+    """
+    
+    # Tabs in display order: (tab name, title, tab class)
+    TAB_FACTORIES = (
+        ("general", "General", GeneralSettingsTab),
+        ("editor", "Editor", EditorSettingsTab),
+        ("translation", "Translation", TranslationSettingsTab),
+        ("appearance", "Appearance", AppearanceSettingsTab),
+        ("keyboard", "Keyboard", KeyboardSettingsTab),
+        ("font", "Fonts", FontSettingsTab),
+        ("logging", "Logging", LoggingSettingsTab),
+    )
     
     def __init__(self, parent=None):
         """Initialize the preferences dialog.
@@ -32,11 +48,14 @@ class PreferencesDialog(QDialog):
         
         # Initialize instance variables
         self.tabs = {}
+        self.settings = QSettings("POEditor", "Settings")  # Shared by all tabs
+        self._loaded_stamp = None  # Settings file mtime the tab widgets reflect
+        self._tabs_stale = False  # Set when edits were cancelled
         self.tab_widget = QTabWidget(self)
         self.button_box = QDialogButtonBox()
         self.main_layout = QVBoxLayout(self)
         
-        # Initialize tab references
+        # Initialize tab references (set as each tab is first shown)
         self.general_tab = None
         self.editor_tab = None
         self.translation_tab = None
@@ -46,7 +65,8 @@ class PreferencesDialog(QDialog):
         self.logging_tab = None
         
         self._setup_ui()
-        self._load_settings()
+        self._materialize_tab(self.tab_widget.currentIndex())
+        self._loaded_stamp = self._settings_stamp()
         
     def _setup_ui(self):
         """Set up the user interface."""
@@ -58,34 +78,14 @@ class PreferencesDialog(QDialog):
         # Tab widget - already initialized in __init__
         self.main_layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.general_tab = GeneralSettingsTab()
-        self.editor_tab = EditorSettingsTab()
-        self.translation_tab = TranslationSettingsTab()
-        self.appearance_tab = AppearanceSettingsTab()
-        self.keyboard_tab = KeyboardSettingsTab()
-        self.font_tab = FontSettingsTab()
-        self.logging_tab = LoggingSettingsTab()
-        
-        # Add tabs to widget
-        self.tab_widget.addTab(self.general_tab, "General")
-        self.tab_widget.addTab(self.editor_tab, "Editor")
-        self.tab_widget.addTab(self.translation_tab, "Translation")
-        self.tab_widget.addTab(self.appearance_tab, "Appearance")
-        self.tab_widget.addTab(self.keyboard_tab, "Keyboard")
-        self.tab_widget.addTab(self.font_tab, "Fonts")
-        self.tab_widget.addTab(self.logging_tab, "Logging")
-        
-        # Store tabs in a dictionary for easier access
-        self.tabs = {
-            "general": self.general_tab,
-            "editor": self.editor_tab,
-            "translation": self.translation_tab,
-            "appearance": self.appearance_tab,
-            "keyboard": self.keyboard_tab,
-            "font": self.font_tab,
-            "logging": self.logging_tab
-        }
+        # Add an empty page per tab; the real tab is built into it when first
+        # shown (self.tabs only holds tabs that exist)
+        for _name, title, _tab_class in self.TAB_FACTORIES:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
         # Button box - already initialized in __init__
         self.button_box = QDialogButtonBox(
@@ -100,8 +100,31 @@ class PreferencesDialog(QDialog):
         
         self.main_layout.addWidget(self.button_box)
         
+    def _materialize_tab(self, index: int):
+        """Create and load the tab at an index if it does not exist yet.
+        
+        Args:
+            index: Tab index
+        """
+        if not 0 <= index < len(self.TAB_FACTORIES):
+            return
+        tab_name, _title, tab_class = self.TAB_FACTORIES[index]
+        if tab_name in self.tabs:
+            return
+            
+        debug(f"Creating preferences tab {tab_name}")
+        # One settings object for every tab, so a save is written out once
+        tab = tab_class(settings=self.settings)
+        try:
+            tab.load_settings()
+        except Exception as e:
+            info(f"Failed to load settings for tab {tab_name}: {str(e)}")
+        self.tab_widget.widget(index).layout().addWidget(tab)
+        self.tabs[tab_name] = tab
+        setattr(self, f"{tab_name}_tab", tab)
+        
     def _load_settings(self):
-        """Load settings for all tabs."""
+        """Reload settings for all created tabs."""
         debug("Loading preferences dialog settings")
         
         # Load settings for each tab
@@ -112,7 +135,7 @@ class PreferencesDialog(QDialog):
                 info(f"Failed to load settings for tab {tab_name}: {str(e)}")
         
     def _save_settings(self):
-        """Save settings for all tabs."""
+        """Save settings for all created tabs (the others were not changed)."""
         debug("Saving preferences dialog settings")
         
         # Save settings for each tab
@@ -121,12 +144,38 @@ class PreferencesDialog(QDialog):
                 tab.save_settings()
             except Exception as e:
                 info(f"Failed to save settings for tab {tab_name}: {str(e)}")
+        self.settings.sync()
+        self._loaded_stamp = self._settings_stamp()
                 
     def accept(self):
         """Handle dialog acceptance."""
         self._save_settings()
         super().accept()
         
+    def reject(self):
+        """Handle dialog cancellation; the edits are discarded on next open."""
+        self._tabs_stale = True
+        super().reject()
+        
+    def refresh_settings(self):
+        """Reload the created tabs if their values may be out of date.
+        
+        That is the case after Cancel (the widgets still hold the discarded
+        edits) or when the settings file changed since it was last read.
+        """
+        if not self._tabs_stale and self._settings_stamp() == self._loaded_stamp:
+            return
+        self._load_settings()
+        self._tabs_stale = False
+        self._loaded_stamp = self._settings_stamp()
+        
+    def _settings_stamp(self):
+        """Return the settings file modification time, or None if it is missing."""
+        try:
+            return os.stat(self.settings.fileName()).st_mtime_ns
+        except OSError:
+            return None
+            
     def get_active_tab(self) -> str:
         """Get the name of the currently active tab.
         
@@ -134,9 +183,8 @@ class PreferencesDialog(QDialog):
             Name of the active tab
         """
         current_index = self.tab_widget.currentIndex()
-        for tab_name, tab in self.tabs.items():
-            if self.tab_widget.indexOf(tab) == current_index:
-                return tab_name
+        if 0 <= current_index < len(self.TAB_FACTORIES):
+            return self.TAB_FACTORIES[current_index][0]
         return ""
         
     def set_active_tab(self, tab_name: str):
@@ -145,8 +193,8 @@ class PreferencesDialog(QDialog):
         Args:
             tab_name: Name of the tab to activate
         """
-        if tab_name in self.tabs:
-            tab = self.tabs[tab_name]
-            index = self.tab_widget.indexOf(tab)
-            if index >= 0:
+        for index, (name, _title, _tab_class) in enumerate(self.TAB_FACTORIES):
+            if name == tab_name:
+                # currentChanged creates the tab if needed
                 self.tab_widget.setCurrentIndex(index)
+                return
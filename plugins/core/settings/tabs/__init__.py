@@ -9,17 +9,18 @@ from PySide6.QtCore import QSettings
 class BaseSettingsTab(QWidget):
     """Base class for settings tabs."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the base settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
         super().__init__(parent)
         
         # Initialize instance variables
         self.main_layout = QVBoxLayout(self)
-        self.settings = QSettings("POEditor", "Settings")
+        self.settings = settings if settings is not None else QSettings("POEditor", "Settings")
         
     def load_settings(self):
         """Load settings from storage.
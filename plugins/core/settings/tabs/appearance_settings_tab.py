@@ -72,13 +72,14 @@ class ColorButton(QPushButton):
 class AppearanceSettingsTab(BaseSettingsTab):
     """Appearance settings tab."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the appearance settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
-        super().__init__(parent)
+        super().__init__(parent, settings)
         
         # Initialize instance variables
         self.theme_group = None
@@ -17,13 +17,14 @@ from core.lg import debug
 class FontSettingsTab(BaseSettingsTab):
     """Font settings tab implementation."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the font settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
-        super().__init__(parent)
+        super().__init__(parent, settings)
         
         # Initialize instance variables
         self.editor_font_group = QGroupBox("Editor Font")
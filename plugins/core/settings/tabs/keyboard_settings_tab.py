@@ -113,13 +113,14 @@ class KeySequenceDialog(QDialog):
 class KeyboardSettingsTab(BaseSettingsTab):
     """Keyboard settings tab."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the keyboard settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
-        super().__init__(parent)
+        super().__init__(parent, settings)
         
         # Initialize instance variables
         self.preset_combo = None
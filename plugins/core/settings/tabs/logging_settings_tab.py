@@ -12,19 +12,20 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from plugins.core.settings.tabs import BaseSettingsTab
-from core.lg import debug
+from core.lg import debug, lg
 
 
 class LoggingSettingsTab(BaseSettingsTab):
     """Logging settings tab implementation."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the logging settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
-        super().__init__(parent)
+        super().__init__(parent, settings)
         
         # Initialize instance variables with actual objects
         self.log_dir_group = QGroupBox("Log Directory")
@@ -134,84 +135,47 @@ class LoggingSettingsTab(BaseSettingsTab):
             self.log_dir_edit.setText(directory)
     
     def load_settings(self):
-        """Load logging settings from storage."""
+        """Load logging settings from the active logger configuration."""
         try:
             # Log directory
-            default_log_dir = os.path.join(os.path.expanduser('~'), '.poeditor', 'logs')
-            log_dir = self.settings.value("logging/log_dir", default_log_dir)
-            
-            if isinstance(log_dir, str):
-                self.log_dir_edit.setText(log_dir)
-            else:
-                self.log_dir_edit.setText(default_log_dir)
+            self.log_dir_edit.setText(lg.log_dir)
             
             # Log options
-            console_logging = self.settings.value("logging/console_logging", True, type=bool)
-            file_logging = self.settings.value("logging/file_logging", True, type=bool)
-            
-            if isinstance(console_logging, bool):
-                self.console_logging_check.setChecked(console_logging)
-            else:
-                self.console_logging_check.setChecked(True)
-                
-            if isinstance(file_logging, bool):
-                self.file_logging_check.setChecked(file_logging)
-            else:
-                self.file_logging_check.setChecked(True)
+            self.console_logging_check.setChecked(bool(lg.console_logging))
+            self.file_logging_check.setChecked(bool(lg.file_logging))
             
             # Log level - populate combo box if needed
             if self.log_level_combo.count() == 0:
                 self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
                 
-            log_level = self.settings.value("logging/log_level", "INFO")
-            if isinstance(log_level, str):
-                index = self.log_level_combo.findText(log_level)
-                if index >= 0:
-                    self.log_level_combo.setCurrentIndex(index)
+            index = self.log_level_combo.findText(logging.getLevelName(lg.log_level))
+            if index >= 0:
+                self.log_level_combo.setCurrentIndex(index)
             
             # Log rotation
-            max_file_size = self.settings.value("logging/max_file_size", 1024 * 1024, type=int)
-            if isinstance(max_file_size, int):
-                max_file_size_kb = max_file_size // 1024  # Convert to KB
-                self.max_file_size_spin.setValue(max_file_size_kb)
-            else:
-                self.max_file_size_spin.setValue(1024)  # Default 1MB
-            
-            backup_count = self.settings.value("logging/backup_count", 5, type=int)
-            if isinstance(backup_count, int):
-                self.backup_count_spin.setValue(backup_count)
-            else:
-                self.backup_count_spin.setValue(5)  # Default 5 backup files
+            self.max_file_size_spin.setValue(lg.max_file_size // 1024)  # Convert to KB
+            self.backup_count_spin.setValue(lg.backup_count)
             
             debug("Logging settings loaded")
         except Exception as e:
             debug(f"Error loading logging settings: {str(e)}")
     
     def save_settings(self):
-        """Save logging settings to storage."""
+        """Save logging settings and apply them to the logger."""
         try:
-            # Log directory
             log_dir = self.log_dir_edit.text()
-            self.settings.setValue("logging/log_dir", log_dir)
-            
-            # Log options
-            console_logging = self.console_logging_check.isChecked()
-            file_logging = self.file_logging_check.isChecked()
-            
-            self.settings.setValue("logging/console_logging", console_logging)
-            self.settings.setValue("logging/file_logging", file_logging)
-            
-            # Log level
-            log_level = self.log_level_combo.currentText()
-            self.settings.setValue("logging/log_level", log_level)
-            
-            # Log rotation
-            max_file_size_kb = self.max_file_size_spin.value()
-            max_file_size = max_file_size_kb * 1024  # Convert to bytes
-            self.settings.setValue("logging/max_file_size", max_file_size)
-            
-            backup_count = self.backup_count_spin.value()
-            self.settings.setValue("logging/backup_count", backup_count)
+            if not log_dir:
+                log_dir = os.path.join(os.path.expanduser('~'), '.poeditor', 'logs')
+                
+            # Saves the JSON config and rebuilds the handlers
+            lg.update_configuration({
+                "log_dir": log_dir,
+                "console_logging": self.console_logging_check.isChecked(),
+                "file_logging": self.file_logging_check.isChecked(),
+                "log_level": logging.getLevelName(self.log_level_combo.currentText()),
+                "max_file_size": self.max_file_size_spin.value() * 1024,  # Convert to bytes
+                "backup_count": self.backup_count_spin.value(),
+            })
             
             debug("Logging settings saved")
         except Exception as e:
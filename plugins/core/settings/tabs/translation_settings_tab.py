@@ -14,13 +14,14 @@ from plugins.core.settings.tabs import BaseSettingsTab
 class TranslationSettingsTab(BaseSettingsTab):
     """Translation settings tab."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         """Initialize the translation settings tab.
         
         Args:
             parent: Parent widget
+            settings: Shared QSettings, or None to open the default store
         """
-        super().__init__(parent)
+        super().__init__(parent, settings)
         
         # Initialize instance variables
         self.po_group = None
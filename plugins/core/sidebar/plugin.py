@@ -26,6 +26,13 @@ except ImportError:
 class SidebarButton(QPushButton):
     """Custom button for sidebar navigation."""
     
+    # Shared by every button instead of building a QSize per instance
+    _FIXED_SIZE = QSize(48, 48)
+    _ICON_SIZE = QSize(24, 24)
+    
+    # Icons decoded from the compiled resources, keyed by icon name
+    _icon_cache: Dict[str, QIcon] = {}
+    
     def __init__(self, text: str, icon_name: Optional[str] = None, parent=None):
         """Initialize the sidebar button.
         
@@ -46,15 +53,14 @@ class SidebarButton(QPushButton):
     def _setup_button(self):
         """Set up the button appearance and behavior."""
         self.setCheckable(True)
-        self.setFixedSize(QSize(48, 48))
+        self.setFixedSize(self._FIXED_SIZE)
         
         # Set icon if icon_name is provided
         if self.icon_name:
-            icon_path = f":/icons/resources/icons/{self.icon_name}.png"
-            icon = QIcon(icon_path)
+            icon = self._load_icon(self.icon_name)
             if not icon.isNull():
                 self.setIcon(icon)
-                self.setIconSize(QSize(24, 24))
+                self.setIconSize(self._ICON_SIZE)
         
         # Set tooltip instead of text
         self.setToolTip(self.text_value)
@@ -65,6 +71,22 @@ class SidebarButton(QPushButton):
         # Set object name for styling
         self.setObjectName("SidebarButton")
         
+    @classmethod
+    def _load_icon(cls, icon_name: str) -> QIcon:
+        """Return the resource icon for a name, loading it only once.
+        
+        Args:
+            icon_name: Name of the icon in the compiled resources
+            
+        Returns:
+            The icon (null if the resource does not exist)
+        """
+        icon = cls._icon_cache.get(icon_name)
+        if icon is None:
+            icon = QIcon(f":/icons/resources/icons/{icon_name}.png")
+            cls._icon_cache[icon_name] = icon
+        return icon
+        
     def set_active(self, active: bool):
         """Set the button active state.
         
@@ -283,6 +305,8 @@ class SidebarPanel(AbstractPanel):
 class SidebarPlugin(Plugin):
     """Sidebar plugin implementation."""
     
+    __slots__ = ("sidebar_panel",)
+    
     def __init__(self, name=None):
         """Initialize the plugin."""
         super().__init__("sidebar" if name is None else name, "1.0.0")
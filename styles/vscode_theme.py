@@ -78,6 +78,10 @@ QTreeView::branch {
     background-color: transparent;
 }
 
+#ExplorerToolButton {
+    font-size: 18px;
+}
+
 /* Toolbar */
 QWidget#toolbar {
     background-color: #252526;
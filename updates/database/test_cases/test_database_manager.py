@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Test cases for the database manager.
+"""
+import sys
+import pytest
+from pathlib import Path
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+# Add project root to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from core.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def app():
+    """Provide a Qt application so queued signals can be delivered."""
+    application = QApplication.instance() or QApplication([])
+    yield application
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Provide an initialized DatabaseManager backed by a temporary file."""
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    assert manager.initialize()
+    yield manager
+    manager.close()
+
+
+class TestDatabaseSetup:
+    """Tests for connection setup."""
+
+    def test_wal_mode_enabled(self, db_manager):
+        """Test that the default profile switches the journal to WAL."""
+        rows = db_manager.execute_query("PRAGMA journal_mode")
+        assert rows[0][0] == "wal"
+
+    def test_low_resource_profile(self, tmp_path):
+        """Test that the low-resource profile shrinks the page cache."""
+        manager = DatabaseManager(str(tmp_path / "low.db"), profile="low_resource")
+        assert manager.initialize()
+        rows = manager.execute_query("PRAGMA cache_size")
+        assert rows[0][0] == -2000
+        manager.close()
+
+    def test_unknown_profile(self, tmp_path):
+        """Test that an unknown profile is rejected."""
+        with pytest.raises(ValueError):
+            DatabaseManager(str(tmp_path / "bad.db"), profile="turbo")
+
+    def test_not_connected_raises(self, tmp_path):
+        """Test that using the manager before initialize() is not silently ignored."""
+        manager = DatabaseManager(str(tmp_path / "unused.db"))
+        with pytest.raises(RuntimeError):
+            manager.get_setting("theme")
+
+    def test_close_checkpoints_wal(self, tmp_path):
+        """Test that closing truncates the write-ahead log."""
+        db_file = tmp_path / "close.db"
+        manager = DatabaseManager(str(db_file))
+        assert manager.initialize()
+        manager.set_setting("theme", "dark")
+        manager.close()
+
+        wal_file = tmp_path / "close.db-wal"
+        assert not wal_file.exists() or wal_file.stat().st_size == 0
+
+    def test_initialize_async(self, app, tmp_path):
+        """Test that initialize_async opens the database off the calling thread."""
+        manager = DatabaseManager(str(tmp_path / "async.db"))
+        events = []
+        manager.database_connected.connect(lambda: events.append("connected"))
+        manager.initialization_finished.connect(lambda: events.append("finished"))
+
+        manager.initialize_async()
+        assert QThreadPool.globalInstance().waitForDone(5000)
+        app.processEvents()
+
+        assert events == ["connected", "finished"]
+        assert manager.get_setting("theme", "light") == "light"
+        manager.close()
+
+
+class TestSettings:
+    """Tests for the settings helpers."""
+
+    def test_set_and_get_setting(self, db_manager):
+        """Test a setting round-trip."""
+        assert db_manager.set_setting("theme", "dark")
+        assert db_manager.get_setting("theme") == "dark"
+        assert db_manager.get_setting("missing", "default") == "default"
+
+
+class TestTranslationMemory:
+    """Tests for the translation memory helpers."""
+
+    def test_add_translation(self, db_manager):
+        """Test adding a single translation."""
+        assert db_manager.add_translation("Hello", "Xin chào", "en", "vi")
+        results = db_manager.search_translations("Hello")
+        assert len(results) == 1
+        assert results[0]["target_text"] == "Xin chào"
+
+    def test_add_translations_batch(self, db_manager):
+        """Test adding translations in a single batch."""
+        rows = [(f"source {i}", f"target {i}", "en", "vi", None) for i in range(100)]
+        assert db_manager.add_translations(rows) == 100
+        count = db_manager.execute_query("SELECT COUNT(*) FROM translation_memory")
+        assert count[0][0] == 100
+
+    def test_batch_writer_flushes_on_stop(self, db_manager):
+        """Test that queued translations are written when the writer stops."""
+        db_manager.start_batch_writer(batch_wait_ms=10)
+        for i in range(50):
+            assert db_manager.queue_translation(f"queued {i}", f"target {i}", "en", "vi")
+        db_manager.stop_batch_writer()
+
+        count = db_manager.execute_query("SELECT COUNT(*) FROM translation_memory")
+        assert count[0][0] == 50
+
+    def test_queue_translation_without_writer(self, db_manager):
+        """Test that queueing falls back to a direct write."""
+        assert db_manager.queue_translation("direct", "trực tiếp", "en", "vi")
+        assert len(db_manager.search_translations("direct")) == 1
+
+
+class TestIndexes:
+    """Tests for the lookup indexes."""
+
+    def test_recent_files_uses_index(self, db_manager):
+        """Test that listing recent files is served by an index."""
+        plan = db_manager.execute_query(
+            "EXPLAIN QUERY PLAN SELECT file_path FROM recent_files "
+            "ORDER BY last_opened DESC LIMIT 10"
+        )
+        assert any("idx_recent_opened" in row["detail"] for row in plan)
+
+    def test_language_filter_uses_index(self, db_manager):
+        """Test that language-filtered lookups are served by an index."""
+        plan = db_manager.execute_query(
+            "EXPLAIN QUERY PLAN SELECT source_text FROM translation_memory "
+            "WHERE source_lang = ? AND target_lang = ? ORDER BY updated_at DESC",
+            ("en", "vi")
+        )
+        assert any("idx_tm_langs" in row["detail"] for row in plan)
+
+
+class TestFullTextSearch:
+    """Tests for the FTS5-backed translation search."""
+
+    def test_prefix_match(self, db_manager):
+        """Test that query terms match word prefixes in source and target."""
+        db_manager.add_translation("Open file", "Mở tệp", "en", "vi")
+        db_manager.add_translation("Save file", "Lưu tệp", "en", "vi")
+        assert len(db_manager.search_translations("fil")) == 2
+        assert len(db_manager.search_translations("Lưu")) == 1
+
+    def test_language_filters(self, db_manager):
+        """Test that language filters narrow the search."""
+        db_manager.add_translation("File", "Tệp", "en", "vi")
+        db_manager.add_translation("File", "Fichier", "en", "fr")
+        results = db_manager.search_translations("file", target_lang="fr")
+        assert [row["target_text"] for row in results] == ["Fichier"]
+
+    def test_both_language_filters(self, db_manager):
+        """Test filtering by source and target language together."""
+        db_manager.add_translation("File", "Tệp", "en", "vi")
+        db_manager.add_translation("File", "Datei", "en", "de")
+        db_manager.add_translation("Fichier", "Tệp", "fr", "vi")
+        results = db_manager.search_translations("file", source_lang="en", target_lang="vi")
+        assert [row["target_text"] for row in results] == ["Tệp"]
+        results = db_manager.search_translations("tệp", source_lang="fr")
+        assert [row["source_text"] for row in results] == ["Fichier"]
+
+    def test_operators_are_literal(self, db_manager):
+        """Test that FTS5 syntax in user input does not raise."""
+        db_manager.add_translation("Quote \"me\"", "Trích", "en", "vi")
+        assert db_manager.search_translations("\"me") is not None
+        assert db_manager.search_translations("NOT AND") == []
+        assert db_manager.search_translations("   ") == []
+
+    def test_update_keeps_index_in_sync(self, db_manager):
+        """Test that re-adding a translation does not duplicate search hits."""
+        db_manager.add_translation("Close", "Đóng", "en", "vi", "menu")
+        db_manager.add_translation("Close", "Đóng", "en", "vi", "button")
+        results = db_manager.search_translations("close")
+        assert len(results) == 1
+        assert results[0]["context"] == "button"
+
+    def test_existing_rows_are_indexed(self, tmp_path):
+        """Test that rows written before the FTS table existed are searchable."""
+        import sqlite3
+        db_file = tmp_path / "legacy.db"
+        connection = sqlite3.connect(str(db_file))
+        connection.execute("""
+            CREATE TABLE translation_memory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_text TEXT NOT NULL,
+                target_text TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                context TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(source_text, target_text, source_lang, target_lang)
+            )
+        """)
+        connection.execute(
+            "INSERT INTO translation_memory (source_text, target_text, source_lang, target_lang) "
+            "VALUES ('Legacy entry', 'Cũ', 'en', 'vi')"
+        )
+        connection.commit()
+        connection.close()
+
+        manager = DatabaseManager(str(db_file))
+        assert manager.initialize()
+        assert len(manager.search_translations("legacy")) == 1
+        manager.close()
+
+
+class TestReaderPool:
+    """Tests for the read-only connection pool."""
+
+    def test_reads_use_read_only_connection(self, db_manager):
+        """Test that execute_query runs on a query-only connection."""
+        rows = db_manager.execute_query("PRAGMA query_only")
+        assert rows[0][0] == 1
+
+    def test_reads_see_committed_writes(self, db_manager):
+        """Test that pooled readers observe writes from the writer connection."""
+        db_manager.set_setting("language", "vi")
+        assert db_manager.get_setting("language") == "vi"
+        db_manager.set_setting("language", "fr")
+        assert db_manager.get_setting("language") == "fr"
+
+    def test_concurrent_readers(self, db_manager):
+        """Test that several threads can read at once without exceeding the pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        db_manager.set_setting("shared", "value")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: db_manager.get_setting("shared"), range(64)))
+        assert results == ["value"] * 64
+        assert db_manager._reader_count <= db_manager.pool_size
+
+    def test_memory_database_disables_pool(self):
+        """Test that a private in-memory database reads through the writer."""
+        manager = DatabaseManager(":memory:", profile="in_memory")
+        assert manager.initialize()
+        assert manager.pool_size == 0
+        manager.set_setting("key", "value")
+        assert manager.get_setting("key") == "value"
+        manager.close()
+
+    def test_setting_types_round_trip(self, db_manager):
+        """Test that non-string settings keep their Python type."""
+        values = {
+            "count": 42,
+            "ratio": 0.5,
+            "enabled": False,
+            "columns": ["name", "size"],
+            "window": {"width": 800, "height": 600},
+            "numeric_text": "123",
+        }
+        for key, value in values.items():
+            assert db_manager.set_setting(key, value)
+        for key, value in values.items():
+            assert db_manager.get_setting(key) == value
+
+    def test_legacy_text_value(self, db_manager):
+        """Test that values stored as plain text are still readable."""
+        db_manager.execute_update(
+            "INSERT INTO settings (key, value) VALUES (?, ?)", ("legacy", "dark theme")
+        )
+        assert db_manager.get_setting("legacy") == "dark theme"
+
+
+class TestPluginData:
+    """Tests for the plugin data helpers."""
+
+    def test_plugin_data_round_trip(self, db_manager):
+        """Test storing and reading plugin data."""
+        assert db_manager.set_plugin_data("explorer", "bookmarks", ["/tmp", "/home"])
+        assert db_manager.get_plugin_data("explorer", "bookmarks") == ["/tmp", "/home"]
+        assert db_manager.get_plugin_data("explorer", "missing", 0) == 0
+
+
+class TestRecentFiles:
+    """Tests for the recent files helpers."""
+
+    def test_add_recent_file(self, db_manager):
+        """Test adding a single recent file."""
+        assert db_manager.add_recent_file("/tmp/a.po", 100, 10)
+        files = db_manager.get_recent_files()
+        assert [row["file_path"] for row in files] == ["/tmp/a.po"]
+
+    def test_add_recent_files_from_generator(self, db_manager):
+        """Test bulk-importing recent files from a generator."""
+        items = ((f"/tmp/file_{i}.po", i, None) for i in range(20))
+        assert db_manager.add_recent_files(items) == 20
+        assert len(db_manager.get_recent_files(limit=50)) == 20
+
+    def test_failed_batch_rolls_back(self, db_manager):
+        """Test that a failing row leaves no partial batch behind."""
+        items = [("/tmp/ok.po", 1, 1), (None, 2, 2)]  # file_path is NOT NULL
+        assert db_manager.add_recent_files(items) == 0
+        assert db_manager.get_recent_files() == []
+
+
+class TestPlannerStatistics:
+    """Tests for statistics maintenance on close."""
+
+    def test_close_analyzes_after_large_import(self, tmp_path):
+        """Test that closing after a large import leaves planner statistics."""
+        import sqlite3
+        from core.database_manager import ANALYZE_THRESHOLD
+
+        db_file = tmp_path / "stats.db"
+        manager = DatabaseManager(str(db_file))
+        assert manager.initialize()
+        rows = [(f"source {i}", f"target {i}", "en", "vi", None)
+                for i in range(ANALYZE_THRESHOLD)]
+        assert manager.add_translations(rows) == ANALYZE_THRESHOLD
+        manager.close()
+
+        connection = sqlite3.connect(str(db_file))
+        stats = connection.execute(
+            "SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'translation_memory'"
+        ).fetchone()
+        connection.close()
+        assert stats[0] > 0
+
+
+class TestStreaming:
+    """Tests for the streaming query helpers."""
+
+    def test_iter_query_yields_all_rows(self, db_manager):
+        """Test that iter_query streams every row across fetch chunks."""
+        db_manager.add_recent_files((f"/tmp/stream_{i}.po", i, None) for i in range(25))
+        rows = list(db_manager.iter_query(
+            "SELECT file_path FROM recent_files ORDER BY file_size", arraysize=4
+        ))
+        assert len(rows) == 25
+        assert rows[0]["file_path"] == "/tmp/stream_0.po"
+
+    def test_iter_query_returns_reader_when_closed(self, db_manager):
+        """Test that abandoning a stream hands its connection back to the pool."""
+        db_manager.add_recent_files((f"/tmp/stream_{i}.po", i, None) for i in range(10))
+        stream = db_manager.iter_query("SELECT file_path FROM recent_files", arraysize=2)
+        next(stream)
+        stream.close()
+        assert db_manager._reader_pool.qsize() == db_manager._reader_count
+
+    def test_iter_translations_unbounded(self, db_manager):
+        """Test that iter_translations without a limit returns every match."""
+        db_manager.add_translations(
+            [(f"Menu item {i}", f"Mục {i}", "en", "vi", None) for i in range(30)]
+        )
+        assert len(list(db_manager.iter_translations("menu"))) == 30
+        assert len(db_manager.search_translations("menu")) == 10
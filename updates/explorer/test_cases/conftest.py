@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the file explorer tests.
+"""
+import pytest
+from PySide6.QtCore import QSettings
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path_factory):
+    """Give each test its own empty QSettings store.
+    
+    The explorer saves its settings when closed, so without this one test's
+    view mode, columns or path would leak into the next.
+    """
+    settings_dir = str(tmp_path_factory.mktemp("settings"))
+    for settings_format in (QSettings.Format.NativeFormat, QSettings.Format.IniFormat):
+        QSettings.setPath(settings_format, QSettings.Scope.UserScope, settings_dir)
+    yield
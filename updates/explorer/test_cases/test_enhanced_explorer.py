@@ -4,17 +4,22 @@ Test cases for the enhanced file explorer.
 """
 import sys
 import os
+import json
 import pytest
 from pathlib import Path
-from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import QDir, QTimer, Qt, QItemSelectionModel
+from PySide6.QtWidgets import QApplication, QMainWindow, QFileSystemModel
+from PySide6.QtCore import QDir, QEvent, QFileInfo, QModelIndex, QPoint, QThreadPool, QTimer, Qt, QItemSelectionModel
 from PySide6.QtTest import QTest
-from PySide6.QtGui import QClipboard
+from PySide6.QtGui import QAction, QClipboard, QHelpEvent
 
 # Add project root to sys.path for imports
 sys.path.insert(0, str(Path(__file__).parents[3]))
 
 from plugins.core.file_explorer.enhanced_plugin import (
+    _expand_home,
+    _home_directory,
+    DirectoryCountTask,
+    EnhancedFileExplorerPlugin,
     FileExplorerWidget, 
     NavigationHistory, 
     FileExplorerPanel
@@ -39,7 +44,7 @@ class TestNavigationHistory:
         
         assert len(history.history) == 3
         assert history.current_index == 2
-        assert history.history == ["/tmp", "/home", "/usr"]
+        assert history.get_history() == ["/tmp", "/home", "/usr"]
         
     def test_go_back_forward(self):
         """Test navigation back and forward."""
@@ -89,9 +94,50 @@ class TestNavigationHistory:
         history.add_path("/path4")
         
         assert len(history.history) == 3
-        assert history.history == ["/path2", "/path3", "/path4"]
+        assert history.get_history() == ["/path2", "/path3", "/path4"]
         assert history.current_index == 2
 
+    def test_add_path_drops_forward_history(self):
+        """Test that a new path after going back discards forward entries."""
+        history = NavigationHistory(max_history=3)
+        for path in ("/a", "/b", "/c"):
+            history.add_path(path)
+        history.go_back()
+        history.go_back()
+        history.add_path("/d")
+        
+        assert history.get_history() == ["/a", "/d"]
+        assert history.current_index == 1
+        assert not history.can_go_forward()
+
+    def test_dirty_tracking(self):
+        """Test that only real history changes mark it for saving."""
+        history = NavigationHistory()
+        history.add_path("/a")
+        assert history.dirty
+        
+        history.dirty = False
+        history.add_path("/a")
+        history.go_forward()
+        assert not history.dirty
+        
+        history.add_path("/b")
+        history.dirty = False
+        history.go_back()
+        assert history.dirty
+
+    def test_remove_paths(self):
+        """Test removing entries keeps the position on a nearby entry."""
+        history = NavigationHistory()
+        for path in ("/a", "/b", "/c", "/d"):
+            history.add_path(path)
+        history.go_back()
+        
+        assert history.remove_paths({"/c"})
+        assert history.get_history() == ["/a", "/b", "/d"]
+        assert history.get_current() == "/b"
+        assert not history.remove_paths({"/x"})
+
 
 @pytest.fixture
 def app():
@@ -166,6 +212,474 @@ class TestFileExplorerWidget:
         else:
             pytest.skip("Test requires ~/Documents directory")
 
+    def test_set_root_path_sets_root_index(self, explorer_widget, tmp_path):
+        """Test that the tree view root follows the new root path."""
+        explorer_widget.set_root_path(str(tmp_path))
+
+        root_index = explorer_widget.tree_view.rootIndex()
+        assert explorer_widget.file_model.filePath(root_index) == str(tmp_path)
+
+    def test_set_root_path_ignores_missing(self, explorer_widget, tmp_path):
+        """Test that a non-directory path leaves the current path unchanged."""
+        previous = explorer_widget.current_path
+        explorer_widget.set_root_path(str(tmp_path / "missing"))
+        assert explorer_widget.current_path == previous
+
+    def test_navigate_to_checks_directory_once(self, explorer_widget, tmp_path, monkeypatch):
+        """Test that navigating stats the target directory only once."""
+        checked = []
+        isdir = os.path.isdir
+        monkeypatch.setattr(os.path, "isdir", lambda path: checked.append(path) or isdir(path))
+        explorer_widget.navigate_to(str(tmp_path))
+        assert checked == [str(tmp_path)]
+        assert explorer_widget.current_path == str(tmp_path)
+
+    def test_navigation_actions_synced_on_menu_show(self, explorer_widget, tmp_path):
+        """Test that Previous/Next are enabled when the menu opens."""
+        explorer_widget.navigate_to(str(tmp_path))
+        explorer_widget.nav_button.menu().aboutToShow.emit()
+        assert explorer_widget.back_action.isEnabled()
+        assert not explorer_widget.forward_action.isEnabled()
+
+        explorer_widget._go_back()
+        explorer_widget.nav_button.menu().aboutToShow.emit()
+        assert explorer_widget.forward_action.isEnabled()
+
+    def test_filter_pattern_set_once(self, explorer_widget, monkeypatch):
+        """Test that re-applying the same glob does not reset the model filters."""
+        calls = []
+        set_name_filters = explorer_widget.file_model.setNameFilters
+        monkeypatch.setattr(explorer_widget.file_model, "setNameFilters",
+                            lambda filters: calls.append(filters) or set_name_filters(filters))
+        explorer_widget._apply_filter_pattern("*.po")
+        explorer_widget._apply_filter_pattern("*.po")
+        explorer_widget._apply_filter_pattern("")
+        explorer_widget._apply_filter_pattern("")
+        assert calls == [["*.po"], []]
+
+    def test_path_display_name(self, explorer_widget, tmp_path):
+        """Test the path editor shows the basename, or the path for a root."""
+        explorer_widget.set_root_path(str(tmp_path))
+        assert explorer_widget.path_edit.text() == tmp_path.name
+        assert explorer_widget.path_edit.toolTip() == str(tmp_path)
+
+        explorer_widget.set_root_path("/")
+        assert explorer_widget.path_edit.text() == "/"
+
+    def test_set_view_mode_keeps_model(self, explorer_widget, tmp_path):
+        """Test that switching view modes reconfigures the view in place."""
+        explorer_widget.set_root_path(str(tmp_path))
+        selection_model = explorer_widget.tree_view.selectionModel()
+        root_index = explorer_widget.tree_view.rootIndex()
+        header = explorer_widget.tree_view.header()
+
+        explorer_widget._set_view_mode("gallery")
+        assert header.isSectionHidden(1)
+        explorer_widget._set_view_mode("list")
+        assert explorer_widget.tree_view.selectionModel() is selection_model
+        assert explorer_widget.tree_view.rootIndex() == root_index
+        assert header.isSectionHidden(1) == ("size" not in explorer_widget.active_columns)
+        assert header.isSectionHidden(2) == ("kind" not in explorer_widget.active_columns)
+
+    def test_bulk_header_update_restores_updates(self, explorer_widget):
+        """Test that nested bulk header updates re-enable repaints once."""
+        with explorer_widget._bulk_header_update():
+            with explorer_widget._bulk_header_update():
+                assert not explorer_widget.tree_view.updatesEnabled()
+            assert not explorer_widget.tree_view.updatesEnabled()
+        assert explorer_widget.tree_view.updatesEnabled()
+
+    def test_toggle_column_uses_column_width(self, explorer_widget):
+        """Test that a shown column gets its configured width."""
+        if "date_modified" in explorer_widget.active_columns:
+            explorer_widget._toggle_column("date_modified", 3)
+        explorer_widget._toggle_column("date_modified", 3)
+        header = explorer_widget.tree_view.header()
+        assert header.sectionSize(3) == explorer_widget.COLUMN_WIDTHS["date_modified"]
+        explorer_widget._toggle_column("date_modified", 3)
+
+    def test_sort_actions_follow_sort_column(self, explorer_widget):
+        """Test that only the sorted column's action stays checked."""
+        explorer_widget.sort_actions = [QAction(str(i), explorer_widget, checkable=True)
+                                        for i in range(3)]
+        explorer_widget._on_sort_changed(1, Qt.SortOrder.AscendingOrder)
+        explorer_widget._on_sort_changed(2, Qt.SortOrder.DescendingOrder)
+        assert [action.isChecked() for action in explorer_widget.sort_actions] == [False, False, True]
+
+    def test_unchanged_sort_is_skipped(self, explorer_widget, monkeypatch):
+        """Test that re-selecting the current sort does not resort the model."""
+        explorer_widget._set_sort_column(1)
+        calls = []
+        monkeypatch.setattr(explorer_widget.tree_view, "sortByColumn",
+                            lambda column, order: calls.append((column, order)))
+        explorer_widget._set_sort_column(1)
+        explorer_widget._set_sort_order(explorer_widget.current_sort_order)
+        assert calls == []
+
+        explorer_widget._set_sort_order(Qt.SortOrder.DescendingOrder
+                                        if explorer_widget.current_sort_order == Qt.SortOrder.AscendingOrder
+                                        else Qt.SortOrder.AscendingOrder)
+        assert len(calls) == 1
+
+    def test_refresh_is_debounced(self, explorer_widget, monkeypatch):
+        """Test that rapid refresh requests collapse into one refresh."""
+        calls = []
+        monkeypatch.setattr(explorer_widget.file_model, "setRootPath",
+                            lambda path: calls.append(path) or QModelIndex())
+
+        for _ in range(5):
+            explorer_widget._refresh()
+        assert calls == []
+
+        QTest.qWait(explorer_widget._refresh_timer.interval() + 50)
+        assert calls == [explorer_widget.current_path]
+
+    def test_sorting_enabled_after_root_set(self, explorer_widget):
+        """Test that sorting is on once the widget has its root."""
+        assert explorer_widget.tree_view.isSortingEnabled()
+        assert explorer_widget.tree_view.rootIndex().isValid()
+
+    def test_tree_view_uses_uniform_row_heights(self, explorer_widget):
+        """Test that the tree view caches a single row height."""
+        assert explorer_widget.tree_view.uniformRowHeights()
+        assert not explorer_widget.tree_view.alternatingRowColors()
+
+    def test_file_selected_is_coalesced(self, explorer_widget):
+        """Test that rapid clicks emit file_selected once for the last item."""
+        emitted = []
+        explorer_widget.file_selected.connect(emitted.append)
+        root = explorer_widget.tree_view.rootIndex()
+
+        explorer_widget._on_item_clicked(root)
+        explorer_widget._on_item_clicked(root)
+        assert emitted == []
+
+        QTest.qWait(explorer_widget._selection_timer.interval() + 50)
+        assert emitted == [explorer_widget.file_model.filePath(root)]
+
+    def test_model_uses_generic_icons(self, explorer_widget, tmp_path):
+        """Test that folders and files share one generic icon each."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.po").write_text("b")
+
+        provider = explorer_widget.file_model.iconProvider()
+        assert provider is explorer_widget.icon_provider
+        assert explorer_widget.file_model.testOption(
+            QFileSystemModel.Option.DontUseCustomDirectoryIcons)
+        icon_a = provider.icon(QFileInfo(str(tmp_path / "a.txt")))
+        icon_b = provider.icon(QFileInfo(str(tmp_path / "b.po")))
+        assert icon_a.cacheKey() == icon_b.cacheKey()
+
+    def test_go_up_stops_at_root(self, explorer_widget, tmp_path):
+        """Test going up to the parent directory, stopping at the root."""
+        child = tmp_path / "child"
+        child.mkdir()
+        explorer_widget.navigate_to(str(child))
+
+        explorer_widget._go_up()
+        assert explorer_widget.current_path == str(tmp_path)
+
+        if os.name != "nt":
+            explorer_widget.navigate_to("/")
+            explorer_widget._go_up()
+            assert explorer_widget.current_path == "/"
+
+    def test_set_root_path_keeps_unchanged_text(self, explorer_widget, tmp_path):
+        """Test that re-setting the same root does not re-emit textChanged."""
+        explorer_widget.set_root_path(str(tmp_path))
+        changes = []
+        explorer_widget.path_edit.textChanged.connect(changes.append)
+
+        explorer_widget.set_root_path(str(tmp_path))
+        assert changes == []
+
+    def test_count_entries(self, explorer_widget, tmp_path):
+        """Test counting visible and hidden entries in one pass."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / ".hidden").write_text("h")
+
+        assert explorer_widget._count_entries(str(tmp_path)) == (2, 1)
+        assert explorer_widget._count_entries(str(tmp_path / "missing")) == (0, 0)
+
+    def test_scan_counts_rescan_on_change(self, explorer_widget, tmp_path, monkeypatch):
+        """Test that counts are reused until the directory's mtime changes."""
+        (tmp_path / "a.txt").write_text("a")
+        scans = []
+        count_entries = FileExplorerWidget._count_entries
+        monkeypatch.setattr(FileExplorerWidget, "_count_entries",
+                            staticmethod(lambda path: scans.append(path) or count_entries(path)))
+
+        entry = FileExplorerWidget._scan_counts(str(tmp_path), None)
+        assert entry[1:] == (1, 0)
+        assert FileExplorerWidget._scan_counts(str(tmp_path), entry) is entry
+        assert len(scans) == 1
+
+        (tmp_path / "b.txt").write_text("b")
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert FileExplorerWidget._scan_counts(str(tmp_path), entry)[1:] == (2, 0)
+        assert len(scans) == 2
+        assert FileExplorerWidget._scan_counts(str(tmp_path / "missing"), None) is None
+
+    def test_count_cache_is_bounded(self, explorer_widget, monkeypatch):
+        """Test that the oldest directory is evicted once the cache is full."""
+        monkeypatch.setattr(type(explorer_widget), "COUNT_CACHE_SIZE", 2)
+        for name in ("a", "b", "c"):
+            explorer_widget._remember_counts(name, (1, 0, 0))
+        assert list(explorer_widget._count_cache) == ["b", "c"]
+
+        explorer_widget._remember_counts("b", None)
+        assert list(explorer_widget._count_cache) == ["c"]
+
+    def test_count_task_reports_to_gui_thread(self, explorer_widget, tmp_path):
+        """Test that a background count lands in the widget's cache."""
+        (tmp_path / "a.txt").write_text("a")
+        task = DirectoryCountTask(str(tmp_path), None, explorer_widget._count_signals)
+
+        QThreadPool.globalInstance().start(task)
+        assert QThreadPool.globalInstance().waitForDone(5000)
+        QApplication.processEvents()
+
+        assert explorer_widget._count_cache[str(tmp_path)][1:] == (1, 0)
+
+    def test_path_tooltip_text(self, explorer_widget):
+        """Test the tooltip with and without known entry counts."""
+        path = explorer_widget.current_path
+        assert explorer_widget._path_tooltip(None) == f"<b>{path}</b>"
+
+        explorer_widget.show_hidden_files = False
+        assert explorer_widget._path_tooltip((3, 2)) == f"<b>{path}</b><br>3 items"
+
+        explorer_widget.show_hidden_files = True
+        assert explorer_widget._path_tooltip((3, 2)) == f"<b>{path}</b><br>3 items (2 hidden)"
+
+    def test_tooltip_recount_is_deferred(self, explorer_widget, monkeypatch):
+        """Test that a tooltip event only schedules the directory recount."""
+        scans = []
+        monkeypatch.setattr(FileExplorerWidget, "_scan_counts",
+                            staticmethod(lambda path, cached: scans.append(path)))
+
+        event = QHelpEvent(QEvent.Type.ToolTip, QPoint(1, 1), QPoint(1, 1))
+        for _ in range(3):
+            assert explorer_widget.eventFilter(explorer_widget.path_edit, event)
+
+        assert scans == []
+        assert explorer_widget._tooltip_timer.isActive()
+
+    def test_glob_text_starts_filter(self, explorer_widget):
+        """Test that only text with glob characters schedules filtering."""
+        explorer_widget._on_path_text_changed("Documents")
+        assert not explorer_widget.filter_timer.isActive()
+
+        for pattern in ("*.po", "file?.txt", "[ab]*"):
+            explorer_widget.filter_timer.stop()
+            explorer_widget._on_path_text_changed(pattern)
+            assert explorer_widget.filter_timer.isActive()
+
+    def test_path_changed_expands_user_and_vars(self, explorer_widget, tmp_path, monkeypatch):
+        """Test that ~ and environment variables in typed paths are expanded."""
+        monkeypatch.setenv("EXPLORER_TEST_DIR", str(tmp_path))
+        explorer_widget.path_edit.setText("$EXPLORER_TEST_DIR")
+        explorer_widget._on_path_changed()
+        assert explorer_widget.current_path == str(tmp_path)
+
+        explorer_widget.path_edit.setText("~")
+        explorer_widget._on_path_changed()
+        assert explorer_widget.current_path == os.path.expanduser("~")
+
+        explorer_widget.path_edit.setText(str(tmp_path / "missing"))
+        explorer_widget._on_path_changed()
+        assert explorer_widget.current_path == os.path.expanduser("~")
+
+    def test_path_glob_anchors_at_literal_prefix(self, explorer_widget, tmp_path):
+        """Test that a glob with directories roots at its literal prefix."""
+        explorer_widget.path_edit.setText(str(tmp_path / "**" / "*.po"))
+        explorer_widget._on_path_changed()
+        assert explorer_widget.current_path == str(tmp_path)
+        assert explorer_widget.path_filter == "*.po"
+        assert explorer_widget.file_model.nameFilters() == ["*.po"]
+        assert not explorer_widget.filter_timer.isActive()
+
+    def test_relative_path_glob_uses_shown_folder(self, explorer_widget, tmp_path, monkeypatch):
+        """Test that a relative glob prefix resolves against the shown folder."""
+        root = tmp_path / "root"
+        (root / "locale").mkdir(parents=True)
+        (tmp_path / "cwd" / "locale").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path / "cwd")
+        explorer_widget.set_root_path(str(root))
+        explorer_widget.path_edit.setText(os.path.join("locale", "*.po"))
+        explorer_widget._on_path_changed()
+        assert explorer_widget.current_path == str(root / "locale")
+        assert explorer_widget.path_filter == "*.po"
+
+    def test_home_directory_cached(self, explorer_widget, tmp_path, monkeypatch):
+        """Test that ~ expands to the cached home until the cache is cleared."""
+        home = _home_directory()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert _expand_home("~") == home
+
+        _home_directory.cache_clear()
+        try:
+            assert _expand_home("~") == str(tmp_path)
+            assert _expand_home(os.path.join("~", "sub")) == os.path.join(str(tmp_path), "sub")
+            explorer_widget.path_edit.setText("~")
+            explorer_widget._on_path_changed()
+            assert explorer_widget.current_path == str(tmp_path)
+        finally:
+            monkeypatch.undo()
+            _home_directory.cache_clear()
+
+    def test_view_menu_shared_and_synced(self, explorer_widget):
+        """Test that one View menu serves both menus and reflects settings."""
+        view_menu = explorer_widget._view_menu
+        nav_menu = explorer_widget.nav_button.menu()
+        assert view_menu.menuAction() in nav_menu.actions()
+
+        explorer_widget.show_hidden_files = True
+        explorer_widget.view_mode = "icons"
+        explorer_widget.active_columns = ["name", "kind"]
+        view_menu.aboutToShow.emit()
+
+        assert explorer_widget.hidden_action.isChecked()
+        assert explorer_widget.view_mode_actions["icons"].isChecked()
+        assert not explorer_widget.view_mode_actions["list"].isChecked()
+        assert explorer_widget.column_actions["kind"].isChecked()
+        assert not explorer_widget.column_actions["size"].isChecked()
+
+    def test_view_menu_actions_dispatch(self, explorer_widget, monkeypatch):
+        """Test that View menu actions dispatch through their action data."""
+        modes = []
+        columns = []
+        monkeypatch.setattr(explorer_widget, "_set_view_mode", modes.append)
+        monkeypatch.setattr(explorer_widget, "_toggle_column",
+                            lambda column_id, index: columns.append((column_id, index)))
+
+        explorer_widget.view_mode_actions["gallery"].trigger()
+        explorer_widget.column_actions["kind"].trigger()
+
+        assert modes == ["gallery"]
+        assert columns == [("kind", 2)]
+
+    def test_dir_filter_follows_hidden_setting(self, explorer_widget):
+        """Test that the model filter gains and loses Hidden with the setting."""
+        explorer_widget._toggle_hidden_files(True)
+        assert explorer_widget.file_model.filter() & QDir.Filter.Hidden
+
+        explorer_widget._toggle_hidden_files(False)
+        assert explorer_widget.file_model.filter() == (QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot)
+
+    def test_toggle_hidden_files_does_not_refresh(self, explorer_widget, tmp_path):
+        """Test that toggling hidden files re-filters without a refresh."""
+        explorer_widget.set_root_path(str(tmp_path))
+        explorer_widget._refresh_timer.stop()
+        explorer_widget._toggle_hidden_files(True)
+        assert not explorer_widget._refresh_timer.isActive()
+
+        explorer_widget._settings_save_timer.stop()
+        explorer_widget._toggle_hidden_files(True)
+        assert not explorer_widget._settings_save_timer.isActive()
+
+    def test_soft_refresh_keeps_root_index(self, explorer_widget, monkeypatch):
+        """Test that a refresh of an unchanged root does not re-root the view."""
+        calls = []
+        monkeypatch.setattr(explorer_widget.tree_view, "setRootIndex", calls.append)
+
+        explorer_widget._do_refresh()
+        assert calls == []
+
+    def test_history_save_is_deferred(self, explorer_widget, tmp_path):
+        """Test that navigation schedules one JSON history write."""
+        explorer_widget.navigate_to(str(tmp_path))
+        assert explorer_widget._settings_save_timer.isActive()
+
+        explorer_widget._flush_settings()
+        assert not explorer_widget._settings_save_timer.isActive()
+        saved = explorer_widget.settings.value("explorer/history")
+        assert str(tmp_path) in json.loads(saved)
+
+    def test_setting_changes_saved_together(self, explorer_widget, monkeypatch):
+        """Test that view changes are batched and skip an unchanged history."""
+        explorer_widget._flush_settings()
+        written = []
+        set_value = explorer_widget.settings.setValue
+        monkeypatch.setattr(explorer_widget.settings, "setValue",
+                            lambda key, value: written.append(key) or set_value(key, value))
+        explorer_widget._set_view_mode(explorer_widget.view_mode)
+        explorer_widget._on_sort_changed(0, Qt.SortOrder.AscendingOrder)
+        assert written == []
+        assert explorer_widget._settings_save_timer.isActive()
+
+        explorer_widget._flush_settings()
+        assert "history" not in written
+        assert written.count("view_mode") == 1
+        assert explorer_widget.settings.value("explorer/sort_column", type=int) == 0
+
+    def test_close_flushes_pending_settings(self, app, tmp_path):
+        """Test that closing the explorer writes a pending settings save."""
+        widget = FileExplorerWidget()
+        widget.show()
+        widget.navigate_to(str(tmp_path))
+        assert widget._settings_save_timer.isActive()
+
+        widget.close()
+        assert not widget._settings_save_timer.isActive()
+        assert widget.settings.value("explorer/current_path") == str(tmp_path)
+
+    def test_load_history_accepts_legacy_list(self, explorer_widget, tmp_path):
+        """Test that history stored as a plain list still loads."""
+        explorer_widget.settings.setValue("explorer/history", [str(tmp_path)])
+        explorer_widget._load_history()
+        assert str(tmp_path) in explorer_widget.navigation_history.history
+
+    def test_missing_directories(self, tmp_path):
+        """Test batched existence checks of history paths."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "file.txt").write_text("x")
+        paths = [str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path / "gone"),
+                 str(tmp_path / "file.txt"), str(tmp_path / "nope" / "c"), "/"]
+        missing = FileExplorerWidget._missing_directories(paths)
+        assert missing == {str(tmp_path / "gone"), str(tmp_path / "file.txt"),
+                           str(tmp_path / "nope" / "c")}
+
+    def test_load_history_drops_missing_paths(self, explorer_widget, tmp_path):
+        """Test that missing history entries are removed in the background."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        history = [str(tmp_path / "a"), str(tmp_path / "gone"), str(tmp_path / "b")]
+        explorer_widget.settings.setValue("explorer/history", json.dumps(history))
+        explorer_widget.settings.setValue("explorer/history_index", 2)
+        explorer_widget._load_history()
+        assert explorer_widget.navigation_history.get_history() == history
+
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        assert explorer_widget.navigation_history.get_history() == [history[0], history[2]]
+        assert explorer_widget.navigation_history.get_current() == history[2]
+
+    def test_root_loaded_on_first_show(self, app, tmp_path):
+        """Test that the model root is only set once the widget is shown."""
+        widget = FileExplorerWidget()
+        assert widget.file_model.rootPath() == "."
+
+        widget.set_root_path(str(tmp_path))
+        assert widget.file_model.rootPath() == "."
+
+        widget.show()
+        assert widget.file_model.rootPath() == str(tmp_path)
+        assert widget.tree_view.rootIndex() == widget.file_model.index(str(tmp_path))
+        widget.close()
+
+    def test_hard_refresh_clears_model_cache(self, explorer_widget, monkeypatch):
+        """Test that a hard refresh resets the model root before reloading."""
+        calls = []
+        monkeypatch.setattr(explorer_widget.file_model, "setRootPath",
+                            lambda path: calls.append(path) or QModelIndex())
+
+        explorer_widget._hard_refresh()
+        assert calls == ["", explorer_widget.current_path]
+
 
 @pytest.fixture
 def explorer_panel(app):
@@ -204,6 +718,25 @@ class TestFileExplorerPanel:
             assert explorer_panel.explorer_widget.current_path == "/"
 
 
+class TestEnhancedFileExplorerPlugin:
+    """Tests for the EnhancedFileExplorerPlugin."""
+
+    def test_load_provides_panel(self, app):
+        """Test that the slotted plugin constructs, loads and unloads."""
+        plugin = EnhancedFileExplorerPlugin("enhanced_file_explorer")
+        assert not hasattr(plugin, "__dict__")
+        assert plugin.default_path == _home_directory()
+        assert plugin.get_panels() == []
+
+        assert plugin.load()
+        panels = plugin.get_panels()
+        assert len(panels) == 1 and isinstance(panels[0], FileExplorerPanel)
+        assert panels[0].explorer_widget.current_path == plugin.default_path
+
+        assert plugin.unload()
+        assert plugin.get_panels() == []
+
+
 def run_standalone_test():
     """Run a standalone test for manual testing."""
     existing_app = QApplication.instance()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test cases for the scandir-backed file explorer model.
+"""
+import sys
+import os
+import pytest
+from pathlib import Path
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QDir, QModelIndex, QPersistentModelIndex, Qt
+
+# Add project root to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from plugins.core.file_explorer.scandir_model import ChildTable, ScandirTreeModel
+from plugins.core.file_explorer.enhanced_plugin import FileExplorerWidget
+from plugins.core.file_explorer.plugin import NameOnlyFSModel
+
+
+@pytest.fixture
+def app():
+    """Provide a Qt application."""
+    application = QApplication.instance() or QApplication([])
+    yield application
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Provide a small directory tree."""
+    (tmp_path / "b.txt").write_text("hello")
+    (tmp_path / "a.po").write_text("po")
+    (tmp_path / ".hidden").write_text("h")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "inner.txt").write_text("x")
+    return tmp_path
+
+
+@pytest.fixture
+def model(app, tree):
+    """Provide a model rooted at the directory tree."""
+    model = ScandirTreeModel()
+    model.setRootPath(str(tree))
+    return model
+
+
+def names(model, parent=QModelIndex()):
+    """Return the listed names under a parent, fetching it if needed."""
+    if model.canFetchMore(parent):
+        model.fetchMore(parent)
+    return [model.index(row, 0, parent).data() for row in range(model.rowCount(parent))]
+
+
+class TestScandirTreeModel:
+    """Tests for ScandirTreeModel."""
+
+    def test_lists_lazily(self, model):
+        """Test that nothing is listed until the root is fetched."""
+        assert model.rowCount() == 0
+        assert model.canFetchMore(QModelIndex())
+        assert names(model) == ["sub", "a.po", "b.txt"]
+
+    def test_children_fetched_on_demand(self, model, tree):
+        """Test that sub-directories are listed only when fetched."""
+        names(model)
+        sub = model.index(str(tree / "sub"))
+        assert model.hasChildren(sub)
+        assert model.rowCount(sub) == 0
+        assert names(model, sub) == ["inner.txt"]
+        assert model.parent(model.index(0, 0, sub)) == sub
+
+    def test_file_path_and_is_dir(self, model, tree):
+        """Test the QFileSystemModel-style path accessors."""
+        names(model)
+        sub = model.index(str(tree / "sub"))
+        assert model.filePath(sub) == str(tree / "sub")
+        assert model.isDir(sub)
+        assert not model.isDir(model.index(str(tree / "a.po")))
+        assert model.index(str(tree)) == QModelIndex()
+
+    def test_hidden_filter(self, model):
+        """Test that dot files are only listed with QDir.Filter.Hidden."""
+        model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | QDir.Filter.Hidden)
+        assert ".hidden" in names(model)
+
+    def test_name_filters(self, model):
+        """Test that name filters apply to files but keep folders."""
+        model.setNameFilters(["*.po"])
+        assert names(model) == ["sub", "a.po"]
+
+    def test_name_filters_combine_and_ignore_case(self, model):
+        """Test that several patterns match case-insensitively."""
+        model.setNameFilters(["*.PO", "b.*"])
+        assert names(model) == ["sub", "a.po", "b.txt"]
+    
+    def test_size_column_and_sort(self, model):
+        """Test lazy size data and sorting by size."""
+        names(model)
+        model.sort(1, Qt.SortOrder.DescendingOrder)
+        assert names(model) == ["sub", "b.txt", "a.po"]
+        assert model.index(1, 1).data() == "5 bytes"
+
+    def test_entries_stored_column_wise(self, model, tree):
+        """Test that files are table rows and only used folders get nodes."""
+        names(model)
+        table = model._root.table
+        assert isinstance(table, ChildTable)
+        assert list(table.is_dir) == [1, 0, 0]
+        assert table.dirs == {}
+        names(model, model.index(str(tree / "sub")))
+        assert list(table.dirs) == [0]
+    
+    def test_sort_keeps_persistent_indexes(self, model, tree):
+        """Test that persistent indexes follow their entries through a sort."""
+        names(model)
+        sub = model.index(str(tree / "sub"))
+        names(model, sub)
+        inner = QPersistentModelIndex(model.index(0, 0, sub))
+        a_po = QPersistentModelIndex(model.index(str(tree / "a.po")))
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+        assert names(model) == ["sub", "b.txt", "a.po"]
+        assert a_po.row() == 2
+        assert model.filePath(QModelIndex(a_po)) == str(tree / "a.po")
+        assert model.filePath(QModelIndex(inner)) == str(tree / "sub" / "inner.txt")
+    
+    def test_explorer_uses_model_when_enabled(self, app, tree):
+        """Test that the explorer switches models through its setting."""
+        widget = FileExplorerWidget()
+        widget.settings.setValue("explorer/scandir_model", True)
+        try:
+            widget = FileExplorerWidget()
+            assert isinstance(widget.file_model, ScandirTreeModel)
+            widget.show()
+            widget.set_root_path(str(tree))
+            QApplication.processEvents()
+            assert widget.file_model.rootPath() == str(tree)
+            assert widget.file_model.rowCount() == 3
+            widget.close()
+        finally:
+            widget.settings.remove("explorer/scandir_model")
+    
+    def test_name_only_model_skips_stat(self, app, tree):
+        """Test that the docked panel's model lists names without stat()."""
+        model = NameOnlyFSModel()
+        model.setRootPath(str(tree))
+        assert model.columnCount() == 1
+        assert names(model) == ["sub", "a.po", "b.txt"]
+        assert not model.index(0, 1, QModelIndex()).isValid()
+        assert set(model._root.table.sizes) == {-1}
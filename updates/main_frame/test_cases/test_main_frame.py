@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test cases for panel registration in the main frame.
+"""
+import sys
+import pytest
+from pathlib import Path
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+# Add project root to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from core.abstract_panel import AbstractPanel
+from core.main_frame import MainFrame
+
+
+@pytest.fixture
+def app():
+    """Provide a Qt application."""
+    existing_app = QApplication.instance()
+    if not existing_app:
+        app = QApplication([])
+        yield app
+    else:
+        yield existing_app
+
+
+@pytest.fixture
+def main_frame(app):
+    """Provide a MainFrame without plugins."""
+    frame = MainFrame()
+    frame.show()
+    yield frame
+    frame.close()
+
+
+class TestPanelRegistration:
+    """Tests for lazily docked panels."""
+
+    def test_panel_not_docked_until_shown(self, main_frame):
+        """Test that a regular panel is only docked when first shown."""
+        panel = AbstractPanel("Sample")
+        main_frame.register_panel("sample", panel)
+
+        assert main_frame.get_panel("sample") is panel
+        assert panel.parent() is not main_frame
+        assert not panel.isVisible()
+
+        main_frame.show_panel("sample")
+        assert panel.parent() is main_frame
+        assert main_frame.dockWidgetArea(panel) == Qt.DockWidgetArea.RightDockWidgetArea
+        assert panel.isVisible()
+
+    def test_view_menu_action_docks_panel(self, main_frame):
+        """Test that the View menu toggle docks and shows the panel."""
+        panel = AbstractPanel("Menu Panel")
+        main_frame.register_panel("menu_panel", panel)
+        action = main_frame.view_menu.actions()[-1]
+        assert action.text() == "Show Menu Panel"
+
+        action.trigger()
+        assert panel.parent() is main_frame
+        assert panel.isVisible()
+
+        action.trigger()
+        assert not panel.isVisible()
+
+    def test_toggle_view_skips_redundant_changes(self, main_frame):
+        """Test that toggle_view only changes visibility when it differs."""
+        panel = AbstractPanel("Toggle")
+        main_frame.register_panel("toggle", panel)
+        main_frame.show_panel("toggle")
+        changes = []
+        panel.visibilityChanged.connect(changes.append)
+
+        panel.toggle_view(True)
+        assert changes == []
+
+        panel.toggle_view(False)
+        panel.toggle_view(False)
+        assert changes == [False]
+        assert not panel.isVisible()
+
+    def test_sidebar_panel_docked_immediately(self, main_frame):
+        """Test that the sidebar panel is docked on registration."""
+        panel = AbstractPanel("Sidebar")
+        main_frame.register_panel("sidebar_SidebarPanel", panel)
+
+        assert main_frame.sidebar_panel is panel
+        assert panel.parent() is main_frame
+
+    def test_unregister_undocked_panel(self, main_frame):
+        """Test that a never-shown panel can be unregistered."""
+        panel = AbstractPanel("Unused")
+        main_frame.register_panel("unused", panel)
+        main_frame.unregister_panel("unused")
+
+        assert main_frame.get_panel("unused") is None
+        main_frame.show_panel("unused")
+        assert panel.parent() is not main_frame
+
+
+class TestBatchRegistration:
+    """Tests for batching dock additions."""
+
+    def test_docks_added_at_end_of_batch(self, main_frame):
+        """Test that docks registered in a batch are added by end_batch."""
+        main_frame.begin_batch()
+        panel = AbstractPanel("Sidebar")
+        main_frame.register_panel("sidebar_SidebarPanel", panel)
+
+        assert not main_frame.updatesEnabled()
+        assert panel.parent() is not main_frame
+
+        main_frame.end_batch()
+        assert main_frame.updatesEnabled()
+        assert panel.parent() is main_frame
+        assert main_frame.dockWidgetArea(panel) == Qt.DockWidgetArea.LeftDockWidgetArea
+
+    def test_nested_batches(self, main_frame):
+        """Test that only the outermost end_batch flushes the queue."""
+        main_frame.begin_batch()
+        main_frame.begin_batch()
+        panel = AbstractPanel("Sidebar")
+        main_frame.register_panel("sidebar_SidebarPanel", panel)
+
+        main_frame.end_batch()
+        assert panel.parent() is not main_frame
+        main_frame.end_batch()
+        assert panel.parent() is main_frame
+
+    def test_docks_in_same_area_are_tabified(self, app, main_frame):
+        """Test that queued docks sharing an area end up tabbed together."""
+        first = AbstractPanel("First")
+        second = AbstractPanel("Second")
+        main_frame.begin_batch()
+        main_frame._add_dock(Qt.DockWidgetArea.LeftDockWidgetArea, first)
+        main_frame._add_dock(Qt.DockWidgetArea.LeftDockWidgetArea, second)
+        main_frame.end_batch()
+        app.processEvents()
+
+        assert main_frame.tabifiedDockWidgets(first) == [second]
+
+    def test_unregister_during_batch(self, main_frame):
+        """Test that a panel unregistered before end_batch is never docked."""
+        main_frame.begin_batch()
+        panel = AbstractPanel("Sidebar")
+        main_frame.register_panel("sidebar_SidebarPanel", panel)
+        main_frame.unregister_panel("sidebar_SidebarPanel")
+        main_frame.end_batch()
+
+        assert panel.parent() is not main_frame
+
+
+class TestShowPreferences:
+    """Tests for dispatching the preferences action."""
+
+    class SettingsStub(AbstractPanel):
+        """Panel that records preference requests."""
+
+        def __init__(self):
+            super().__init__("Settings")
+            self.opened = 0
+
+        def _show_preferences(self):
+            self.opened += 1
+
+    def test_dispatches_to_cached_settings_panel(self, main_frame):
+        """Test that show_preferences uses the panel cached on plugin load."""
+        panel = self.SettingsStub()
+        main_frame.register_panel("settings", panel)
+        main_frame._on_plugin_loaded("settings")
+
+        main_frame.show_preferences()
+        assert panel.opened == 1
+
+    def test_settings_panel_not_found(self, main_frame):
+        """Test the status message when no settings panel is loaded."""
+        main_frame.show_preferences()
+        assert main_frame.status_bar.currentMessage() == "Settings panel not found"
+
+    def test_show_ready_restores_idle_message(self, main_frame):
+        """Test that show_ready replaces a pending message with "Ready"."""
+        assert main_frame.status_bar.currentMessage() == "Ready"
+        main_frame.show_message("Loading database…", 0)
+        main_frame.show_ready()
+        assert main_frame.status_bar.currentMessage() == "Ready"
+
+    def test_unregister_clears_cache(self, main_frame):
+        """Test that unregistering the settings panel drops the cached target."""
+        panel = self.SettingsStub()
+        main_frame.register_panel("settings", panel)
+        main_frame._on_plugin_loaded("settings")
+        main_frame.unregister_panel("settings")
+
+        main_frame.show_preferences()
+        assert panel.opened == 0
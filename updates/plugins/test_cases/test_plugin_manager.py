@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Test cases for the plugin manager.
+"""
+import os
+import sys
+import textwrap
+import types
+import pytest
+from pathlib import Path
+
+# Add project root to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parents[3]))
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from core.plugin_manager import Plugin, PluginManager
+
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    import os
+    from core.plugin_manager import Plugin
+
+    os.environ["{marker}"] = "executed"
+
+
+    class {class_name}(Plugin):
+        def __init__(self, name):
+            super().__init__(name, "0.1.0")
+''')
+
+
+def write_plugin(plugin_root: Path, name: str, class_name: str = "SamplePlugin") -> Path:
+    """Create a plugin directory containing a plugin.py file."""
+    plugin_dir = plugin_root / name
+    plugin_dir.mkdir(parents=True)
+    marker = f"PLUGIN_TEST_{name.upper()}"
+    os.environ.pop(marker, None)
+    (plugin_dir / "plugin.py").write_text(
+        PLUGIN_SOURCE.format(marker=marker, class_name=class_name)
+    )
+    return plugin_dir
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Provide a Qt application so queued signals can be delivered."""
+    application = QApplication.instance() or QApplication([])
+    yield application
+
+
+def finish_async_loads(manager):
+    """Wait for background imports and deliver their queued results."""
+    assert manager.wait_for_plugins(5000)
+    QCoreApplication.processEvents()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Provide a PluginManager that only looks at a temporary directory."""
+    plugin_manager = PluginManager()
+    plugin_manager.plugin_directories = [str(tmp_path)]
+    plugin_manager.discovery_cache_path = None
+    yield plugin_manager
+    for name in list(plugin_manager.plugins):
+        plugin_manager.unload_plugin(name)
+
+
+class TestPluginBase:
+    """Tests for the Plugin base class."""
+
+    def test_plugin_uses_slots(self):
+        """Test that Plugin stores its attributes in slots, not a __dict__."""
+        plugin = Plugin("slotted")
+        assert not hasattr(plugin, "__dict__")
+        plugin.initialize("window", "database")
+        assert plugin.load() and plugin.enabled
+        assert (plugin.main_window, plugin.database_manager) == ("window", "database")
+
+    def test_core_plugins_use_slots(self, app):
+        """Test that the bundled core plugins do not reintroduce a __dict__."""
+        from plugins.core.file_explorer.plugin import FileExplorerPlugin
+        from plugins.core.settings.plugin import SettingsPlugin
+        from plugins.core.sidebar.plugin import SidebarPlugin
+
+        for plugin_class in (FileExplorerPlugin, SettingsPlugin, SidebarPlugin):
+            assert not hasattr(plugin_class("slotted"), "__dict__")
+
+    def test_plugin_method_connects_to_signal(self, app):
+        """Test that a slotted plugin's bound method can be a Qt slot."""
+        from PySide6.QtGui import QAction
+
+        class ActionPlugin(Plugin):
+            __slots__ = ("calls",)
+
+            def __init__(self, name):
+                super().__init__(name)
+                self.calls = 0
+
+            def on_triggered(self):
+                self.calls += 1
+
+        plugin = ActionPlugin("action")
+        action = QAction("Run")
+        action.triggered.connect(plugin.on_triggered)
+        action.trigger()
+        assert plugin.calls == 1
+
+
+class TestPluginDiscovery:
+    """Tests for discovering plugin directories."""
+
+    def test_discover_plugins(self, manager, tmp_path):
+        """Test that only directories with plugin.py or __init__.py are found."""
+        write_plugin(tmp_path, "alpha")
+        (tmp_path / "package_style").mkdir()
+        (tmp_path / "package_style" / "__init__.py").write_text("")
+        (tmp_path / "not_a_plugin").mkdir()
+        (tmp_path / "stray.py").write_text("")
+
+        names = sorted(os.path.basename(p) for p, _ in manager.discover_plugins())
+        assert names == ["alpha", "package_style"]
+
+    def test_discover_skips_private_and_hidden(self, manager, tmp_path):
+        """Test that directories starting with _ or . are not plugins."""
+        write_plugin(tmp_path, "visible")
+        write_plugin(tmp_path, "_private")
+        write_plugin(tmp_path, ".hidden")
+        (tmp_path / "__pycache__").mkdir()
+
+        names = [os.path.basename(p) for p, _ in manager.discover_plugins()]
+        assert names == ["visible"]
+
+    def test_discover_plugins_tags_kind(self, manager, tmp_path):
+        """Test that each plugin is tagged with its directory's kind."""
+        core_dir = tmp_path / "core"
+        user_dir = tmp_path / "user"
+        write_plugin(core_dir, "builtin")
+        write_plugin(user_dir, "extra")
+        manager.plugin_directories = [str(core_dir), str(user_dir)]
+        manager.plugin_directory_kinds = {str(core_dir): "core"}
+
+        found = {os.path.basename(p): kind for p, kind in manager.discover_plugins()}
+        assert found == {"builtin": "core", "extra": "user"}
+
+    def test_discover_plugins_is_cached(self, manager, tmp_path):
+        """Test that discovery results are cached until a refresh is requested."""
+        write_plugin(tmp_path, "first")
+        assert len(manager.discover_plugins()) == 1
+
+        write_plugin(tmp_path, "second")
+        assert len(manager.discover_plugins()) == 1
+        assert len(manager.discover_plugins(refresh=True)) == 2
+
+    def test_discovery_cache_reused_across_runs(self, tmp_path):
+        """Test that a new manager reuses the saved discovery results."""
+        plugin_root = tmp_path / "plugins"
+        write_plugin(plugin_root, "cached")
+        (plugin_root / "late").mkdir()
+        cache_path = tmp_path / "config" / "plugin_cache.json"
+
+        def new_manager():
+            plugin_manager = PluginManager()
+            plugin_manager.plugin_directories = [str(plugin_root)]
+            plugin_manager.discovery_cache_path = str(cache_path)
+            return plugin_manager
+
+        first = new_manager().discover_plugins()
+        assert cache_path.exists()
+
+        # Adding plugin.py inside an existing subdirectory leaves the plugin
+        # directory's mtime alone, so the cached result is returned as is
+        (plugin_root / "late" / "plugin.py").write_text("")
+        assert new_manager().discover_plugins() == first
+        assert len(new_manager().discover_plugins(refresh=True)) == 2
+
+    def test_discovery_cache_invalidated(self, tmp_path):
+        """Test that directory and plugin file changes force a rescan."""
+        plugin_root = tmp_path / "plugins"
+        plugin_dir = write_plugin(plugin_root, "first")
+        cache_path = tmp_path / "plugin_cache.json"
+
+        def discover():
+            plugin_manager = PluginManager()
+            plugin_manager.plugin_directories = [str(plugin_root)]
+            plugin_manager.discovery_cache_path = str(cache_path)
+            return sorted(os.path.basename(p) for p, _ in plugin_manager.discover_plugins())
+
+        assert discover() == ["first"]
+
+        write_plugin(plugin_root, "second")
+        os.utime(plugin_root, ns=(0, 12345))
+        assert discover() == ["first", "second"]
+
+        os.remove(plugin_dir / "plugin.py")
+        assert discover() == ["second"]
+
+    def test_discover_missing_directory(self, manager, tmp_path):
+        """Test that a missing plugin directory is skipped."""
+        manager.plugin_directories = [str(tmp_path / "missing")]
+        assert manager.discover_plugins() == []
+
+
+class TestPluginLoading:
+    """Tests for loading plugins from disk."""
+
+    def test_import_is_lazy(self, manager, tmp_path):
+        """Test that the plugin module body only runs on first attribute access."""
+        plugin_dir = write_plugin(tmp_path, "lazy_sample")
+        module = manager._import_plugin_module("lazy_sample", str(plugin_dir))
+        assert "PLUGIN_TEST_LAZY_SAMPLE" not in os.environ
+
+        assert issubclass(module.SamplePlugin, Plugin)
+        assert os.environ["PLUGIN_TEST_LAZY_SAMPLE"] == "executed"
+        sys.modules.pop("lazy_sample_plugin", None)
+
+    def test_load_plugin(self, manager, tmp_path):
+        """Test loading a plugin directory."""
+        plugin_dir = write_plugin(tmp_path, "loadable")
+        assert manager.load_plugin(str(plugin_dir))
+        assert manager.is_plugin_loaded("loadable")
+        assert manager.get_plugin("loadable").version == "0.1.0"
+        sys.modules.pop("loadable_plugin", None)
+
+    def test_load_plugin_leaves_sys_path(self, manager, tmp_path):
+        """Test that loading a plugin does not add its directory to sys.path."""
+        plugin_dir = write_plugin(tmp_path, "pathless")
+        before = list(sys.path)
+        assert manager.load_plugin(str(plugin_dir))
+        assert sys.path == before
+        sys.modules.pop("pathless_plugin", None)
+
+    def test_relative_import_in_plugin(self, manager, tmp_path):
+        """Test that plugin.py can import sibling modules relatively."""
+        plugin_dir = tmp_path / "relative"
+        plugin_dir.mkdir()
+        (plugin_dir / "helpers.py").write_text("VERSION = '2.0.0'\n")
+        (plugin_dir / "plugin.py").write_text(textwrap.dedent('''
+            from core.plugin_manager import Plugin
+            from .helpers import VERSION
+
+
+            class RelativePlugin(Plugin):
+                def __init__(self, name):
+                    super().__init__(name, VERSION)
+        '''))
+        assert manager.load_plugin(str(plugin_dir))
+        assert manager.get_plugin("relative").version == "2.0.0"
+        sys.modules.pop("relative_plugin", None)
+        sys.modules.pop("relative_plugin.helpers", None)
+
+    def test_load_package_plugin(self, manager, tmp_path):
+        """Test loading a plugin defined in the directory's __init__.py."""
+        plugin_dir = tmp_path / "packaged"
+        plugin_dir.mkdir()
+        (plugin_dir / "__init__.py").write_text(PLUGIN_SOURCE.format(
+            marker="PLUGIN_TEST_PACKAGED", class_name="PackagedPlugin"))
+        assert manager.load_plugin(str(plugin_dir))
+        assert manager.is_plugin_loaded("packaged")
+        sys.modules.pop("packaged", None)
+
+    def test_load_plugin_without_class(self, manager, tmp_path):
+        """Test that a module without a Plugin subclass fails to load."""
+        plugin_dir = tmp_path / "empty"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.py").write_text("VALUE = 1\n")
+        assert not manager.load_plugin(str(plugin_dir))
+        assert "empty_plugin" not in sys.modules
+
+
+class TestPluginClassLookup:
+    """Tests for resolving the plugin class of a module."""
+
+    def test_conventional_name(self, manager):
+        """Test that {Name}Plugin is found without scanning the module."""
+        class FileExplorerPlugin(Plugin):
+            pass
+
+        module = types.ModuleType("file_explorer_plugin")
+        module.FileExplorerPlugin = FileExplorerPlugin
+        module.Plugin = Plugin
+        assert manager._find_plugin_class("file_explorer", module) is FileExplorerPlugin
+
+    def test_all_takes_precedence(self, manager):
+        """Test that a Plugin class listed in __all__ is preferred."""
+        class ExportedPlugin(Plugin):
+            pass
+
+        class SamplePlugin(Plugin):
+            pass
+
+        module = types.ModuleType("sample_plugin")
+        module.__all__ = ["helper", "ExportedPlugin"]
+        module.ExportedPlugin = ExportedPlugin
+        module.SamplePlugin = SamplePlugin
+        assert manager._find_plugin_class("sample", module) is ExportedPlugin
+
+    def test_fallback_scan(self, manager):
+        """Test that an unconventionally named class is still found."""
+        class Extension(Plugin):
+            pass
+
+        module = types.ModuleType("odd_plugin")
+        module.Extension = Extension
+        assert manager._find_plugin_class("odd", module) is Extension
+
+    def test_no_plugin_class(self, manager):
+        """Test that a module without a Plugin subclass yields None."""
+        module = types.ModuleType("empty_plugin")
+        module.Plugin = Plugin
+        assert manager._find_plugin_class("empty", module) is None
+
+
+class TestAsyncPluginLoading:
+    """Tests for loading user plugins on the thread pool."""
+
+    def test_load_plugin_async(self, app, manager, tmp_path):
+        """Test that a background import is finalized on the GUI thread."""
+        plugin_dir = write_plugin(tmp_path, "background")
+        loaded = []
+        manager.plugin_loaded.connect(loaded.append)
+
+        manager.load_plugin_async(str(plugin_dir))
+        finish_async_loads(manager)
+
+        assert loaded == ["background"]
+        assert manager.is_plugin_loaded("background")
+        sys.modules.pop("background_plugin", None)
+
+    def test_load_plugin_async_import_error(self, app, manager, tmp_path):
+        """Test that a failing background import reports plugin_error."""
+        plugin_dir = tmp_path / "broken"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.py").write_text("raise RuntimeError('boom')\n")
+        errors = []
+        manager.plugin_error.connect(lambda name, message: errors.append((name, message)))
+
+        manager.load_plugin_async(str(plugin_dir))
+        finish_async_loads(manager)
+
+        assert errors and errors[0][0] == "broken"
+        assert "boom" in errors[0][1]
+        assert not manager.is_plugin_loaded("broken")
+        assert "broken_plugin" not in sys.modules
@@ -48,6 +48,14 @@ class TestSidebarButton:
         assert button.is_active == False
         assert button.isChecked() == False
         
+    def test_icon_loaded_once(self, app):
+        """Test that buttons sharing an icon name share one loaded icon."""
+        first = SidebarButton("One", "explorer")
+        second = SidebarButton("Two", "explorer")
+        
+        assert SidebarButton._load_icon("explorer") is SidebarButton._icon_cache["explorer"]
+        assert first.icon().cacheKey() == second.icon().cacheKey()
+        
     def test_button_size(self, button):
         """Test button has correct size."""
         size = button.size()
@@ -0,0 +1,121 @@
+"""
+Test cases for the core SidebarWidget
+"""
+
+import sys
+import pytest
+from pathlib import Path
+from PySide6.QtWidgets import QApplication
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.abstract_panel import AbstractPanel
+from core.sidebar_widget import SidebarWidget
+
+
+@pytest.fixture
+def app():
+    """Create QApplication for testing."""
+    if not QApplication.instance():
+        return QApplication([])
+    return QApplication.instance()
+
+
+@pytest.fixture
+def sidebar(app):
+    """Create a SidebarWidget with three panels."""
+    widget = SidebarWidget()
+    for panel_id in ("explorer", "search", "settings"):
+        widget.add_button(panel_id, panel_id.title())
+        widget.add_panel(panel_id, AbstractPanel(panel_id.title()))
+    widget.show()
+    yield widget
+    widget.close()
+
+
+class TestSidebarWidget:
+    """Test cases for SidebarWidget panel switching."""
+
+    def checked_buttons(self, sidebar):
+        return [pid for pid, button in sidebar.buttons.items() if button.isChecked()]
+
+    def test_show_panel_activates_one_button(self, sidebar):
+        """Test that only the shown panel's button is active."""
+        sidebar.show_panel("explorer")
+        sidebar.show_panel("search")
+
+        assert self.checked_buttons(sidebar) == ["search"]
+        assert sidebar.get_current_panel_id() == "search"
+        assert sidebar.stacked_widget.currentWidget() is sidebar.get_panel("search")
+
+    def test_panel_container_shown_deferred(self, app, sidebar):
+        """Test that the panel container is shown on the next event-loop pass."""
+        sidebar.show_panel("explorer")
+        assert not sidebar.panel_container.isVisible()
+
+        app.processEvents()
+        assert sidebar.panel_container.isVisible()
+
+    def test_hide_before_deferred_show(self, app, sidebar):
+        """Test that hiding right after showing keeps the container hidden."""
+        sidebar.show_panel("explorer")
+        sidebar.hide_panel()
+        app.processEvents()
+
+        assert not sidebar.panel_container.isVisible()
+
+    def test_switch_only_touches_changed_buttons(self, sidebar):
+        """Test that switching panels leaves unrelated buttons alone."""
+        sidebar.show_panel("explorer")
+        toggled = []
+        sidebar.buttons["settings"].toggled.connect(toggled.append)
+
+        sidebar.show_panel("search")
+        assert toggled == []
+
+    def test_hide_panel(self, app, sidebar):
+        """Test that hiding deactivates the button and emits panel_hidden."""
+        hidden = []
+        sidebar.panel_hidden.connect(hidden.append)
+        sidebar.show_panel("explorer")
+        app.processEvents()
+        sidebar.hide_panel()
+
+        assert self.checked_buttons(sidebar) == []
+        assert hidden == ["explorer"]
+        assert not sidebar.panel_container.isVisible()
+
+    def test_toggle_panel(self, sidebar):
+        """Test that toggling the current panel hides it."""
+        sidebar.toggle_panel("settings")
+        assert sidebar.get_current_panel_id() == "settings"
+
+        sidebar.toggle_panel("settings")
+        assert sidebar.get_current_panel_id() == ""
+        assert self.checked_buttons(sidebar) == []
+
+    def test_remove_active_panel(self, sidebar):
+        """Test that removing the active panel clears the active button."""
+        sidebar.show_panel("search")
+        sidebar.remove_panel("search")
+
+        sidebar.show_panel("explorer")
+        assert self.checked_buttons(sidebar) == ["explorer"]
+
+    def test_button_click_toggles_panel(self, sidebar):
+        """Test that clicking a button shows and then hides its panel."""
+        sidebar.buttons["search"].click()
+        assert sidebar.get_current_panel_id() == "search"
+        assert self.checked_buttons(sidebar) == ["search"]
+
+        sidebar.buttons["search"].click()
+        assert sidebar.get_current_panel_id() == ""
+        assert self.checked_buttons(sidebar) == []
+
+    def test_buttons_share_container_stylesheet(self, sidebar):
+        """Test that buttons are styled by their container, not individually."""
+        assert all(button.styleSheet() == "" for button in sidebar.buttons.values())
+        assert "QPushButton:checked" in sidebar.button_container.styleSheet()
+        assert all(button.parent() is sidebar.button_container for button in sidebar.buttons.values())